@@ -1,8 +1,13 @@
 import asyncio
+import inspect
+import json
 import os
+import threading
 import time
+from typing import Any, Awaitable, Callable, List, Optional, Union
 
 import dotenv
+import httpx
 
 from upstash_vector import AsyncIndex, Index
 from upstash_vector.core.index_operations import DEFAULT_NAMESPACE
@@ -22,6 +27,99 @@ EMBEDDING_INDEX_TOKEN = os.environ["EMBEDDING_TOKEN"]
 HYBRID_EMBEDDING_INDEX_URL = os.environ["HYBRID_EMBEDDING_URL"]
 HYBRID_EMBEDDING_INDEX_TOKEN = os.environ["HYBRID_EMBEDDING_TOKEN"]
 
+MOCK_INDEX_URL = "https://vector.upstash.io"
+
+Handler = Callable[[httpx.Request], httpx.Response]
+AsyncHandler = Callable[[httpx.Request], Awaitable[httpx.Response]]
+
+
+class MockServer:
+    """
+    Serves the requests of the indexes it creates with the given handlers,
+    without sending them over the network, and records the requests in the
+    order they are received.
+
+    The handlers of the indexes used from many threads can use the `lock`
+    to guard the state they share.
+    """
+
+    def __init__(self) -> None:
+        self.requests: List[httpx.Request] = []
+        self.lock = threading.Lock()
+
+    @property
+    def payloads(self) -> List[Any]:
+        """
+        The JSON bodies of the requests.
+        """
+        with self.lock:
+            return [json.loads(r.content) for r in self.requests]
+
+    @property
+    def paths(self) -> List[str]:
+        with self.lock:
+            return [r.url.path for r in self.requests]
+
+    def clear(self) -> None:
+        with self.lock:
+            self.requests.clear()
+
+    def _record(self, request: httpx.Request) -> None:
+        with self.lock:
+            self.requests.append(request)
+
+    def transport(self, handler: Handler) -> httpx.MockTransport:
+        def serve(request: httpx.Request) -> httpx.Response:
+            self._record(request)
+            return handler(request)
+
+        return httpx.MockTransport(serve)
+
+    def async_transport(
+        self, handler: Union[Handler, AsyncHandler]
+    ) -> httpx.MockTransport:
+        async def serve(request: httpx.Request) -> httpx.Response:
+            self._record(request)
+            response = handler(request)
+            if inspect.isawaitable(response):
+                return await response
+
+            return response
+
+        return httpx.MockTransport(serve)
+
+    def index(
+        self,
+        handler: Handler,
+        timeout: Optional[httpx.Timeout] = None,
+        **kwargs: Any,
+    ) -> Index:
+        """
+        Creates an index served by the handler. The rest of the arguments
+        are passed to the index.
+        """
+        client = httpx.Client(
+            transport=self.transport(handler), timeout=timeout or httpx.Timeout(5.0)
+        )
+        return Index(MOCK_INDEX_URL, "token", http_client=client, **kwargs)
+
+    def async_index(
+        self,
+        handler: Union[Handler, AsyncHandler],
+        timeout: Optional[httpx.Timeout] = None,
+        **kwargs: Any,
+    ) -> AsyncIndex:
+        """
+        Creates an async index served by the handler, which can be
+        either a function or a coroutine function. The rest of the
+        arguments are passed to the index.
+        """
+        client = httpx.AsyncClient(
+            transport=self.async_transport(handler),
+            timeout=timeout or httpx.Timeout(5.0),
+        )
+        return AsyncIndex(MOCK_INDEX_URL, "token", http_client=client, **kwargs)
+
 
 def assert_eventually(assertion, retry_delay=0.5, timeout=5.0):
     deadline = time.time() + timeout
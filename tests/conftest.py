@@ -11,6 +11,7 @@ from tests import (
     INDEX_TOKEN,
     INDEX_URL,
     NAMESPACES,
+    MockServer,
     SPARSE_INDEX_TOKEN,
     SPARSE_INDEX_URL,
 )
@@ -95,3 +96,8 @@ async def async_hybrid_embedding_index():
     for ns in NAMESPACES:
         await idx.reset(namespace=ns)
     return idx
+
+
+@pytest.fixture
+def mock_server() -> MockServer:
+    return MockServer()
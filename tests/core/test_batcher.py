@@ -0,0 +1,163 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import httpx
+import pytest
+from pytest import raises
+
+from tests import MockServer
+from upstash_vector.batcher import AsyncQueryBatcher, QueryBatcher
+from upstash_vector.errors import ClientError, UpstashError
+from upstash_vector.http import RetryPolicy
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    payload = json.loads(request.content)
+    queries = payload if isinstance(payload, list) else [payload]
+    # like the server, reject the whole batch when one of its queries is invalid
+    if any(q["data"] == "fail" for q in queries):
+        return httpx.Response(200, json={"error": "failed"})
+
+    result: Any
+    if isinstance(payload, list):
+        result = [[{"id": q["data"], "score": 1.0}] for q in payload]
+    else:
+        result = [{"id": payload["data"], "score": 1.0}]
+
+    return httpx.Response(200, json={"result": result})
+
+
+def test_batcher(mock_server: MockServer):
+    index = mock_server.index(_handler)
+
+    with QueryBatcher(index, max_batch_size=100, max_delay=0.1) as batcher:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda i: batcher.query(data=str(i)), range(8)))
+
+    assert [r[0].id for r in results] == [str(i) for i in range(8)]
+    assert mock_server.paths == ["/query-data"]
+
+
+def test_batcher_batch_size(mock_server: MockServer):
+    index = mock_server.index(_handler)
+
+    with QueryBatcher(index, max_batch_size=3, max_delay=10) as batcher:
+        futures = [batcher.submit(data=str(i)) for i in range(7)]
+
+        # full batches are sent without waiting for the delay
+        assert [f.result()[0].id for f in futures[:6]] == [str(i) for i in range(6)]
+        assert not futures[6].done()
+
+    assert futures[6].result()[0].id == "6"
+    assert len(mock_server.requests) == 3
+
+
+def test_batcher_namespaces(mock_server: MockServer):
+    index = mock_server.index(_handler)
+
+    with QueryBatcher(index, max_delay=0.01) as batcher:
+        futures = [
+            batcher.submit(data="a"),
+            batcher.submit(data="b", namespace="ns"),
+            batcher.submit(data="c"),
+        ]
+
+        assert [f.result()[0].id for f in futures] == ["a", "b", "c"]
+
+    assert sorted(mock_server.paths) == ["/query-data", "/query-data/ns"]
+
+
+def test_batcher_error(mock_server: MockServer):
+    index = mock_server.index(_handler)
+
+    with QueryBatcher(index, max_delay=0) as batcher:
+        with raises(UpstashError):
+            batcher.query(data="fail")
+
+        with raises(ClientError):
+            batcher.query()
+
+    with raises(ClientError):
+        batcher.query(data="closed")
+
+
+def test_batcher_invalid_query(mock_server: MockServer):
+    index = mock_server.index(_handler)
+    data = [str(i) for i in range(8)]
+    data[5] = "fail"
+
+    with QueryBatcher(index, max_batch_size=8, max_delay=10) as batcher:
+        futures = [batcher.submit(data=d) for d in data]
+
+        for i, future in enumerate(futures):
+            if i == 5:
+                with raises(UpstashError):
+                    future.result()
+            else:
+                assert future.result()[0].id == data[i]
+
+    # the halves of the batch containing the invalid query are
+    # split again, down to the invalid query itself
+    sizes = [len(p) if isinstance(p, list) else 1 for p in mock_server.payloads]
+    assert sizes == [8, 4, 4, 2, 1, 1, 2]
+
+
+def _overloaded(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(429, json={"error": "Too many requests"})
+
+
+def test_batcher_overloaded(mock_server: MockServer):
+    index = mock_server.index(_overloaded, retry_policy=RetryPolicy(retries=0))
+
+    with QueryBatcher(index, max_batch_size=32, max_delay=10) as batcher:
+        futures = [batcher.submit(data=str(i)) for i in range(32)]
+
+        for future in futures:
+            with raises(UpstashError):
+                future.result()
+
+    # the batch is not bisected, as it is not rejected due to its queries
+    assert len(mock_server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_batcher_async(mock_server: MockServer):
+    index = mock_server.async_index(_handler)
+
+    async with AsyncQueryBatcher(index, max_batch_size=4, max_delay=0.05) as batcher:
+        results = await asyncio.gather(*[batcher.query(data=str(i)) for i in range(6)])
+
+        assert [r[0].id for r in results] == [str(i) for i in range(6)]
+        assert len(mock_server.requests) == 2
+
+        with raises(UpstashError):
+            await batcher.query(data="fail")
+
+
+@pytest.mark.asyncio
+async def test_batcher_invalid_query_async(mock_server: MockServer):
+    index = mock_server.async_index(_handler)
+    data = ["a", "fail", "b", "c"]
+
+    async with AsyncQueryBatcher(index, max_batch_size=4, max_delay=10) as batcher:
+        results = await asyncio.gather(
+            *[batcher.query(data=d) for d in data], return_exceptions=True
+        )
+
+    assert isinstance(results[1], UpstashError)
+    assert [r[0].id for r in results if isinstance(r, list)] == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_batcher_overloaded_async(mock_server: MockServer):
+    index = mock_server.async_index(_overloaded, retry_policy=RetryPolicy(retries=0))
+
+    async with AsyncQueryBatcher(index, max_batch_size=8, max_delay=10) as batcher:
+        results = await asyncio.gather(
+            *[batcher.query(data=str(i)) for i in range(8)], return_exceptions=True
+        )
+
+    assert all(isinstance(r, UpstashError) for r in results)
+    assert len(mock_server.requests) == 1
@@ -0,0 +1,232 @@
+import json
+import time
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from pytest import raises
+
+from tests import MockServer
+from upstash_vector.buffer import AsyncMetadataPatchBuffer, MetadataPatchBuffer
+from upstash_vector.errors import ClientError
+from upstash_vector.types import UpdateManyResult
+from upstash_vector.utils import compose_merge_patches
+
+
+def _apply(target: Any, patch: Any) -> Any:
+    # RFC 7396
+    if not isinstance(patch, dict):
+        return patch
+
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = _apply(result.get(key), value)
+
+    return result
+
+
+PATCHES: List[Dict[str, Any]] = [
+    {"a": 1, "b": {"c": 1, "d": 2}},
+    {"b": {"c": None, "e": 3}},
+    {"a": None},
+    {"a": {"x": 1}},
+    {"f": [1, 2]},
+    {"a": {"y": None, "z": 2}},
+    {"b": 5},
+    {"b": {"g": 1}},
+]
+
+
+def test_compose_merge_patches():
+    target = {"a": {"y": 1, "w": 0}, "b": {"d": 0, "h": 1}, "f": 0}
+
+    expected = target
+    for patch in PATCHES:
+        expected = _apply(expected, patch)
+
+    # compose as many as possible, and apply the rest one after the other
+    composed: List[Dict[str, Any]] = [PATCHES[0]]
+    for patch in PATCHES[1:]:
+        merged = compose_merge_patches(composed[-1], patch)
+        if merged is None:
+            composed.append(patch)
+        else:
+            composed[-1] = merged
+
+    assert len(composed) == 3
+
+    actual = target
+    for patch in composed:
+        actual = _apply(actual, patch)
+
+    assert actual == expected
+
+    assert compose_merge_patches({"a": 1}, {"a": {"b": 1}}) is None
+    assert compose_merge_patches({"a": {"b": 1}}, {"a": {"b": None}}) == {
+        "a": {"b": None}
+    }
+
+
+def _handler(mock_server: MockServer, store: Dict[str, Any]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        with mock_server.lock:
+            if payload["id"] not in store:
+                return httpx.Response(200, json={"result": {"updated": 0}})
+
+            assert payload["metadataUpdateMode"] == "PATCH"
+            store[payload["id"]] = _apply(store[payload["id"]], payload["metadata"])
+
+        return httpx.Response(200, json={"result": {"updated": 1}})
+
+    return handler
+
+
+def test_buffer(mock_server: MockServer):
+    store: Dict[str, Any] = {"id-0": {}, "id-1": {"a": 0}}
+    index = mock_server.index(_handler(mock_server, store))
+    flushes: List[UpdateManyResult] = []
+
+    with MetadataPatchBuffer(index, max_delay=60, on_flush=flushes.append) as buffer:
+        for patch in PATCHES:
+            buffer.patch("id-0", patch)
+
+        for i in range(10):
+            buffer.patch("id-1", {"count": i})
+
+        buffer.patch("missing", {"a": 1})
+        assert buffer.pending == 3
+
+        res = buffer.flush()
+        assert buffer.pending == 0
+
+    # one request per id, and two more for the patches that cannot be merged
+    assert len(mock_server.requests) == 5
+    assert res.updated == 4
+    assert res.not_found == 1
+    assert not res.errors
+    assert flushes == [res]
+
+    expected: Any = {}
+    for patch in PATCHES:
+        expected = _apply(expected, patch)
+
+    assert store == {"id-0": expected, "id-1": {"a": 0, "count": 9}}
+
+    with raises(ClientError):
+        buffer.patch("id-0", {"a": 1})
+
+
+def test_buffer_flushes_on_size_and_delay(mock_server: MockServer):
+    store: Dict[str, Any] = {f"id-{i}": {} for i in range(10)}
+    index = mock_server.index(_handler(mock_server, store))
+
+    buffer = MetadataPatchBuffer(
+        index, max_pending=5, max_delay=60, flush_at_exit=False
+    )
+    for i in range(5):
+        buffer.patch(f"id-{i}", {"a": i})
+
+    deadline = time.monotonic() + 5
+    while len(mock_server.requests) < 5 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert len(mock_server.requests) == 5
+    buffer.close()
+
+    buffer = MetadataPatchBuffer(index, max_delay=0.05, flush_at_exit=False)
+    buffer.patch("id-9", {"b": 1})
+    buffer.patch("id-9", {"c": 1})
+
+    deadline = time.monotonic() + 5
+    while len(mock_server.requests) < 6 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert len(mock_server.requests) == 6
+    assert store["id-9"] == {"b": 1, "c": 1}
+    buffer.close()
+
+
+def _fail_update_many(*args: Any, **kwargs: Any) -> Any:
+    # like the executors, after the interpreter starts to exit
+    raise RuntimeError("cannot schedule new futures after interpreter shutdown")
+
+
+def test_buffer_close_at_exit(mock_server: MockServer, monkeypatch):
+    store: Dict[str, Any] = {"id-0": {}, "id-1": {}}
+    index = mock_server.index(_handler(mock_server, store))
+    monkeypatch.setattr(index, "update_many", _fail_update_many)
+
+    buffer = MetadataPatchBuffer(index, max_delay=60)
+    buffer.patch("id-0", {"a": 1})
+    buffer.patch("id-1", {"b": 1})
+
+    assert buffer._exit_hook is not None
+    buffer._exit_hook()
+
+    # the flusher is stopped, and the patches are sent one by one
+    assert not buffer._flusher.is_alive()
+    assert store == {"id-0": {"a": 1}, "id-1": {"b": 1}}
+    with raises(ClientError):
+        buffer.patch("id-0", {"a": 2})
+
+
+def test_buffer_executor_shutdown(mock_server: MockServer, monkeypatch):
+    store: Dict[str, Any] = {"id-0": {}, "id-1": {}}
+    index = mock_server.index(_handler(mock_server, store))
+    monkeypatch.setattr(index, "update_many", _fail_update_many)
+
+    # the background flushes made while the interpreter exits are
+    # sent again one by one, instead of failing
+    with MetadataPatchBuffer(index, max_delay=60, flush_at_exit=False) as buffer:
+        buffer.patch("id-0", {"a": 1})
+        buffer.patch("id-1", {"b": 1})
+        res = buffer.flush()
+
+    assert res.updated == 2
+    assert not res.errors
+    assert store == {"id-0": {"a": 1}, "id-1": {"b": 1}}
+
+
+def test_buffer_validation(mock_server: MockServer):
+    index = mock_server.index(_handler(mock_server, {}))
+    with raises(ClientError):
+        MetadataPatchBuffer(index, max_pending=0)
+
+    with raises(ClientError):
+        MetadataPatchBuffer(index, max_delay=-1)
+
+    with MetadataPatchBuffer(index, flush_at_exit=False) as buffer:
+        with raises(ClientError):
+            buffer.patch("id-0", [1, 2])  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_buffer_async(mock_server: MockServer):
+    store: Dict[str, Any] = {f"id-{i}": {} for i in range(4)}
+    index = mock_server.async_index(_handler(mock_server, store))
+
+    async with AsyncMetadataPatchBuffer(index, max_pending=3, max_delay=60) as buffer:
+        for patch in PATCHES:
+            buffer.patch("id-0", patch)
+
+        buffer.patch("id-1", {"a": 1})
+        buffer.patch("id-1", {"b": 1})
+        # flushes in the background
+        buffer.patch("id-2", {"a": 1})
+        buffer.patch("id-3", {"a": 1})
+
+    expected: Any = {}
+    for patch in PATCHES:
+        expected = _apply(expected, patch)
+
+    assert len(mock_server.requests) == 6
+    assert store == {
+        "id-0": expected,
+        "id-1": {"a": 1, "b": 1},
+        "id-2": {"a": 1},
+        "id-3": {"a": 1},
+    }
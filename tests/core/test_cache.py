@@ -0,0 +1,352 @@
+import json
+import time
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from pytest import raises
+
+from tests import MockServer
+from upstash_vector.cache import FetchCache, QueryCache, SemanticQueryCache
+from upstash_vector.errors import ClientError
+
+
+def _id_of(query: Dict[str, Any]) -> str:
+    if "data" in query:
+        return query["data"]
+
+    return ",".join(str(v) for v in query["vector"])
+
+
+def _query_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.startswith("/delete"):
+        return httpx.Response(200, json={"result": {"deleted": 1}})
+
+    if request.url.path.startswith("/update"):
+        return httpx.Response(200, json={"result": {"updated": 1}})
+
+    if not request.url.path.startswith("/query"):
+        return httpx.Response(200, json={"result": "Success"})
+
+    payload = json.loads(request.content)
+    result: Any
+    if isinstance(payload, list):
+        result = [[{"id": _id_of(q), "score": 1.0}] for q in payload]
+    else:
+        result = [{"id": _id_of(payload), "score": 1.0}]
+
+    return httpx.Response(200, json={"result": result})
+
+
+def test_query_cache(mock_server: MockServer):
+    cache = QueryCache()
+    index = mock_server.index(_query_handler, query_cache=cache)
+
+    first = index.query(data="hello", include_metadata=True)
+    second = index.query(data="hello", include_metadata=True)
+
+    assert first == second
+    assert first[0].id == "hello"
+    assert len(mock_server.requests) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # different options and namespaces are cached separately
+    index.query(data="hello", include_metadata=False)
+    index.query(data="hello", include_metadata=True, namespace="ns")
+    assert len(mock_server.requests) == 3
+
+
+def test_query_many_cache(mock_server: MockServer):
+    index = mock_server.index(_query_handler, query_cache=QueryCache())
+
+    index.query(data="a")
+
+    res = index.query_many(queries=[{"data": "a"}, {"data": "b"}, {"data": "c"}])
+
+    assert [r[0].id for r in res] == ["a", "b", "c"]
+    assert len(mock_server.requests) == 2
+    assert [q["data"] for q in mock_server.payloads[1]] == ["b", "c"]
+
+    res = index.query_many(queries=[{"data": "c"}, {"data": "d"}])
+
+    assert [r[0].id for r in res] == ["c", "d"]
+    # the only missing query is sent on its own
+    assert mock_server.payloads[2]["data"] == "d"
+
+    index.query_many(queries=[{"data": "a"}, {"data": "d"}])
+    assert len(mock_server.requests) == 3
+
+
+def test_query_cache_invalidation(mock_server: MockServer):
+    cache = QueryCache()
+    index = mock_server.index(_query_handler, query_cache=cache)
+
+    index.query(data="hello")
+    index.query(data="hello", namespace="ns")
+    assert len(cache) == 2
+
+    index.upsert(vectors=[("id", [0.1, 0.2])], namespace="ns")
+    assert len(cache) == 1
+
+    index.query(data="hello")
+    assert len(mock_server.requests) == 3
+
+    index.reset(all=True)
+    assert len(cache) == 0
+
+
+def test_query_cache_ttl(mock_server: MockServer):
+    index = mock_server.index(_query_handler, query_cache=QueryCache(ttl=0.05))
+
+    index.query(data="hello")
+    time.sleep(0.1)
+    index.query(data="hello")
+
+    assert len(mock_server.requests) == 2
+
+
+def test_query_cache_eviction(mock_server: MockServer):
+    cache = QueryCache(max_entries=2)
+    index = mock_server.index(_query_handler, query_cache=cache)
+
+    index.query(data="a")
+    index.query(data="b")
+    index.query(data="a")
+    index.query(data="c")
+
+    # "b" is the least recently used one
+    assert len(cache) == 2
+    index.query(data="a")
+    assert len(mock_server.requests) == 3
+    index.query(data="b")
+    assert len(mock_server.requests) == 4
+
+    cache = QueryCache(max_bytes=100)
+    index = mock_server.index(_query_handler, query_cache=cache)
+    index.query(data="a" * 60)
+    index.query(data="b" * 60)
+
+    assert len(cache) == 1
+    assert cache.size <= 100
+
+
+@pytest.mark.asyncio
+async def test_query_cache_async(mock_server: MockServer):
+    index = mock_server.async_index(_query_handler, query_cache=QueryCache())
+
+    await index.query(data="a")
+    res = await index.query_many(queries=[{"data": "a"}, {"data": "b"}])
+
+    assert [r[0].id for r in res] == ["a", "b"]
+    assert len(mock_server.requests) == 2
+
+    await index.delete(ids=["a"])
+    await index.query(data="a")
+    assert len(mock_server.requests) == 4
+
+
+def test_query_cache_invalid():
+    with raises(ClientError):
+        QueryCache(max_entries=0)
+
+    with raises(ClientError):
+        QueryCache(ttl=0)
+
+
+def test_semantic_cache(mock_server: MockServer):
+    cache = SemanticQueryCache(max_distance=0.01)
+    index = mock_server.index(_query_handler, semantic_cache=cache)
+
+    first = index.query(vector=[1.0, 0.0], top_k=3)
+    close = index.query(vector=[1.0, 0.01], top_k=3)
+    assert close == first
+    assert len(mock_server.requests) == 1
+
+    index.query(vector=[0.0, 1.0], top_k=3)
+    index.query(vector=[1.0, 0.0], top_k=3, filter="a = 1")
+    index.query(vector=[1.0, 0.0], top_k=3, namespace="ns")
+    assert len(mock_server.requests) == 4
+
+    # data queries are not cached
+    index.query(data="hello")
+    index.query(data="hello")
+    assert len(mock_server.requests) == 6
+
+
+def test_semantic_cache_query_many(mock_server: MockServer):
+    index = mock_server.index(
+        _query_handler,
+        query_cache=QueryCache(),
+        semantic_cache=SemanticQueryCache(max_distance=0.01),
+    )
+
+    index.query(vector=[1.0, 0.0])
+
+    res = index.query_many(queries=[{"vector": [1.0, 0.001]}, {"vector": [0.0, 1.0]}])
+
+    assert res[0][0].id == "1.0,0.0"
+    assert len(mock_server.requests) == 2
+    assert mock_server.payloads[1]["vector"] == [0.0, 1.0]
+
+
+def test_semantic_cache_eviction(mock_server: MockServer):
+    cache = SemanticQueryCache(max_entries=2, max_distance=0.01)
+    index = mock_server.index(_query_handler, semantic_cache=cache)
+
+    index.query(vector=[1.0, 0.0])
+    index.query(vector=[0.0, 1.0])
+    index.query(vector=[1.0, 0.0])
+    index.query(vector=[-1.0, 0.0])
+
+    # [0.0, 1.0] is the least recently used one
+    assert len(cache) == 2
+    index.query(vector=[1.0, 0.0])
+    assert len(mock_server.requests) == 3
+    index.query(vector=[0.0, 1.0])
+    assert len(mock_server.requests) == 4
+
+
+def test_semantic_cache_invalidation(mock_server: MockServer):
+    cache = SemanticQueryCache()
+    index = mock_server.index(_query_handler, semantic_cache=cache)
+
+    index.query(vector=[1.0, 0.0])
+    index.query(vector=[1.0, 0.0], namespace="ns")
+
+    index.update("id", metadata={"a": 1}, namespace="ns")
+    assert len(cache) == 1
+
+    index.query(vector=[1.0, 0.0])
+    assert len(mock_server.requests) == 3
+
+    index.query(vector=[1.0, 0.0], namespace="ns")
+    assert len(mock_server.requests) == 4
+
+
+def _fetch_handler(request: httpx.Request) -> httpx.Response:
+    payload = json.loads(request.content)
+    if not request.url.path.startswith("/fetch"):
+        return httpx.Response(200, json={"result": {"updated": 1, "deleted": 1}})
+
+    result = [
+        None
+        if id.startswith("missing")
+        else {
+            "id": id,
+            "vector": [0.1, 0.2] if payload["includeVectors"] else None,
+            "metadata": {"id": id} if payload["includeMetadata"] else None,
+            "data": id if payload["includeData"] else None,
+        }
+        for id in payload["ids"]
+    ]
+    return httpx.Response(200, json={"result": result})
+
+
+def _fetched(mock_server: MockServer) -> List[List[str]]:
+    """
+    The ids of the fetch requests.
+    """
+    return [
+        json.loads(r.content)["ids"]
+        for r in mock_server.requests
+        if r.url.path.startswith("/fetch")
+    ]
+
+
+def test_fetch_cache(mock_server: MockServer):
+    cache = FetchCache()
+    index = mock_server.index(_fetch_handler, fetch_cache=cache)
+
+    index.fetch(["a", "b"], include_metadata=True)
+    res = index.fetch(["b", "missing", "c", "a"], include_metadata=True)
+
+    assert [r.id if r else None for r in res] == ["b", None, "c", "a"]
+    assert res[0] is not None and res[0].metadata == {"id": "b"}
+    assert _fetched(mock_server) == [["a", "b"], ["missing", "c"]]
+
+    # cached without the vectors, so they are fetched again
+    res = index.fetch(["a"], include_vectors=True, include_metadata=True)
+    assert res[0] is not None and res[0].vector == [0.1, 0.2]
+    assert _fetched(mock_server)[-1] == ["a"]
+
+    # cached with more than asked for, the rest is left out
+    res = index.fetch(["a"])
+    assert res[0] is not None
+    assert (res[0].vector, res[0].metadata) == (None, None)
+    assert len(_fetched(mock_server)) == 3
+
+    # namespaces are cached separately
+    index.fetch(["a"], namespace="ns")
+    assert len(_fetched(mock_server)) == 4
+
+
+def test_fetch_cache_invalidation(mock_server: MockServer):
+    cache = FetchCache()
+    index = mock_server.index(_fetch_handler, fetch_cache=cache)
+
+    index.fetch(["a", "b", "c", "d"])
+    assert len(cache) == 4
+
+    index.upsert(vectors=[("a", [0.1, 0.2])])
+    index.update("b", metadata={"x": 1})
+    index.delete(["c"])
+    assert len(cache) == 1
+
+    index.fetch(["a", "b", "c", "d"])
+    assert _fetched(mock_server)[-1] == ["a", "b", "c"]
+
+    index.delete(prefix="a")
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("policy", ["lru", "lfu"])
+def test_fetch_cache_eviction(mock_server: MockServer, policy: str):
+    cache = FetchCache(max_entries=2, policy=policy)
+    index = mock_server.index(_fetch_handler, fetch_cache=cache)
+
+    index.fetch(["a", "b"])
+    index.fetch(["a"])
+    index.fetch(["b"])
+    index.fetch(["b"])
+    index.fetch(["c"])
+
+    # "a" is both the least recently and the least frequently used
+    assert len(_fetched(mock_server)) == 2
+    index.fetch(["a", "b"])
+    assert _fetched(mock_server)[-1] == ["a"]
+
+    cache = FetchCache(max_entries=3, policy=policy)
+    index = mock_server.index(_fetch_handler, fetch_cache=cache)
+
+    index.fetch(["a", "b", "c"])
+    index.fetch(["a"])
+    index.fetch(["a"])
+    index.fetch(["c"])
+    index.fetch(["b"])
+    index.fetch(["d"])
+
+    # "c" is used as frequently as "b", but less recently
+    evicted = "a" if policy == "lru" else "c"
+    mock_server.clear()
+    index.fetch(["a", "b", "c", "d"])
+    assert _fetched(mock_server) == [[evicted]]
+
+
+def test_fetch_cache_ttl_and_size(mock_server: MockServer):
+    cache = FetchCache(ttl=0.01)
+    index = mock_server.index(_fetch_handler, fetch_cache=cache)
+
+    index.fetch(["a"], include_data=True)
+    time.sleep(0.02)
+    index.fetch(["a"], include_data=True)
+    assert len(_fetched(mock_server)) == 2
+
+    cache = FetchCache(max_bytes=200)
+    index = mock_server.index(_fetch_handler, fetch_cache=cache)
+
+    index.fetch([f"id-{i}" for i in range(10)], include_metadata=True)
+    assert 0 < cache.size <= 200
+    assert len(cache) < 10
+
+    with raises(ClientError):
+        FetchCache(policy="random")
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from tests import INDEX_TOKEN, INDEX_URL
+from upstash_vector import AsyncIndex, Index
+from upstash_vector.codec import (
+    JSONCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+)
+
+
+def _codecs():
+    codecs = [StdlibJSONCodec()]
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec())
+        except ImportError:
+            pass
+
+    return codecs
+
+
+@pytest.mark.parametrize("codec", _codecs())
+def test_codec(codec: JSONCodec):
+    index = Index(INDEX_URL, INDEX_TOKEN, json_codec=codec)
+    index.reset()
+
+    index.upsert(
+        vectors=[
+            ("id-0", np.array([0.1, 0.2]), {"field": np.int64(1)}),
+            ("id-1", [0.3, 0.4], {"field": 2}),
+        ]
+    )
+    index.upsert_matrix(
+        ids=["id-2", "id-3"],
+        vectors=np.array([[0.5, 0.6], [0.7, 0.8]], dtype=np.float32),
+    )
+
+    res = index.fetch(
+        ids=["id-0", "id-1", "id-2", "id-3"],
+        include_vectors=True,
+        include_metadata=True,
+    )
+
+    assert res[0] is not None
+    assert res[0].vector == pytest.approx([0.1, 0.2])
+    assert res[0].metadata == {"field": 1}
+
+    assert res[1] is not None
+    assert res[1].vector == pytest.approx([0.3, 0.4])
+    assert res[1].metadata == {"field": 2}
+
+    assert res[2] is not None
+    assert res[2].vector == pytest.approx([0.5, 0.6])
+
+    assert res[3] is not None
+    assert res[3].vector == pytest.approx([0.7, 0.8])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("codec", _codecs())
+async def test_codec_async(codec: JSONCodec):
+    index = AsyncIndex(INDEX_URL, INDEX_TOKEN, json_codec=codec)
+    await index.reset()
+
+    await index.upsert(
+        vectors=[
+            ("id-0", np.array([0.1, 0.2]), {"field": np.int64(1)}),
+        ]
+    )
+
+    res = await index.query(
+        vector=np.array([0.1, 0.2]),
+        top_k=1,
+        include_vectors=True,
+        include_metadata=True,
+    )
+
+    assert len(res) == 1
+    assert res[0].id == "id-0"
+    assert res[0].vector == pytest.approx([0.1, 0.2])
+    assert res[0].metadata == {"field": 1}
@@ -1,7 +1,14 @@
+import json
+from typing import Dict, List, Set
+
+import httpx
 import pytest
+from pytest import raises
 
-from tests import NAMESPACES
+from tests import NAMESPACES, MockServer
 from upstash_vector import AsyncIndex, Index
+from upstash_vector.errors import ClientError, UpstashError
+from upstash_vector.types import BatchProgress
 
 
 @pytest.mark.parametrize("ns", NAMESPACES)
@@ -259,3 +266,182 @@ async def test_delete_filter_async(async_index: AsyncIndex, ns: str):
     assert vectors[1] is not None
     assert vectors[2] is None
     assert vectors[3] is None
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_delete_many(index: Index, ns: str):
+    index.upsert(
+        vectors=[(f"id-{i}", [0.1, i]) for i in range(25)],
+        namespace=ns,
+    )
+
+    progress: List[BatchProgress] = []
+    res = index.delete_many(
+        ids=(f"id-{i}" for i in range(30)),
+        namespace=ns,
+        batch_size=10,
+        max_workers=2,
+        on_progress=progress.append,
+    )
+
+    assert res.deleted == 25
+    assert res.errors == []
+    assert progress[-1].completed_batches == 3
+    assert progress[-1].completed_items == 30
+
+    assert index.fetch([f"id-{i}" for i in range(25)], namespace=ns) == [None] * 25
+
+
+def test_delete_from_namespaces(index: Index):
+    for ns in NAMESPACES:
+        index.upsert(
+            vectors=[
+                ("id-00", [0.1, 0.2], {"meta": 0}),
+                ("id-01", [0.1, 0.3], {"meta": 1}),
+                ("id-10", [0.1, 0.4], {"meta": 2}),
+            ],
+            namespace=ns,
+        )
+
+    progress: List[BatchProgress] = []
+    res = index.delete_from_namespaces(
+        namespaces=NAMESPACES, prefix="id-0", on_progress=progress.append
+    )
+
+    assert res.deleted == 4
+    assert res.results == {ns: 2 for ns in NAMESPACES}
+    assert res.errors == {}
+    assert progress[-1].completed_batches == len(NAMESPACES)
+
+    res = index.delete_from_namespaces(namespaces=NAMESPACES, filter="meta = 2")
+    assert res.deleted == 2
+
+    for ns in NAMESPACES:
+        assert index.fetch(["id-00", "id-01", "id-10"], namespace=ns) == [None] * 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_delete_many_async(async_index: AsyncIndex, ns: str):
+    await async_index.upsert(
+        vectors=[(f"id-{i}", [0.1, i]) for i in range(25)],
+        namespace=ns,
+    )
+
+    res = await async_index.delete_many(
+        ids=[f"id-{i}" for i in range(30)],
+        namespace=ns,
+        batch_size=10,
+        max_workers=2,
+    )
+
+    assert res.deleted == 25
+    assert res.errors == []
+
+
+@pytest.mark.asyncio
+async def test_delete_from_namespaces_async(async_index: AsyncIndex):
+    for ns in NAMESPACES:
+        await async_index.upsert(
+            vectors=[
+                ("id-00", [0.1, 0.2], {"meta": 0}),
+                ("id-10", [0.1, 0.4], {"meta": 2}),
+            ],
+            namespace=ns,
+        )
+
+    res = await async_index.delete_from_namespaces(
+        namespaces=NAMESPACES, filter="meta >= 0"
+    )
+
+    assert res.deleted == 4
+    assert res.results == {ns: 2 for ns in NAMESPACES}
+
+
+def _delete_handler(mock_server: MockServer, stores: Dict[str, Set[str]]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        parts = request.url.path.strip("/").split("/")
+        namespace = parts[1] if len(parts) > 1 else ""
+
+        with mock_server.lock:
+            if namespace == "fail" or "fail" in payload.get("ids", []):
+                return httpx.Response(200, json={"error": "failed"})
+
+            store = stores.setdefault(namespace, set())
+            if "ids" in payload:
+                deleted = store & set(payload["ids"])
+            else:
+                deleted = {id for id in store if id.startswith(payload["prefix"])}
+
+            store -= deleted
+
+        return httpx.Response(200, json={"result": {"deleted": len(deleted)}})
+
+    return handler
+
+
+def test_delete_many_requests(mock_server: MockServer):
+    stores = {"": {f"id-{i}" for i in range(20)}}
+    index = mock_server.index(_delete_handler(mock_server, stores))
+    progress: List[BatchProgress] = []
+
+    ids = [f"id-{i}" for i in range(25)]
+    ids[22] = "fail"
+    res = index.delete_many(
+        (id for id in ids), batch_size=10, max_workers=2, on_progress=progress.append
+    )
+
+    assert [len(p["ids"]) for p in mock_server.payloads] == [10, 10, 5]
+    assert res.deleted == 20
+    assert [(e.batch, e.ids) for e in res.errors] == [(2, ids[20:])]
+    assert isinstance(res.errors[0].error, UpstashError)
+    assert stores == {"": set()}
+
+    assert len(progress) == 3
+    assert progress[-1].completed_items == 20
+    assert progress[-1].failed_items == 5
+
+    with raises(ClientError):
+        index.delete_many(ids, batch_size=0)
+
+
+def test_delete_from_namespaces_requests(mock_server: MockServer):
+    stores = {ns: {"a-1", "a-2", "b-1"} for ns in ["", "ns-1", "ns-2"]}
+    index = mock_server.index(_delete_handler(mock_server, stores))
+    progress: List[BatchProgress] = []
+
+    res = index.delete_from_namespaces(
+        ["", "ns-1", "fail", "ns-2", "ns-1"],
+        prefix="a-",
+        on_progress=progress.append,
+    )
+
+    assert len(mock_server.requests) == 4
+    assert res.deleted == 6
+    assert res.results == {"": 2, "ns-1": 2, "ns-2": 2}
+    assert list(res.errors) == ["fail"]
+    assert all(store == {"b-1"} for store in stores.values())
+
+    assert len(progress) == 4
+    assert progress[-1].completed_batches == 3
+    assert progress[-1].failed_batches == 1
+    assert progress[-1].completed_items == 6
+
+    with raises(ClientError):
+        index.delete_from_namespaces(["ns-1"])
+
+
+@pytest.mark.asyncio
+async def test_delete_requests_async(mock_server: MockServer):
+    stores = {ns: {f"id-{i}" for i in range(15)} for ns in ["", "ns"]}
+    index = mock_server.async_index(_delete_handler(mock_server, stores))
+
+    res = await index.delete_many([f"id-{i}" for i in range(10)], batch_size=4)
+    assert res.deleted == 10
+    assert res.errors == []
+    assert [len(p["ids"]) for p in mock_server.payloads] == [4, 4, 2]
+
+    res_ns = await index.delete_from_namespaces(["", "ns"], prefix="id-1")
+    assert res_ns.results == {"": 5, "ns": 6}
+    assert res_ns.deleted == 11
@@ -0,0 +1,129 @@
+import json
+from typing import Any, Dict, List
+
+import httpx
+import numpy as np
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+import pytest
+
+from tests import MockServer
+from upstash_vector.export import export_namespace, export_namespace_async
+
+VECTORS: List[Dict[str, Any]] = [
+    {
+        "id": f"id-{i:02}",
+        "vector": [i, i + 0.5, -i],
+        "sparseVector": {"indices": list(range(i % 3)), "values": [i] * (i % 3)},
+        "metadata": {"i": i} if i % 2 else None,
+        "data": f"data-{i}",
+    }
+    for i in range(25)
+]
+
+
+def _handler(vector_count: int = len(VECTORS)):
+    def handler(request: httpx.Request) -> httpx.Response:
+        result: Any
+        if request.url.path == "/info":
+            result = {
+                "vectorCount": vector_count,
+                "pendingVectorCount": 0,
+                "indexSize": 0,
+                "dimension": 3,
+                "similarityFunction": "COSINE",
+                "denseIndex": {
+                    "dimension": 3,
+                    "similarityFunction": "COSINE",
+                    "embeddingModel": "",
+                },
+                "sparseIndex": {"embeddingModel": ""},
+                "namespaces": {
+                    "": {"vectorCount": vector_count, "pendingVectorCount": 0}
+                },
+            }
+        else:
+            payload = json.loads(request.content)
+            start = int(payload["cursor"] or 0)
+            end = start + payload["limit"]
+            result = {
+                "nextCursor": str(end) if end < len(VECTORS) else "",
+                "vectors": VECTORS[start:end],
+            }
+
+        return httpx.Response(200, json={"result": result})
+
+    return handler
+
+
+def _assert_exported(directory: str, records: List[Dict[str, Any]]):
+    dense = np.fromfile(f"{directory}/vectors.f32", dtype=np.float32)
+    assert np.array_equal(
+        dense.reshape(len(VECTORS), 3), np.array([v["vector"] for v in VECTORS])
+    )
+
+    indptr = np.fromfile(f"{directory}/sparse_indptr.i64", dtype=np.int64)
+    indices = np.fromfile(f"{directory}/sparse_indices.i32", dtype=np.int32)
+    values = np.fromfile(f"{directory}/sparse_values.f32", dtype=np.float32)
+    assert len(indptr) == len(VECTORS) + 1
+    for i, v in enumerate(VECTORS):
+        row = slice(indptr[i], indptr[i + 1])
+        assert indices[row].tolist() == v["sparseVector"]["indices"]
+        assert values[row].tolist() == v["sparseVector"]["values"]
+
+    assert [r["id"] for r in records] == [v["id"] for v in VECTORS]
+    assert [r["data"] for r in records] == [v["data"] for v in VECTORS]
+
+    with open(f"{directory}/manifest.json") as f:
+        manifest = json.load(f)
+
+    assert manifest["vectorCount"] == len(VECTORS)
+    assert manifest["dimension"] == 3
+
+
+def test_export_jsonl(mock_server: MockServer, tmp_path):
+    index = mock_server.index(_handler())
+    res = export_namespace(index, str(tmp_path), batch_size=4)
+
+    assert res.vector_count == len(VECTORS)
+    assert res.dimension == 3
+    assert res.sparse
+
+    with open(tmp_path / "records.jsonl") as f:
+        records = [json.loads(line) for line in f]
+
+    assert [r["metadata"] for r in records] == [v["metadata"] for v in VECTORS]
+    _assert_exported(str(tmp_path), records)
+
+
+def test_export_parquet(mock_server: MockServer, tmp_path):
+    index = mock_server.index(_handler())
+    export_namespace(index, str(tmp_path), format="parquet", batch_size=7)
+
+    records = pq.read_table(tmp_path / "records.parquet").to_pylist()
+    metadata = [
+        None if r["metadata"] is None else json.loads(r["metadata"]) for r in records
+    ]
+    assert metadata == [v["metadata"] for v in VECTORS]
+    _assert_exported(str(tmp_path), records)
+
+
+def test_export_grows(mock_server: MockServer, tmp_path):
+    # more vectors than reported by the info
+    index = mock_server.index(_handler(vector_count=3))
+    res = export_namespace(index, str(tmp_path), batch_size=4)
+
+    assert res.vector_count == len(VECTORS)
+    assert (tmp_path / "vectors.f32").stat().st_size == len(VECTORS) * 3 * 4
+
+
+@pytest.mark.asyncio
+async def test_export_async(mock_server: MockServer, tmp_path):
+    index = mock_server.async_index(_handler())
+
+    res = await export_namespace_async(index, str(tmp_path), batch_size=6)
+    assert res.vector_count == len(VECTORS)
+
+    with open(tmp_path / "records.jsonl") as f:
+        records = [json.loads(line) for line in f]
+
+    _assert_exported(str(tmp_path), records)
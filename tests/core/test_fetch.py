@@ -1,6 +1,10 @@
+import json
+from typing import Any, List
+
+import httpx
 import pytest
 
-from tests import NAMESPACES
+from tests import NAMESPACES, MockServer
 from upstash_vector import AsyncIndex, Index
 from upstash_vector.types import SparseVector
 
@@ -602,3 +606,79 @@ async def test_fetch_prefix_async(async_index: AsyncIndex, ns: str):
 
     assert vectors[0].id == "id-10"
     assert vectors[1].id == "id-11"
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_fetch_chunked(index: Index, ns: str):
+    index.upsert(
+        vectors=[(f"chunk-{i}", [0.1, i]) for i in range(20)],
+        namespace=ns,
+    )
+
+    ids = [f"chunk-{i}" for i in range(20)]
+    ids.insert(7, "missing")
+
+    res = index.fetch(ids=ids, namespace=ns, batch_size=3, max_workers=3)
+
+    assert [r.id if r else None for r in res] == [
+        id if id != "missing" else None for id in ids
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_fetch_chunked_async(async_index: AsyncIndex, ns: str):
+    await async_index.upsert(
+        vectors=[(f"chunk-{i}", [0.1, i]) for i in range(20)],
+        namespace=ns,
+    )
+
+    ids = [f"chunk-{i}" for i in range(20)]
+    ids.insert(7, "missing")
+
+    res = await async_index.fetch(ids=ids, namespace=ns, batch_size=3, max_workers=3)
+
+    assert [r.id if r else None for r in res] == [
+        id if id != "missing" else None for id in ids
+    ]
+
+
+def _chunk_handler(request: httpx.Request) -> httpx.Response:
+    payload = json.loads(request.content)
+    result: Any = [
+        None if id.startswith("missing") else {"id": id} for id in payload["ids"]
+    ]
+    return httpx.Response(200, json={"result": result})
+
+
+def _ids(n: int) -> List[str]:
+    return [f"missing-{i}" if i % 5 == 0 else f"id-{i}" for i in range(n)]
+
+
+def test_fetch_chunked_requests(mock_server: MockServer):
+    index = mock_server.index(_chunk_handler)
+
+    ids = _ids(23)
+    res = index.fetch(ids, batch_size=5, max_workers=3)
+
+    assert [r.id if r else None for r in res] == [
+        None if id.startswith("missing") else id for id in ids
+    ]
+    assert sorted(len(p["ids"]) for p in mock_server.payloads) == [3, 5, 5, 5, 5]
+
+    mock_server.clear()
+    index.fetch(ids, batch_size=100)
+    assert len(mock_server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_chunked_requests_async(mock_server: MockServer):
+    index = mock_server.async_index(_chunk_handler)
+
+    ids = _ids(23)
+    res = await index.fetch(ids, batch_size=5, max_workers=3)
+
+    assert [r.id if r else None for r in res] == [
+        None if id.startswith("missing") else id for id in ids
+    ]
+    assert len(mock_server.requests) == 5
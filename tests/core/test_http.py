@@ -0,0 +1,221 @@
+import gzip
+import json
+import time
+
+import httpx
+import pytest
+from pytest import raises
+
+from tests import MockServer
+from upstash_vector import Index
+from upstash_vector.errors import ClientError, UpstashError
+from upstash_vector.http import Compression, RetryPolicy
+
+
+def _success(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"result": "Success"})
+
+
+def test_retry_status(mock_server: MockServer):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if len(mock_server.requests) < 3:
+            return httpx.Response(503, text="Service Unavailable")
+
+        return _success(request)
+
+    index = mock_server.index(
+        handler, retry_policy=RetryPolicy(retries=3, initial_backoff=0.01)
+    )
+
+    assert index.reset() == "Success"
+    assert len(mock_server.requests) == 3
+
+
+def test_retry_status_exhausted(mock_server: MockServer):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, json={"error": "Too many requests"})
+
+    index = mock_server.index(
+        handler, retry_policy=RetryPolicy(retries=2, initial_backoff=0.01)
+    )
+
+    with raises(UpstashError):
+        index.reset()
+
+    assert len(mock_server.requests) == 3
+
+
+def test_retry_non_retryable_status(mock_server: MockServer):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(400, json={"error": "Bad request"})
+
+    index = mock_server.index(
+        handler, retry_policy=RetryPolicy(retries=3, initial_backoff=0.01)
+    )
+
+    with raises(UpstashError):
+        index.reset()
+
+    assert len(mock_server.requests) == 1
+
+
+def test_retry_after(mock_server: MockServer):
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(time.monotonic())
+        if len(attempts) < 2:
+            return httpx.Response(429, headers={"Retry-After": "0.3"})
+
+        return _success(request)
+
+    index = mock_server.index(
+        handler, retry_policy=RetryPolicy(retries=1, initial_backoff=0.01)
+    )
+
+    assert index.reset() == "Success"
+    assert attempts[1] - attempts[0] >= 0.3
+
+
+@pytest.mark.parametrize("retry_after", ["inf", "nan", "-1", "1e300"])
+def test_retry_after_invalid(mock_server: MockServer, retry_after: str):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if len(mock_server.requests) < 2:
+            return httpx.Response(429, headers={"Retry-After": retry_after})
+
+        return _success(request)
+
+    index = mock_server.index(
+        handler,
+        retry_policy=RetryPolicy(retries=1, initial_backoff=0.01, max_backoff=0.1),
+    )
+
+    start = time.monotonic()
+    assert index.reset() == "Success"
+    assert time.monotonic() - start < 1
+
+
+def test_retry_total_timeout(mock_server: MockServer):
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Connection refused")
+
+    index = mock_server.index(
+        handler,
+        retry_policy=RetryPolicy(
+            retries=100, initial_backoff=0.1, jitter=False, total_timeout=0.5
+        ),
+    )
+
+    with raises(httpx.ConnectError):
+        index.reset()
+
+    assert 1 < len(mock_server.requests) < 10
+
+
+@pytest.mark.asyncio
+async def test_retry_exception_async(mock_server: MockServer):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if len(mock_server.requests) < 3:
+            raise httpx.ReadTimeout("Timed out")
+
+        return _success(request)
+
+    index = mock_server.async_index(
+        handler, retry_policy=RetryPolicy(retries=3, initial_backoff=0.01)
+    )
+
+    assert await index.reset() == "Success"
+    assert len(mock_server.requests) == 3
+
+
+def test_http_client(mock_server: MockServer):
+    client = httpx.Client(transport=mock_server.transport(_success))
+    index = Index("https://vector.upstash.io", "token", http_client=client)
+
+    assert index.reset() == "Success"
+    assert len(mock_server.requests) == 1
+
+    with raises(ClientError):
+        Index("https://vector.upstash.io", "token", http_client=client, http2=True)
+
+
+def test_operation_timeouts(mock_server: MockServer):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"result": []})
+
+    index = mock_server.index(
+        handler,
+        timeout=httpx.Timeout(30.0),
+        operation_timeouts={"query": 5.0, "upsert": httpx.Timeout(120.0)},
+    )
+
+    index.query(vector=[0.1, 0.2], namespace="ns")
+    index.query(data="hello")
+    index.upsert(vectors=[("id", [0.1, 0.2])])
+    index.upsert(vectors=[("id", "hello")])
+    index.fetch(ids=["id"])
+
+    timeouts = {
+        r.url.path: r.extensions["timeout"]["read"] for r in mock_server.requests
+    }
+    assert timeouts == {
+        "/query/ns": 5.0,
+        "/query-data": 5.0,
+        "/upsert": 120.0,
+        "/upsert-data": 120.0,
+        "/fetch": 30.0,
+    }
+
+    with raises(ClientError):
+        mock_server.index(handler, operation_timeouts={"querry": 5.0})
+
+
+@pytest.mark.asyncio
+async def test_operation_timeouts_async(mock_server: MockServer):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"result": []})
+
+    index = mock_server.async_index(
+        handler, timeout=httpx.Timeout(30.0), operation_timeouts={"query": 5.0}
+    )
+
+    await index.query(vector=[0.1, 0.2])
+    await index.fetch(ids=["id"])
+
+    timeouts = {
+        r.url.path: r.extensions["timeout"]["read"] for r in mock_server.requests
+    }
+    assert timeouts == {"/query": 5.0, "/fetch": 30.0}
+
+
+def test_compression(mock_server: MockServer):
+    index = mock_server.index(_success, compression=Compression("gzip", threshold=1024))
+
+    index.upsert(vectors=[("id", [0.1] * 1000)])
+    index.upsert(vectors=[("id", [0.1])])
+
+    large, small = mock_server.requests
+    assert large.headers["Content-Encoding"] == "gzip"
+    body = json.loads(gzip.decompress(large.content))
+    assert body[0]["id"] == "id"
+    assert body[0]["vector"] == [0.1] * 1000
+    assert "Content-Encoding" not in small.headers
+    assert "gzip" in small.headers["Accept-Encoding"]
+
+
+@pytest.mark.asyncio
+async def test_compression_async(mock_server: MockServer):
+    index = mock_server.async_index(
+        _success, compression=Compression("gzip", threshold=0)
+    )
+
+    await index.upsert(vectors=[("id", [0.1, 0.2])])
+
+    request = mock_server.requests[0]
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert len(json.loads(gzip.decompress(request.content))) == 1
+
+
+def test_compression_invalid():
+    with raises(ClientError):
+        Compression("br")
@@ -0,0 +1,217 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from pytest import raises
+
+from tests import MockServer
+from upstash_vector.errors import ClientError
+from upstash_vector.http import RetryPolicy
+from upstash_vector.limiter import AdaptiveConcurrencyLimiter, RateLimiter
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"result": "Success"})
+
+
+def test_rate_limiter_requests(mock_server: MockServer):
+    limiter = RateLimiter(requests_per_second=20, request_burst=1)
+    index = mock_server.index(_handler, rate_limiter=limiter)
+
+    start = time.monotonic()
+    for _ in range(6):
+        index.reset()
+
+    # first request is served from the burst, rest waits 50ms each
+    assert time.monotonic() - start >= 0.25
+
+
+def test_rate_limiter_bytes(mock_server: MockServer):
+    limiter = RateLimiter(bytes_per_second=1000)
+    index = mock_server.index(_handler, rate_limiter=limiter)
+
+    start = time.monotonic()
+    # each request body is larger than 400 bytes, and
+    # the first 1000 bytes are served from the burst
+    for _ in range(6):
+        index.upsert(vectors=[("id", [0.1] * 100)])
+
+    assert time.monotonic() - start >= 1.0
+
+
+def test_rate_limiter_shared(mock_server: MockServer):
+    limiter = RateLimiter(requests_per_second=50, request_burst=1)
+    indexes = [mock_server.index(_handler, rate_limiter=limiter) for _ in range(4)]
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for _ in range(5):
+            list(executor.map(lambda i: i.reset(), indexes))
+
+    assert time.monotonic() - start >= 0.35
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_async(mock_server: MockServer):
+    limiter = RateLimiter(requests_per_second=20, request_burst=1)
+    index = mock_server.async_index(_handler, rate_limiter=limiter)
+
+    start = time.monotonic()
+    await asyncio.gather(*[index.reset() for _ in range(6)])
+
+    assert time.monotonic() - start >= 0.25
+
+
+def test_rate_limiter_invalid():
+    with raises(ClientError):
+        RateLimiter()
+
+    with raises(ClientError):
+        RateLimiter(requests_per_second=0)
+
+
+def test_concurrency_limiter_grows():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=8)
+
+    for _ in range(100):
+        limit = limiter.limit
+        for _ in range(limit):
+            limiter.acquire()
+
+        for _ in range(limit):
+            limiter.release(0.01, overloaded=False)
+
+    assert limiter.limit == 8
+    assert limiter.in_flight == 0
+    assert limiter.latency == pytest.approx(0.01)
+
+
+def test_concurrency_limiter_shrinks():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16, max_limit=16)
+
+    limiter.acquire()
+    limiter.release(0.01, overloaded=True)
+    assert limiter.limit == 8
+
+    for latency in [0.01] * 8 + [0.1] * 4:
+        limiter.acquire()
+        limiter.release(latency, overloaded=False)
+
+    assert limiter.limit == 4
+    assert limiter.min_latency == pytest.approx(0.01, rel=0.1)
+
+
+def test_concurrency_limiter_index(mock_server: MockServer):
+    statuses = [503, 200]
+    in_flight = 0
+    max_in_flight = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        with mock_server.lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+
+        time.sleep(0.01)
+
+        with mock_server.lock:
+            in_flight -= 1
+            status = statuses.pop(0) if statuses else 200
+
+        return httpx.Response(status, json={"result": "Success"})
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+    index = mock_server.index(handler, retry_interval=0, concurrency_limiter=limiter)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: index.reset(), range(16)))
+
+    assert max_in_flight <= 2
+    assert limiter.in_flight == 0
+    assert limiter.latency is not None
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_async(mock_server: MockServer):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"result": "Success"})
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+    index = mock_server.async_index(handler, concurrency_limiter=limiter)
+
+    await asyncio.gather(*[index.reset() for _ in range(12)])
+
+    assert max_in_flight == 3
+    assert limiter.in_flight == 0
+
+
+def test_concurrency_limiter_invalid():
+    with raises(ClientError):
+        AdaptiveConcurrencyLimiter(initial_limit=0)
+
+    with raises(ClientError):
+        AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=4)
+
+    with raises(ClientError):
+        AdaptiveConcurrencyLimiter(latency_tolerance=1)
+
+    with raises(ClientError):
+        AdaptiveConcurrencyLimiter(backoff_ratio=1)
+
+
+def test_concurrency_limiter_cancelled():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8)
+
+    limiter.acquire()
+    limiter.release(None)
+
+    assert limiter.limit == 8
+    assert limiter.in_flight == 0
+    assert limiter.latency is None
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_timeouts(mock_server: MockServer):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(1)
+        return httpx.Response(200, json={"result": []})
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=32, max_limit=32)
+    index = mock_server.async_index(handler, concurrency_limiter=limiter)
+
+    res = await index.query_namespaces(
+        namespaces=[f"ns-{i}" for i in range(8)],
+        vector=[0.1, 0.2],
+        timeout=0.05,
+    )
+
+    # the timed out queries are cancelled, which is not a sign of overload
+    assert len(res.errors) == 8
+    assert limiter.limit == 32
+    assert limiter.in_flight == 0
+
+
+def test_concurrency_limiter_overload(mock_server: MockServer):
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Connection refused")
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8)
+    index = mock_server.index(
+        handler, retry_policy=RetryPolicy(retries=0), concurrency_limiter=limiter
+    )
+
+    with raises(httpx.ConnectError):
+        index.reset()
+
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
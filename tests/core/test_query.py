@@ -1,8 +1,12 @@
+import asyncio
+import threading
+
+import httpx
 import numpy as np
 import pandas as pd
 import pytest
 
-from tests import NAMESPACES, assert_eventually, assert_eventually_async
+from tests import NAMESPACES, MockServer, assert_eventually, assert_eventually_async
 from upstash_vector import AsyncIndex, Index
 from upstash_vector.types import (
     FusionAlgorithm,
@@ -369,6 +373,116 @@ def test_query_many(index: Index, ns: str):
     assert_eventually(assertion)
 
 
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_query_many_chunked(index: Index, ns: str):
+    index.upsert(
+        vectors=[(f"id{i}", [i + 1, i + 1]) for i in range(3)],
+        namespace=ns,
+    )
+
+    queries = [{"vector": [1, 1 + i / 10], "top_k": 2} for i in range(10)]
+
+    def assertion():
+        res = index.query_many(
+            queries=queries,
+            namespace=ns,
+            batch_size=3,
+            max_workers=2,
+        )
+
+        assert len(res) == 10
+        for query_res in res:
+            assert len(query_res) == 2
+
+        streamed = dict(
+            index.iter_query_many(queries=queries, namespace=ns, batch_size=4)
+        )
+
+        assert sorted(streamed) == list(range(10))
+        for i, query_res in streamed.items():
+            assert [r.id for r in query_res] == [r.id for r in res[i]]
+
+    assert_eventually(assertion)
+
+
+def test_query_namespaces(index: Index):
+    index.upsert(vectors=[("id0", [0.1, 0.1]), ("id1", [0.9, 0.1])], namespace="")
+    index.upsert(vectors=[("id2", [0.1, 0.2]), ("id3", [0.5, 0.5])], namespace="ns")
+
+    def assertion():
+        res = index.query_namespaces(
+            namespaces=NAMESPACES,
+            vector=[0.1, 0.1],
+            top_k=3,
+            include_metadata=True,
+        )
+
+        assert res.errors == {}
+        assert len(res.results) == 3
+        assert res.results[0].id == "id0"
+        assert res.results[0].namespace == ""
+        assert {r.namespace for r in res.results} == {"", "ns"}
+
+        scores = [r.score for r in res.results]
+        assert scores == sorted(scores, reverse=True)
+
+    assert_eventually(assertion)
+
+
+def test_query_namespaces_timeout(mock_server: MockServer):
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        release.wait(5)
+        return httpx.Response(200, json={"result": []})
+
+    index = mock_server.index(handler)
+
+    try:
+        res = index.query_namespaces(
+            namespaces=["ns-1", "ns-2", "ns-3"],
+            vector=[0.1, 0.1],
+            max_workers=1,
+            timeout=0.1,
+        )
+    finally:
+        release.set()
+
+    assert res.results == []
+    assert sorted(res.errors) == ["ns-1", "ns-2", "ns-3"]
+    assert all(isinstance(e, TimeoutError) for e in res.errors.values())
+    # the queries not started yet are cancelled
+    assert mock_server.paths == ["/query/ns-1"]
+
+
+@pytest.mark.asyncio
+async def test_query_namespaces_cancelled_async(mock_server: MockServer):
+    cancelled = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(request.url.path)
+            raise
+
+        return httpx.Response(200, json={"result": []})
+
+    index = mock_server.async_index(handler)
+
+    task = asyncio.ensure_future(
+        index.query_namespaces(namespaces=["ns-1", "ns-2"], vector=[0.1, 0.1])
+    )
+    await asyncio.sleep(0.05)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # the queries of the namespaces do not outlive the call
+    assert sorted(cancelled) == ["/query/ns-1", "/query/ns-2"]
+
+
 @pytest.mark.parametrize("ns", NAMESPACES)
 def test_query_with_data_with_vector_with_metadata(index: Index, ns: str):
     v1_id = "id1"
@@ -973,6 +1087,70 @@ async def test_query_many_async(async_index: AsyncIndex, ns: str):
     await assert_eventually_async(assertion)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_query_many_chunked_async(async_index: AsyncIndex, ns: str):
+    await async_index.upsert(
+        vectors=[(f"id{i}", [i + 1, i + 1]) for i in range(3)],
+        namespace=ns,
+    )
+
+    queries = [{"vector": [1, 1 + i / 10], "top_k": 2} for i in range(10)]
+
+    async def assertion():
+        res = await async_index.query_many(
+            queries=queries,
+            namespace=ns,
+            batch_size=3,
+            max_workers=2,
+        )
+
+        assert len(res) == 10
+        for query_res in res:
+            assert len(query_res) == 2
+
+        streamed = {
+            i: query_res
+            async for i, query_res in async_index.iter_query_many(
+                queries=queries, namespace=ns, batch_size=4
+            )
+        }
+
+        assert sorted(streamed) == list(range(10))
+        for i, query_res in streamed.items():
+            assert [r.id for r in query_res] == [r.id for r in res[i]]
+
+    await assert_eventually_async(assertion)
+
+
+@pytest.mark.asyncio
+async def test_query_namespaces_async(async_index: AsyncIndex):
+    await async_index.upsert(
+        vectors=[("id0", [0.1, 0.1]), ("id1", [0.9, 0.1])], namespace=""
+    )
+    await async_index.upsert(
+        vectors=[("id2", [0.1, 0.2]), ("id3", [0.5, 0.5])], namespace="ns"
+    )
+
+    async def assertion():
+        res = await async_index.query_namespaces(
+            namespaces=NAMESPACES,
+            vector=[0.1, 0.1],
+            top_k=3,
+        )
+
+        assert res.errors == {}
+        assert len(res.results) == 3
+        assert res.results[0].id == "id0"
+        assert res.results[0].namespace == ""
+        assert {r.namespace for r in res.results} == {"", "ns"}
+
+        scores = [r.score for r in res.results]
+        assert scores == sorted(scores, reverse=True)
+
+    await assert_eventually_async(assertion)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("ns", NAMESPACES)
 async def test_query_with_data_with_vector_with_metadata_async(
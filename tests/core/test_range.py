@@ -1,12 +1,20 @@
+import json
 import random
+import time
+from types import AsyncGeneratorType, GeneratorType
+from typing import Any, Dict, List
 
+import httpx
 import pytest
 from pytest import raises
 
-from tests import NAMESPACES
+from tests import NAMESPACES, MockServer
 from upstash_vector import AsyncIndex, Index
+from upstash_vector.core.concurrency import adapt_page_size
 from upstash_vector.errors import ClientError
 
+IDS = [f"id-{i:03}" for i in range(100)]
+
 
 @pytest.mark.parametrize("ns", NAMESPACES)
 def test_range(index: Index, ns: str):
@@ -408,3 +416,243 @@ async def test_range_prefix_async(async_index: AsyncIndex, ns: str):
     assert result.vectors[1].id == "id-13"
 
     assert result.next_cursor == ""
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_iter_range(index: Index, ns: str):
+    vectors: List[Dict[str, Any]] = [
+        {
+            "id": f"id-{i}",
+            "vector": [random.random() for _ in range(2)],
+            "metadata": {"meta": i},
+        }
+        for i in range(20)
+    ]
+
+    index.upsert(vectors=vectors, namespace=ns)
+
+    res = list(index.iter_range(limit=3, include_metadata=True, namespace=ns))
+    assert sorted(v.id for v in res) == sorted(v["id"] for v in vectors)
+    assert all(v.metadata == {"meta": int(v.id[3:])} for v in res)
+
+    res = list(index.iter_range(limit=3, prefetch=False, adaptive=False, namespace=ns))
+    assert len(res) == 20
+
+    with raises(ClientError):
+        next(index.iter_range(limit=0, namespace=ns))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_iter_range_async(async_index: AsyncIndex, ns: str):
+    vectors: List[Dict[str, Any]] = [
+        {
+            "id": f"id-{i}",
+            "vector": [random.random() for _ in range(2)],
+            "metadata": {"meta": i},
+        }
+        for i in range(20)
+    ]
+
+    await async_index.upsert(vectors=vectors, namespace=ns)
+
+    res = [
+        v
+        async for v in async_index.iter_range(
+            limit=3, include_metadata=True, namespace=ns
+        )
+    ]
+    assert sorted(v.id for v in res) == sorted(v["id"] for v in vectors)
+    assert all(v.metadata == {"meta": int(v.id[3:])} for v in res)
+
+    with raises(ClientError):
+        await async_index.iter_range(limit=0, namespace=ns).__anext__()
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_parallel_range(index: Index, ns: str):
+    vectors: List[Dict[str, Any]] = [
+        {
+            "id": f"id-{i}",
+            "vector": [random.random() for _ in range(2)],
+            "metadata": {"meta": i},
+        }
+        for i in range(20)
+    ]
+
+    index.upsert(vectors=vectors, namespace=ns)
+
+    res = list(
+        index.parallel_range(
+            prefix="id-",
+            alphabet="0123456789",
+            limit=3,
+            include_metadata=True,
+            namespace=ns,
+        )
+    )
+    assert sorted(v.id for v in res) == sorted(v["id"] for v in vectors)
+    assert all(v.metadata == {"meta": int(v.id[3:])} for v in res)
+
+    res = list(index.parallel_range(prefixes=["id-1", "id-2"], namespace=ns))
+    expected = ["id-1", "id-2"] + [f"id-1{i}" for i in range(10)]
+    assert sorted(v.id for v in res) == sorted(expected)
+
+    with raises(ClientError):
+        next(index.parallel_range(prefixes=["id-1", "id-10"], namespace=ns))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_parallel_range_async(async_index: AsyncIndex, ns: str):
+    vectors: List[Dict[str, Any]] = [
+        {
+            "id": f"id-{i}",
+            "vector": [random.random() for _ in range(2)],
+            "metadata": {"meta": i},
+        }
+        for i in range(20)
+    ]
+
+    await async_index.upsert(vectors=vectors, namespace=ns)
+
+    res = [
+        v
+        async for v in async_index.parallel_range(
+            prefix="id-",
+            alphabet="0123456789",
+            limit=3,
+            include_metadata=True,
+            namespace=ns,
+        )
+    ]
+    assert sorted(v.id for v in res) == sorted(v["id"] for v in vectors)
+    assert all(v.metadata == {"meta": int(v.id[3:])} for v in res)
+
+
+def _range_handler(delay: float = 0.0):
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        if request.url.path == "/fetch":
+            return httpx.Response(200, json={"result": [None] * len(payload["ids"])})
+
+        time.sleep(delay * payload["limit"])
+        ids = [id for id in IDS if id.startswith(payload.get("prefix", ""))]
+        start = int(payload["cursor"] or 0)
+        end = start + payload["limit"]
+        result: Any = {
+            "nextCursor": str(end) if end < len(ids) else "",
+            "vectors": [{"id": id} for id in ids[start:end]],
+        }
+        return httpx.Response(200, json={"result": result})
+
+    return handler
+
+
+def _limits(mock_server: MockServer) -> List[int]:
+    return [p["limit"] for p in mock_server.payloads if "limit" in p]
+
+
+def test_adapt_page_size():
+    assert adapt_page_size(100, 0.1, 0.5, 1000) == 200
+    assert adapt_page_size(100, 0.4, 0.5, 1000) == 125
+    assert adapt_page_size(100, 2.0, 0.5, 1000) == 50
+    assert adapt_page_size(800, 0.1, 0.5, 1000) == 1000
+    assert adapt_page_size(1, 10.0, 0.5, 1000) == 1
+
+
+def test_iter_range_adaptive(mock_server: MockServer):
+    index = mock_server.index(_range_handler())
+
+    assert [v.id for v in index.iter_range(limit=2, max_limit=16)] == IDS
+    # grows up to the max limit, as the pages are fast
+    assert _limits(mock_server)[:5] == [2, 4, 8, 16, 16]
+
+
+def test_iter_range_not_adaptive(mock_server: MockServer):
+    index = mock_server.index(_range_handler())
+
+    ids = [v.id for v in index.iter_range(limit=10, adaptive=False, prefetch=False)]
+    assert ids == IDS
+    assert _limits(mock_server) == [10] * 10
+
+
+def test_iter_range_shrinks(mock_server: MockServer):
+    index = mock_server.index(_range_handler(delay=0.001))
+
+    # 40 vectors take 40ms per page, twice the target latency
+    iterator = index.iter_range(limit=40, target_latency=0.02, max_limit=40)
+    assert isinstance(iterator, GeneratorType)
+    assert [next(iterator).id for _ in range(60)] == IDS[:60]
+    iterator.close()
+
+    limits = _limits(mock_server)
+    assert limits[0] == 40
+    assert limits[1] < 40
+
+
+def test_iter_range_prefetch(mock_server: MockServer):
+    index = mock_server.index(_range_handler())
+
+    iterator = index.iter_range(limit=10, adaptive=False)
+    assert isinstance(iterator, GeneratorType)
+    assert next(iterator).id == IDS[0]
+
+    # the next page is fetched while the first one is being processed
+    deadline = time.monotonic() + 1
+    while len(mock_server.requests) < 2 and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+    assert len(mock_server.requests) == 2
+    iterator.close()
+
+
+def test_parallel_range_partitions(mock_server: MockServer):
+    index = mock_server.index(_range_handler())
+
+    ids = [v.id for v in index.parallel_range(prefix="id-", alphabet="0123456789")]
+    assert sorted(ids) == IDS
+
+    # the pages of a partition are in order
+    ids = [v.id for v in index.parallel_range(prefixes=["id-00", "id-01"], limit=3)]
+    assert [id for id in ids if id.startswith("id-00")] == IDS[:10]
+    assert sorted(ids) == IDS[:20]
+
+    with raises(ClientError):
+        next(index.parallel_range(prefixes=["id-0", "id-01"]))
+
+    # the ids not continuing with the alphabet are not scanned
+    assert list(index.parallel_range(alphabet="abc")) == []
+
+    # the alphabet is not assumed, as the ids outside it would be skipped
+    with raises(ClientError):
+        next(index.parallel_range())
+
+    with raises(ClientError):
+        next(index.parallel_range(prefixes=["id-0"], alphabet="0123456789"))
+
+    # the explicit prefixes are not extended with the prefix
+    with raises(ClientError):
+        next(index.parallel_range(prefix="id-", prefixes=["00", "01"]))
+
+
+@pytest.mark.asyncio
+async def test_iter_range_adaptive_async(mock_server: MockServer):
+    index = mock_server.async_index(_range_handler())
+
+    ids = [v.id async for v in index.iter_range(limit=2, max_limit=16)]
+    assert ids == IDS
+    assert _limits(mock_server)[:5] == [2, 4, 8, 16, 16]
+
+    iterator = index.iter_range(limit=10)
+    assert isinstance(iterator, AsyncGeneratorType)
+    assert (await iterator.__anext__()).id == IDS[0]
+    await iterator.aclose()
+
+    ids = [
+        v.id
+        async for v in index.parallel_range(
+            prefix="id-", alphabet="0123456789", limit=7, max_workers=3
+        )
+    ]
+    assert sorted(ids) == IDS
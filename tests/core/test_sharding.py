@@ -0,0 +1,180 @@
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from pytest import raises
+
+from tests import MockServer
+from upstash_vector.errors import ClientError
+from upstash_vector.sharding import (
+    AsyncShardedIndex,
+    ConsistentHashRing,
+    ShardedIndex,
+)
+
+
+def _handler(store: Dict[str, Dict[str, Any]]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload: Any = json.loads(request.content) if request.content else None
+        operation = request.url.path.strip("/").split("/")[0]
+
+        result: Any
+        if operation == "upsert":
+            for vector in payload:
+                store[vector["id"]] = vector
+            result = "Success"
+        elif operation == "fetch":
+            result = [store.get(id) for id in payload["ids"]]
+        elif operation == "delete":
+            result = {
+                "deleted": sum(store.pop(id, None) is not None for id in payload["ids"])
+            }
+        elif operation == "update":
+            result = {"updated": int(payload["id"] in store)}
+        elif operation == "query":
+            scores: List[Dict[str, Any]] = [
+                {"id": id, "score": v["vector"][0]} for id, v in store.items()
+            ]
+            scores.sort(key=lambda r: r["score"], reverse=True)
+            result = scores[: payload["topK"]]
+        elif operation == "range":
+            ids = sorted(store)
+            start = int(payload["cursor"] or 0)
+            end = start + payload["limit"]
+            result = {
+                "nextCursor": str(end) if end < len(ids) else "",
+                "vectors": [store[id] for id in ids[start:end]],
+            }
+        elif operation == "info":
+            result = {
+                "vectorCount": len(store),
+                "pendingVectorCount": 0,
+                "indexSize": 10 * len(store),
+                "dimension": 2,
+                "similarityFunction": "COSINE",
+                "namespaces": {
+                    "": {"vectorCount": len(store), "pendingVectorCount": 0}
+                },
+            }
+        else:
+            store.clear()
+            result = "Success"
+
+        return httpx.Response(200, json={"result": result})
+
+    return handler
+
+
+def _sharded_index(
+    mock_server: MockServer, stores: List[Dict[str, Any]]
+) -> ShardedIndex:
+    return ShardedIndex([mock_server.index(_handler(s)) for s in stores])
+
+
+def _vectors(n: int) -> List[tuple]:
+    return [(f"id-{i}", [i / n, 0.5]) for i in range(n)]
+
+
+def test_hash_ring():
+    ring = ConsistentHashRing(4)
+    counts = [0] * 4
+    for i in range(4000):
+        counts[ring.shard_for(f"id-{i}")] += 1
+
+    assert all(c > 600 for c in counts)
+
+    # only the keys of the new shard move
+    grown = ConsistentHashRing(5)
+    for i in range(4000):
+        shard = grown.shard_for(f"id-{i}")
+        assert shard == 4 or shard == ring.shard_for(f"id-{i}")
+
+    with raises(ClientError):
+        ConsistentHashRing(0)
+
+
+def test_sharded_index(mock_server: MockServer):
+    stores: List[Dict[str, Any]] = [{}, {}, {}]
+
+    with _sharded_index(mock_server, stores) as index:
+        index.upsert(_vectors(30))
+
+        assert sum(len(s) for s in stores) == 30
+        assert all(stores)
+        for i in range(30):
+            assert f"id-{i}" in stores[index._ring.shard_for(f"id-{i}")]
+
+        ids = ["id-3", "missing", "id-17", "id-0"]
+        fetched = index.fetch(ids)
+        assert [r.id if r else None for r in fetched] == ["id-3", None, "id-17", "id-0"]
+
+        res = index.query(vector=[1.0, 0.0], top_k=5)
+        assert [r.id for r in res] == [f"id-{i}" for i in range(29, 24, -1)]
+
+        assert index.update("id-5", metadata={"a": 1})
+        assert not index.update("missing", metadata={"a": 1})
+
+        info = index.info()
+        assert info.vector_count == 30
+        assert info.index_size == 300
+        assert info.namespaces[""].vector_count == 30
+
+        assert index.delete(["id-1", "id-2", "missing"]).deleted == 2
+        assert sum(len(s) for s in stores) == 28
+
+
+def test_sharded_index_int_ids(mock_server: MockServer):
+    stores: List[Dict[str, Any]] = [{}, {}, {}]
+
+    with _sharded_index(mock_server, stores) as index:
+        index.upsert([(i, [0.1, 0.2]) for i in range(10)])
+
+        # the updates reach the shards the vectors are upserted to
+        for i in range(10):
+            assert index.update(i, metadata={"a": 1})  # type: ignore[arg-type]
+
+
+def test_sharded_index_range(mock_server: MockServer):
+    stores: List[Dict[str, Any]] = [{}, {}, {}]
+
+    with _sharded_index(mock_server, stores) as index:
+        index.upsert(_vectors(20))
+
+        ids: List[str] = []
+        res = index.range(limit=4)
+        ids.extend(v.id for v in res.vectors)
+        while res.next_cursor:
+            assert len(res.vectors) <= 4
+            res = index.range(cursor=res.next_cursor, limit=4)
+            ids.extend(v.id for v in res.vectors)
+
+        assert sorted(ids) == sorted(id for id, _ in _vectors(20))
+
+        with raises(ClientError):
+            index.range(cursor="not a cursor")
+
+
+@pytest.mark.asyncio
+async def test_sharded_index_async(mock_server: MockServer):
+    stores: List[Dict[str, Any]] = [{}, {}]
+
+    index = AsyncShardedIndex([mock_server.async_index(_handler(s)) for s in stores])
+    await index.upsert(_vectors(10))
+
+    assert all(stores)
+
+    fetched = await index.fetch(["id-9", "id-0"])
+    assert [r.id for r in fetched if r] == ["id-9", "id-0"]
+
+    res = await index.query(vector=[1.0, 0.0], top_k=3)
+    assert [r.id for r in res] == ["id-9", "id-8", "id-7"]
+
+    assert (await index.info()).vector_count == 10
+    assert (await index.delete("id-9")).deleted == 1
+
+    await index.upsert([(3, [0.1, 0.2])])
+    assert await index.update(3, metadata={"a": 1})  # type: ignore[arg-type]
+
+    await index.reset()
+    assert not any(stores)
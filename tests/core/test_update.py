@@ -1,8 +1,18 @@
+import json
+from typing import Iterator, List
+
+import httpx
 import pytest
 
-from tests import NAMESPACES
+from tests import NAMESPACES, MockServer
 from upstash_vector import AsyncIndex, Index
-from upstash_vector.types import MetadataUpdateMode, SparseVector
+from upstash_vector.errors import ClientError, UpstashError
+from upstash_vector.types import (
+    BatchProgress,
+    MetadataUpdateMode,
+    SparseVector,
+    UpdateRequest,
+)
 
 
 @pytest.mark.parametrize("ns", NAMESPACES)
@@ -377,3 +387,136 @@ async def test_update_hybrid_vector_async(async_hybrid_index: AsyncIndex, ns: st
     assert res[0].id == "id1"
     assert res[0].vector == [0.5, 0.6]
     assert res[0].sparse_vector == SparseVector([6, 7], [0.5, 0.6])
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_update_many(index: Index, ns: str):
+    index.upsert(
+        [(f"id-{i}", [0.1, i], {"i": i}) for i in range(10)],
+        namespace=ns,
+    )
+
+    res = index.update_many(
+        updates=[
+            {
+                "id": f"id-{i}",
+                "metadata": {"j": i},
+                "metadata_update_mode": MetadataUpdateMode.PATCH,
+            }
+            for i in range(12)
+        ],
+        namespace=ns,
+        max_workers=4,
+    )
+
+    assert res.updated == 10
+    assert res.not_found == 2
+    assert res.errors == []
+
+    fetched = index.fetch(
+        [f"id-{i}" for i in range(10)], include_metadata=True, namespace=ns
+    )
+    assert [r.metadata if r else None for r in fetched] == [
+        {"i": i, "j": i} for i in range(10)
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_update_many_async(async_index: AsyncIndex, ns: str):
+    await async_index.upsert(
+        [(f"id-{i}", [0.1, i], {"i": i}) for i in range(10)],
+        namespace=ns,
+    )
+
+    res = await async_index.update_many(
+        updates=[{"id": f"id-{i}", "vector": [0.2, i]} for i in range(12)],
+        namespace=ns,
+        max_workers=4,
+    )
+
+    assert res.updated == 10
+    assert res.not_found == 2
+    assert res.errors == []
+
+    fetched = await async_index.fetch(
+        [f"id-{i}" for i in range(10)], include_vectors=True, namespace=ns
+    )
+    assert [r.vector if r else None for r in fetched] == [[0.2, i] for i in range(10)]
+
+
+def _update_handler(request: httpx.Request) -> httpx.Response:
+    payload = json.loads(request.content)
+    if payload["id"] == "fail":
+        return httpx.Response(200, json={"error": "failed"})
+
+    updated = 0 if payload["id"].startswith("missing") else 1
+    return httpx.Response(200, json={"result": {"updated": updated}})
+
+
+def _updates() -> Iterator[UpdateRequest]:
+    yield {"id": "a", "metadata": {"x": 1}}
+    yield {"id": "missing-1", "vector": [0.1, 0.2]}
+    yield {
+        "id": "b",
+        "metadata": {"y": None},
+        "metadata_update_mode": MetadataUpdateMode.PATCH,
+    }
+    yield {"id": "fail", "data": "hello"}
+    yield {"id": "c", "sparse_vector": ([1, 2], [0.1, 0.2])}
+
+
+def test_update_many_requests(mock_server: MockServer):
+    progress: List[BatchProgress] = []
+    index = mock_server.index(_update_handler)
+
+    res = index.update_many(_updates(), max_workers=2, on_progress=progress.append)
+
+    assert (res.updated, res.not_found) == (3, 1)
+    assert [(e.batch, e.ids) for e in res.errors] == [(3, ["fail"])]
+    assert isinstance(res.errors[0].error, UpstashError)
+
+    assert len(progress) == 5
+    assert progress[-1].completed_items == 4
+    assert progress[-1].failed_items == 1
+
+    by_id = {p["id"]: p for p in mock_server.payloads}
+    assert by_id["a"]["metadataUpdateMode"] == "OVERWRITE"
+    assert by_id["b"] == {
+        "id": "b",
+        "metadata": {"y": None},
+        "metadataUpdateMode": "PATCH",
+    }
+    assert by_id["c"]["sparseVector"] == {"indices": [1, 2], "values": [0.1, 0.2]}
+
+
+def test_update_many_missing_id(mock_server: MockServer):
+    index = mock_server.index(_update_handler)
+    updates: List[UpdateRequest] = [
+        {"id": "a", "metadata": {"x": 1}},
+        {"metadata": {"x": 2}},  # type: ignore[typeddict-item]
+        {"id": "b", "metadata": {"x": 3}},
+    ]
+
+    res = index.update_many(updates, max_workers=2)
+
+    # the update without an id fails on its own
+    assert res.updated == 2
+    assert [(e.batch, e.ids) for e in res.errors] == [(1, [])]
+    assert isinstance(res.errors[0].error, ClientError)
+    assert len(mock_server.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_update_many_requests_async(mock_server: MockServer):
+    index = mock_server.async_index(_update_handler)
+
+    res = await index.update_many(_updates(), namespace="ns", max_workers=2)
+
+    assert (res.updated, res.not_found) == (3, 1)
+    assert [e.ids for e in res.errors] == [["fail"]]
+    assert len(mock_server.requests) == 5
+
+    res = await index.update_many([{"metadata": {"x": 1}}])  # type: ignore[typeddict-item]
+    assert [e.ids for e in res.errors] == [[]]
+    assert isinstance(res.errors[0].error, ClientError)
@@ -1,12 +1,16 @@
+from typing import List
+
+import httpx
 import numpy as np
 import pandas as pd
+import pyarrow as pa  # type: ignore[import-untyped]
 import pytest
 from pytest import raises
 
-from tests import NAMESPACES
+from tests import NAMESPACES, MockServer
 from upstash_vector import AsyncIndex, Index
-from upstash_vector.errors import ClientError
-from upstash_vector.types import Data, SparseVector, Vector
+from upstash_vector.errors import ClientError, UpstashError
+from upstash_vector.types import BatchProgress, Data, SparseVector, Vector
 
 
 @pytest.mark.parametrize("ns", NAMESPACES)
@@ -1118,3 +1122,449 @@ async def test_upsert_data_as_vector_async(async_embedding_index: AsyncIndex, ns
     assert res[0] is not None
     assert res[0].id == "test"
     assert res[0].data == "data"
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_upsert_many(index: Index, ns: str):
+    vectors = [(f"id-{i}", [0.1 * i, 0.2 * i], {"i": i}) for i in range(25)]
+
+    res = index.upsert_many(
+        vectors=vectors,
+        namespace=ns,
+        batch_size=10,
+        max_workers=2,
+    )
+
+    assert res.upserted == 25
+    assert res.results == ["Success"] * 3
+    assert res.errors == []
+
+    fetched = index.fetch(
+        ids=[v[0] for v in vectors],
+        include_vectors=True,
+        include_metadata=True,
+        namespace=ns,
+    )
+
+    for vector, result in zip(vectors, fetched):
+        assert result is not None
+        assert result.id == vector[0]
+        assert result.vector == pytest.approx(vector[1])
+        assert result.metadata == vector[2]
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_upsert_many_batch_bytes(index: Index, ns: str):
+    vectors = [
+        {"id": f"id-{i}", "vector": [0.1, 0.2], "metadata": {"field": "x" * 100}}
+        for i in range(10)
+    ]
+
+    res = index.upsert_many(
+        vectors=vectors,
+        namespace=ns,
+        max_batch_bytes=400,
+    )
+
+    assert res.upserted == 10
+    assert len(res.results) == 5
+    assert res.errors == []
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_upsert_many_generator(index: Index, ns: str):
+    def vectors():
+        for i in range(25):
+            yield Vector(id=f"id-{i}", vector=np.array([0.1 * i, 0.2 * i]))
+
+    res = index.upsert_many(
+        vectors=vectors(),
+        namespace=ns,
+        batch_size=4,
+        max_workers=2,
+    )
+
+    assert res.upserted == 25
+    assert len(res.results) == 7
+    assert res.errors == []
+
+    fetched = index.fetch(
+        ids=[f"id-{i}" for i in range(25)],
+        namespace=ns,
+    )
+
+    assert all(r is not None for r in fetched)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_upsert_many_async(async_index: AsyncIndex, ns: str):
+    async def vectors():
+        for i in range(25):
+            yield (f"id-{i}", [0.1 * i, 0.2 * i], {"i": i})
+
+    progress: List[BatchProgress] = []
+    res = await async_index.upsert_many(
+        vectors=vectors(),
+        namespace=ns,
+        batch_size=10,
+        max_workers=2,
+        on_progress=progress.append,
+    )
+
+    assert res.upserted == 25
+    assert res.results == ["Success"] * 3
+    assert res.errors == []
+
+    assert len(progress) == 3
+    assert progress[-1].completed_batches == 3
+    assert progress[-1].completed_items == 25
+    assert progress[-1].failed_batches == 0
+    assert progress[-1].failed_items == 0
+
+    fetched = await async_index.fetch(
+        ids=[f"id-{i}" for i in range(25)],
+        include_vectors=True,
+        include_metadata=True,
+        namespace=ns,
+    )
+
+    for i, result in enumerate(fetched):
+        assert result is not None
+        assert result.id == f"id-{i}"
+        assert result.vector == pytest.approx([0.1 * i, 0.2 * i])
+        assert result.metadata == {"i": i}
+
+
+def test_upsert_many_failed_batch(index: Index):
+    res = index.upsert_many(
+        vectors=[
+            ("id-0", [0.1, 0.2]),
+            ("id-1", [0.1, 0.2, 0.3]),
+        ],
+        batch_size=1,
+    )
+
+    assert res.upserted == 1
+    assert res.results == ["Success"]
+    assert len(res.errors) == 1
+    assert res.errors[0].batch == 1
+    assert res.errors[0].ids == ["id-1"]
+    assert isinstance(res.errors[0].error, UpstashError)
+
+
+@pytest.mark.asyncio
+async def test_upsert_many_failed_batch_async(async_index: AsyncIndex):
+    progress: List[BatchProgress] = []
+    res = await async_index.upsert_many(
+        vectors=[
+            ("id-0", [0.1, 0.2]),
+            ("id-1", [0.1, 0.2, 0.3]),
+        ],
+        batch_size=1,
+        on_progress=progress.append,
+    )
+
+    assert res.upserted == 1
+    assert res.results == ["Success"]
+    assert len(res.errors) == 1
+    assert res.errors[0].batch == 1
+    assert res.errors[0].ids == ["id-1"]
+    assert isinstance(res.errors[0].error, UpstashError)
+
+    assert progress[-1].completed_items == 1
+    assert progress[-1].failed_items == 1
+
+
+def test_upsert_many_mixed(index: Index):
+    with raises(ClientError):
+        index.upsert_many(
+            vectors=[
+                ("id-0", [0.1, 0.2]),
+                Data(id="id-1", data="data"),
+            ],
+        )
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_upsert_matrix(index: Index, ns: str):
+    ids = np.array([f"id-{i}" for i in range(25)])
+    vectors = np.arange(50, dtype=np.float64).reshape(25, 2) / 100
+    metadata = [{"i": i} for i in range(25)]
+    data = [f"data-{i}" for i in range(25)]
+
+    res = index.upsert_matrix(
+        ids=ids,
+        vectors=vectors,
+        metadata=metadata,
+        data=data,
+        namespace=ns,
+        batch_size=10,
+    )
+
+    assert res.upserted == 25
+    assert res.results == ["Success"] * 3
+    assert res.errors == []
+
+    fetched = index.fetch(
+        ids=ids.tolist(),
+        include_vectors=True,
+        include_metadata=True,
+        include_data=True,
+        namespace=ns,
+    )
+
+    for i, result in enumerate(fetched):
+        assert result is not None
+        assert result.id == f"id-{i}"
+        assert result.vector == pytest.approx(vectors[i].tolist())
+        assert result.metadata == {"i": i}
+        assert result.data == f"data-{i}"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_upsert_matrix_async(async_index: AsyncIndex, ns: str):
+    ids = [f"id-{i}" for i in range(25)]
+    vectors = np.arange(50, dtype=np.float32).reshape(25, 2) / 100
+
+    res = await async_index.upsert_matrix(
+        ids=ids,
+        vectors=vectors,
+        namespace=ns,
+        batch_size=10,
+    )
+
+    assert res.upserted == 25
+    assert res.errors == []
+
+    fetched = await async_index.fetch(
+        ids=ids,
+        include_vectors=True,
+        namespace=ns,
+    )
+
+    for i, result in enumerate(fetched):
+        assert result is not None
+        assert result.id == f"id-{i}"
+        assert result.vector == pytest.approx(vectors[i].tolist())
+
+
+def test_upsert_matrix_invalid_shape(index: Index):
+    with raises(ClientError):
+        index.upsert_matrix(
+            ids=["id-0", "id-1"],
+            vectors=np.zeros((3, 2)),
+        )
+
+    with raises(ClientError):
+        index.upsert_matrix(
+            ids=["id-0", "id-1"],
+            vectors=np.zeros(2),
+        )
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_upsert_dataframe(index: Index, ns: str):
+    df = pd.DataFrame(
+        {
+            "id": [f"id-{i}" for i in range(25)],
+            "embedding": list(np.arange(50, dtype=np.float64).reshape(25, 2) / 100),
+            "genre": ["fiction" if i % 2 else None for i in range(25)],
+            "year": [2000 + i for i in range(25)],
+            "text": [f"data-{i}" for i in range(25)],
+        }
+    )
+
+    res = index.upsert_dataframe(
+        df,
+        vector_column="embedding",
+        metadata_columns=["genre", "year"],
+        data_column="text",
+        namespace=ns,
+        batch_size=10,
+    )
+
+    assert res.upserted == 25
+    assert res.results == ["Success"] * 3
+    assert res.errors == []
+
+    fetched = index.fetch(
+        ids=df["id"].tolist(),
+        include_vectors=True,
+        include_metadata=True,
+        include_data=True,
+        namespace=ns,
+    )
+
+    for i, result in enumerate(fetched):
+        assert result is not None
+        assert result.id == f"id-{i}"
+        assert result.vector == pytest.approx(df["embedding"][i].tolist())
+        if i % 2:
+            assert result.metadata == {"genre": "fiction", "year": 2000 + i}
+        else:
+            assert result.metadata == {"year": 2000 + i}
+        assert result.data == f"data-{i}"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_upsert_dataframe_async(async_index: AsyncIndex, ns: str):
+    df = pd.DataFrame(
+        {
+            "id": [f"id-{i}" for i in range(25)],
+            "embedding": [[0.1 * i, 0.2 * i] for i in range(25)],
+            "metadata": [{"i": i} for i in range(25)],
+        }
+    )
+
+    res = await async_index.upsert_dataframe(
+        df,
+        vector_column="embedding",
+        metadata_column="metadata",
+        namespace=ns,
+        batch_size=10,
+    )
+
+    assert res.upserted == 25
+    assert res.errors == []
+
+    fetched = await async_index.fetch(
+        ids=df["id"].tolist(),
+        include_vectors=True,
+        include_metadata=True,
+        namespace=ns,
+    )
+
+    for i, result in enumerate(fetched):
+        assert result is not None
+        assert result.vector == pytest.approx([0.1 * i, 0.2 * i])
+        assert result.metadata == {"i": i}
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_upsert_arrow_table_hybrid(hybrid_index: Index, ns: str):
+    table = pa.table(
+        {
+            "id": ["id-0", "id-1"],
+            "vector": [[0.1, 0.2], [0.3, 0.4]],
+            "sparse_vector": [
+                {"indices": [0, 1], "values": [0.1, 0.2]},
+                {"indices": [2], "values": [0.3]},
+            ],
+        }
+    )
+
+    res = hybrid_index.upsert_dataframe(
+        table,
+        vector_column="vector",
+        sparse_vector_column="sparse_vector",
+        namespace=ns,
+    )
+
+    assert res.upserted == 2
+    assert res.errors == []
+
+    fetched = hybrid_index.fetch(
+        ids=["id-0", "id-1"],
+        include_vectors=True,
+        namespace=ns,
+    )
+
+    assert fetched[0] is not None
+    assert fetched[0].vector == pytest.approx([0.1, 0.2])
+    assert fetched[0].sparse_vector == SparseVector([0, 1], [0.1, 0.2])
+
+    assert fetched[1] is not None
+    assert fetched[1].vector == pytest.approx([0.3, 0.4])
+    assert fetched[1].sparse_vector == SparseVector([2], [0.3])
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_upsert_dataframe_data(embedding_index: Index, ns: str):
+    df = pd.DataFrame(
+        {
+            "id": ["id-0", "id-1"],
+            "text": ["hello", "world"],
+        }
+    )
+
+    res = embedding_index.upsert_dataframe(
+        df,
+        data_column="text",
+        namespace=ns,
+    )
+
+    assert res.upserted == 2
+    assert res.errors == []
+
+    fetched = embedding_index.fetch(
+        ids=["id-0", "id-1"],
+        include_data=True,
+        namespace=ns,
+    )
+
+    assert fetched[0] is not None
+    assert fetched[0].data == "hello"
+    assert fetched[1] is not None
+    assert fetched[1].data == "world"
+
+
+def test_upsert_dataframe_invalid_columns(index: Index):
+    df = pd.DataFrame({"id": ["id-0"], "vector": [[0.1, 0.2]]})
+
+    with raises(ClientError):
+        index.upsert_dataframe(df)
+
+    with raises(ClientError):
+        index.upsert_dataframe(
+            df,
+            vector_column="vector",
+            metadata_column="metadata",
+            metadata_columns=["field"],
+        )
+
+
+def test_upsert_dataframe_metadata_values(mock_server: MockServer):
+    index = mock_server.index(
+        lambda request: httpx.Response(200, json={"result": "Success"})
+    )
+    df = pd.DataFrame(
+        {
+            "id": ["id-0", "id-1", "id-2"],
+            "vector": [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]],
+            "tags": [np.array(["a", "b"]), None, ["c"]],
+            "count": pd.array([1, None, 3], dtype="Int64"),
+            "score": [np.float32(0.5), np.nan, 1.5],
+        }
+    )
+
+    res = index.upsert_dataframe(
+        df, vector_column="vector", metadata_columns=["tags", "count", "score"]
+    )
+
+    assert res.errors == []
+    assert [item["metadata"] for item in mock_server.payloads[0]] == [
+        {"tags": ["a", "b"], "count": 1, "score": 0.5},
+        {},
+        {"tags": ["c"], "count": 3, "score": 1.5},
+    ]
+
+
+def test_upsert_dataframe_unsupported_metadata(mock_server: MockServer):
+    index = mock_server.index(
+        lambda request: httpx.Response(200, json={"result": "Success"})
+    )
+    df = pd.DataFrame(
+        {
+            "id": ["id-0", "id-1"],
+            "vector": [[0.1, 0.2], [0.3, 0.4]],
+            "created": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+        }
+    )
+
+    with raises(ClientError, match="`created`"):
+        index.upsert_dataframe(df, vector_column="vector", metadata_columns=["created"])
+
+    assert mock_server.requests == []
@@ -0,0 +1,543 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from upstash_vector.core.index_operations import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_NAMESPACE,
+    AsyncIndexOperations,
+    IndexOperations,
+)
+from upstash_vector.errors import ClientError, UpstashError
+from upstash_vector.types import (
+    FusionAlgorithm,
+    QueryMode,
+    QueryRequest,
+    QueryResult,
+    SparseVector,
+    SupportsToList,
+    TupleAsSparseVectorT,
+    WeightingStrategy,
+)
+
+# namespace, and whether the queries are data queries
+_BatchKey = Tuple[str, bool]
+
+# results of a query, or the error it failed with
+_Outcome = Union[List[QueryResult], Exception]
+
+
+def _to_request(
+    vector: Optional[Union[List[float], SupportsToList]],
+    top_k: int,
+    include_vectors: bool,
+    include_metadata: bool,
+    filter: str,
+    data: Optional[str],
+    include_data: bool,
+    sparse_vector: Optional[Union[SparseVector, TupleAsSparseVectorT]],
+    weighting_strategy: Optional[WeightingStrategy],
+    fusion_algorithm: Optional[FusionAlgorithm],
+    query_mode: Optional[QueryMode],
+) -> QueryRequest:
+    if data is not None:
+        if vector is not None or sparse_vector is not None:
+            raise ClientError(
+                "The query should not have "
+                "`vector` or `sparse_vector` when it contains `data`."
+            )
+    elif vector is None and sparse_vector is None:
+        raise ClientError(
+            "The query should contain `vector` "
+            "and/or `sparse_vector` when it does not contain `data`."
+        )
+
+    request = QueryRequest(
+        top_k=top_k,
+        include_vectors=include_vectors,
+        include_metadata=include_metadata,
+        include_data=include_data,
+        filter=filter,
+    )
+
+    if vector is not None:
+        request["vector"] = vector
+
+    if sparse_vector is not None:
+        request["sparse_vector"] = sparse_vector
+
+    if data is not None:
+        request["data"] = data
+
+    if weighting_strategy is not None:
+        request["weighting_strategy"] = weighting_strategy
+
+    if fusion_algorithm is not None:
+        request["fusion_algorithm"] = fusion_algorithm
+
+    if query_mode is not None:
+        request["query_mode"] = query_mode
+
+    return request
+
+
+def _is_rejection(error: UpstashError) -> bool:
+    """
+    Returns whether the server rejected the request, as opposed to
+    failing due to overload or an internal error.
+    """
+    status = error.status_code
+    return status is not None and status < 500 and status not in (408, 429)
+
+
+class _Batch:
+    __slots__ = ("deadline", "requests", "futures")
+
+    def __init__(self, deadline: float):
+        self.deadline = deadline
+        self.requests: List[QueryRequest] = []
+        self.futures: List = []
+
+
+class QueryBatcher:
+    """
+    Collects the queries made concurrently from many threads, and sends
+    them in batches with `query_many`, to cut down the number of requests.
+
+    The queries to the same namespace, of the same kind (vector or data
+    queries), are batched together. A batch is sent once it has
+    `max_batch_size` queries, or `max_delay` seconds after its first query,
+    whichever comes first. The results are then routed back to the callers.
+
+    When a batch is rejected by the server, it is split in halves, which
+    are sent again, until the queries that fail are found. That way, an
+    invalid query only fails its own caller. Other errors, like the ones
+    due to overload, fail the whole batch.
+
+    Example usage:
+
+    ```python
+    from upstash_vector import Index
+    from upstash_vector.batcher import QueryBatcher
+
+    index = Index(url=<url>, token=<token>)
+
+    with QueryBatcher(index, max_batch_size=32, max_delay=0.005) as batcher:
+        # called from many threads
+        res = batcher.query(vector=[0.6, 0.9], top_k=5, include_metadata=True)
+    ```
+    """
+
+    def __init__(
+        self,
+        index: IndexOperations,
+        max_batch_size: int = 32,
+        max_delay: float = 0.005,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        """
+        :param index: The index to send the queries to.
+        :param max_batch_size: Maximum number of queries to send in a batch.
+        :param max_delay: Maximum time to wait for more queries after the first query of a batch, in seconds.
+        :param max_workers: Maximum number of batches in flight at the same time.
+        """
+        if max_batch_size <= 0:
+            raise ClientError("max_batch_size must be greater than 0")
+
+        if max_delay < 0:
+            raise ClientError("max_delay must not be negative")
+
+        if max_workers <= 0:
+            raise ClientError("max_workers must be greater than 0")
+
+        self._index = index
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+
+        self._condition = threading.Condition()
+        self._batches: Dict[_BatchKey, _Batch] = {}
+        self._closed = False
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._flusher = threading.Thread(
+            target=self._flush_expired, name="upstash-vector-query-batcher", daemon=True
+        )
+        self._flusher.start()
+
+    def __enter__(self) -> "QueryBatcher":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def query(
+        self,
+        vector: Optional[Union[List[float], SupportsToList]] = None,
+        top_k: int = 10,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        filter: str = "",
+        data: Optional[str] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+        include_data: bool = False,
+        sparse_vector: Optional[Union[SparseVector, TupleAsSparseVectorT]] = None,
+        weighting_strategy: Optional[WeightingStrategy] = None,
+        fusion_algorithm: Optional[FusionAlgorithm] = None,
+        query_mode: Optional[QueryMode] = None,
+    ) -> List[QueryResult]:
+        """
+        Queries `top_k` many similar vectors, as part of a batch, and blocks
+        until the results are available.
+
+        Takes the same parameters as `Index.query`.
+        """
+        return self.submit(
+            vector=vector,
+            top_k=top_k,
+            include_vectors=include_vectors,
+            include_metadata=include_metadata,
+            filter=filter,
+            data=data,
+            namespace=namespace,
+            include_data=include_data,
+            sparse_vector=sparse_vector,
+            weighting_strategy=weighting_strategy,
+            fusion_algorithm=fusion_algorithm,
+            query_mode=query_mode,
+        ).result()
+
+    def submit(
+        self,
+        vector: Optional[Union[List[float], SupportsToList]] = None,
+        top_k: int = 10,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        filter: str = "",
+        data: Optional[str] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+        include_data: bool = False,
+        sparse_vector: Optional[Union[SparseVector, TupleAsSparseVectorT]] = None,
+        weighting_strategy: Optional[WeightingStrategy] = None,
+        fusion_algorithm: Optional[FusionAlgorithm] = None,
+        query_mode: Optional[QueryMode] = None,
+    ) -> "Future[List[QueryResult]]":
+        """
+        Adds the query to a batch, and returns a future for its results,
+        without blocking.
+
+        Takes the same parameters as `Index.query`.
+        """
+        request = _to_request(
+            vector,
+            top_k,
+            include_vectors,
+            include_metadata,
+            filter,
+            data,
+            include_data,
+            sparse_vector,
+            weighting_strategy,
+            fusion_algorithm,
+            query_mode,
+        )
+        key = (namespace, data is not None)
+        future: "Future[List[QueryResult]]" = Future()
+
+        with self._condition:
+            if self._closed:
+                raise ClientError("The batcher is closed.")
+
+            batch = self._batches.get(key)
+            if batch is None:
+                batch = _Batch(time.monotonic() + self._max_delay)
+                self._batches[key] = batch
+                self._condition.notify()
+
+            batch.requests.append(request)
+            batch.futures.append(future)
+
+            if len(batch.requests) >= self._max_batch_size:
+                del self._batches[key]
+                self._executor.submit(self._send, key, batch)
+
+        return future
+
+    def flush(self) -> None:
+        """
+        Sends the batches collected so far, without waiting for them to fill up.
+        """
+        with self._condition:
+            for key, batch in self._batches.items():
+                self._executor.submit(self._send, key, batch)
+
+            self._batches.clear()
+
+    def close(self) -> None:
+        """
+        Sends the batches collected so far, and waits for all the batches
+        in flight to complete. No queries can be made afterwards.
+        """
+        with self._condition:
+            if self._closed:
+                return
+
+            self._closed = True
+            self._condition.notify()
+
+        self._flusher.join()
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def _flush_expired(self) -> None:
+        with self._condition:
+            while not self._closed:
+                if not self._batches:
+                    self._condition.wait()
+                    continue
+
+                # batches are created in the order of their deadlines
+                key, batch = next(iter(self._batches.items()))
+                timeout = batch.deadline - time.monotonic()
+                if timeout > 0:
+                    self._condition.wait(timeout)
+                    continue
+
+                del self._batches[key]
+                self._executor.submit(self._send, key, batch)
+
+    def _send(self, key: _BatchKey, batch: _Batch) -> None:
+        # leave out the queries cancelled by their callers
+        pending = [
+            (request, future)
+            for request, future in zip(batch.requests, batch.futures)
+            if future.set_running_or_notify_cancel()
+        ]
+        if not pending:
+            return
+
+        namespace, _ = key
+        try:
+            outcomes = self._query(
+                [request for request, _ in pending], namespace=namespace
+            )
+        except Exception as e:
+            for _, future in pending:
+                future.set_exception(e)
+            return
+
+        for (_, future), outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    def _query(self, requests: List[QueryRequest], namespace: str) -> List[_Outcome]:
+        try:
+            return list(self._index.query_many(queries=requests, namespace=namespace))
+        except UpstashError as e:
+            if not _is_rejection(e):
+                # bisecting would multiply the requests sent to an
+                # overloaded or failing server
+                raise
+
+            if len(requests) == 1:
+                return [e]
+
+        # the server rejects the whole batch when one of the queries
+        # is invalid, so find the invalid ones by bisecting the batch
+        middle = len(requests) // 2
+        return self._query(requests[:middle], namespace) + self._query(
+            requests[middle:], namespace
+        )
+
+
+class AsyncQueryBatcher:
+    """
+    Collects the queries made concurrently from many coroutines, and sends
+    them in batches with `query_many`, to cut down the number of requests.
+
+    The queries to the same namespace, of the same kind (vector or data
+    queries), are batched together. A batch is sent once it has
+    `max_batch_size` queries, or `max_delay` seconds after its first query,
+    whichever comes first. The results are then routed back to the callers.
+
+    When a batch is rejected by the server, it is split in halves, which
+    are sent again, until the queries that fail are found. That way, an
+    invalid query only fails its own caller. Other errors, like the ones
+    due to overload, fail the whole batch.
+
+    Example usage:
+
+    ```python
+    from upstash_vector import AsyncIndex
+    from upstash_vector.batcher import AsyncQueryBatcher
+
+    index = AsyncIndex(url=<url>, token=<token>)
+
+    async with AsyncQueryBatcher(index, max_batch_size=32, max_delay=0.005) as batcher:
+        # called from many coroutines
+        res = await batcher.query(vector=[0.6, 0.9], top_k=5, include_metadata=True)
+    ```
+    """
+
+    def __init__(
+        self,
+        index: AsyncIndexOperations,
+        max_batch_size: int = 32,
+        max_delay: float = 0.005,
+    ):
+        """
+        :param index: The index to send the queries to.
+        :param max_batch_size: Maximum number of queries to send in a batch.
+        :param max_delay: Maximum time to wait for more queries after the first query of a batch, in seconds.
+        """
+        if max_batch_size <= 0:
+            raise ClientError("max_batch_size must be greater than 0")
+
+        if max_delay < 0:
+            raise ClientError("max_delay must not be negative")
+
+        self._index = index
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+
+        self._batches: Dict[_BatchKey, _Batch] = {}
+        self._timers: Dict[_BatchKey, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._closed = False
+
+    async def __aenter__(self) -> "AsyncQueryBatcher":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def query(
+        self,
+        vector: Optional[Union[List[float], SupportsToList]] = None,
+        top_k: int = 10,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        filter: str = "",
+        data: Optional[str] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+        include_data: bool = False,
+        sparse_vector: Optional[Union[SparseVector, TupleAsSparseVectorT]] = None,
+        weighting_strategy: Optional[WeightingStrategy] = None,
+        fusion_algorithm: Optional[FusionAlgorithm] = None,
+        query_mode: Optional[QueryMode] = None,
+    ) -> List[QueryResult]:
+        """
+        Queries `top_k` many similar vectors, as part of a batch.
+
+        Takes the same parameters as `AsyncIndex.query`.
+        """
+        request = _to_request(
+            vector,
+            top_k,
+            include_vectors,
+            include_metadata,
+            filter,
+            data,
+            include_data,
+            sparse_vector,
+            weighting_strategy,
+            fusion_algorithm,
+            query_mode,
+        )
+
+        if self._closed:
+            raise ClientError("The batcher is closed.")
+
+        loop = asyncio.get_running_loop()
+        key = (namespace, data is not None)
+        future: "asyncio.Future[List[QueryResult]]" = loop.create_future()
+
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = _Batch(loop.time() + self._max_delay)
+            self._batches[key] = batch
+            self._timers[key] = loop.call_at(batch.deadline, self._dispatch, key)
+
+        batch.requests.append(request)
+        batch.futures.append(future)
+
+        if len(batch.requests) >= self._max_batch_size:
+            self._dispatch(key)
+
+        return await future
+
+    def flush(self) -> None:
+        """
+        Sends the batches collected so far, without waiting for them to fill up.
+        """
+        for key in list(self._batches):
+            self._dispatch(key)
+
+    async def close(self) -> None:
+        """
+        Sends the batches collected so far, and waits for all the batches
+        in flight to complete. No queries can be made afterwards.
+        """
+        self._closed = True
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _dispatch(self, key: _BatchKey) -> None:
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+
+        self._timers.pop(key).cancel()
+
+        task = asyncio.ensure_future(self._send(key, batch))
+        # keep a reference, so that the task is not garbage collected
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, key: _BatchKey, batch: _Batch) -> None:
+        namespace, _ = key
+        try:
+            outcomes = await self._query(batch.requests, namespace=namespace)
+        except Exception as e:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, outcome in zip(batch.futures, outcomes):
+            if future.done():
+                continue
+
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    async def _query(
+        self, requests: List[QueryRequest], namespace: str
+    ) -> List[_Outcome]:
+        try:
+            return list(
+                await self._index.query_many(queries=requests, namespace=namespace)
+            )
+        except UpstashError as e:
+            if not _is_rejection(e):
+                # bisecting would multiply the requests sent to an
+                # overloaded or failing server
+                raise
+
+            if len(requests) == 1:
+                return [e]
+
+        # the server rejects the whole batch when one of the queries
+        # is invalid, so find the invalid ones by bisecting the batch
+        middle = len(requests) // 2
+        first, second = await asyncio.gather(
+            self._query(requests[:middle], namespace),
+            self._query(requests[middle:], namespace),
+        )
+        return first + second
@@ -0,0 +1,582 @@
+import asyncio
+import atexit
+import copy
+import dataclasses
+import threading
+import time
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from upstash_vector.core.index_operations import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_NAMESPACE,
+    AsyncIndexOperations,
+    IndexOperations,
+)
+from upstash_vector.errors import ClientError
+from upstash_vector.types import (
+    BatchError,
+    MetadataUpdateMode,
+    UpdateManyResult,
+    UpdateRequest,
+)
+from upstash_vector.utils import compose_merge_patches
+
+# namespace, and id
+_PatchKey = Tuple[str, str]
+
+
+class _PendingPatches:
+    """
+    The patches waiting to be sent, merged per id.
+
+    The patches of an id are kept as a chain, which almost always has a
+    single patch. A new patch is merged into the last one of the chain,
+    unless the two cannot be merged, in which case it starts a new link.
+    The links are sent one after the other, so that they are applied in
+    the order they are made.
+    """
+
+    def __init__(self) -> None:
+        self.chains: Dict[_PatchKey, List[Dict[str, Any]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.chains)
+
+    def add(self, key: _PatchKey, patch: Dict[str, Any]) -> None:
+        chain = self.chains.get(key)
+        if chain is None:
+            self.chains[key] = [patch]
+            return
+
+        merged = compose_merge_patches(chain[-1], patch)
+        if merged is None:
+            chain.append(patch)
+        else:
+            chain[-1] = merged
+
+    def rounds(self) -> List[Dict[str, List[UpdateRequest]]]:
+        """
+        Returns the updates to send per namespace, for each link of the chains.
+        """
+        rounds: List[Dict[str, List[UpdateRequest]]] = []
+        for (namespace, id), chain in self.chains.items():
+            for i, patch in enumerate(chain):
+                if i == len(rounds):
+                    rounds.append({})
+
+                rounds[i].setdefault(namespace, []).append(
+                    UpdateRequest(
+                        id=id,
+                        metadata=patch,
+                        metadata_update_mode=MetadataUpdateMode.PATCH,
+                    )
+                )
+
+        return rounds
+
+
+class _FlushResult:
+    __slots__ = ("updated", "not_found", "errors", "sent", "failed")
+
+    def __init__(self) -> None:
+        self.updated = 0
+        self.not_found = 0
+        self.errors: List[BatchError] = []
+        self.sent = 0
+        # the links after a failed one are not sent
+        self.failed: Dict[_PatchKey, Exception] = {}
+
+    def skip_failed(
+        self, namespace: str, updates: List[UpdateRequest]
+    ) -> List[UpdateRequest]:
+        pending = []
+        for update in updates:
+            error = self.failed.get((namespace, update["id"]))
+            if error is None:
+                pending.append(update)
+            else:
+                self._add_error(namespace, update, error)
+
+        return pending
+
+    def add(
+        self,
+        namespace: str,
+        updates: List[UpdateRequest],
+        result: Optional[UpdateManyResult],
+        error: Optional[Exception],
+    ) -> None:
+        if result is None:
+            assert error is not None
+            for update in updates:
+                self._add_error(namespace, update, error)
+            return
+
+        self.updated += result.updated
+        self.not_found += result.not_found
+        for e in result.errors:
+            self.errors.append(dataclasses.replace(e, batch=self.sent + e.batch))
+            self.failed[(namespace, updates[e.batch]["id"])] = e.error
+
+        self.sent += len(updates)
+
+    def _add_error(
+        self, namespace: str, update: UpdateRequest, error: Exception
+    ) -> None:
+        self.errors.append(BatchError(self.sent, [update["id"]], error))
+        self.failed[(namespace, update["id"])] = error
+        self.sent += 1
+
+    def to_result(self) -> UpdateManyResult:
+        return UpdateManyResult(
+            updated=self.updated, not_found=self.not_found, errors=self.errors
+        )
+
+
+def _to_patch(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    if not isinstance(metadata, dict):
+        raise ClientError("The metadata patch must be a dictionary.")
+
+    # the patch is sent later, so it must not change with the caller's object
+    return copy.deepcopy(metadata)
+
+
+def _validate(max_pending: int, max_delay: float) -> None:
+    if max_pending <= 0:
+        raise ClientError("max_pending must be greater than 0")
+
+    if max_delay < 0:
+        raise ClientError("max_delay must not be negative")
+
+
+def _flush_at_exit(ref: "weakref.ref[MetadataPatchBuffer]") -> None:
+    buffer = ref()
+    if buffer is not None:
+        buffer._close(sequential=True)
+
+
+class MetadataPatchBuffer:
+    """
+    Buffers the metadata patches of many small updates, and sends them
+    later, merged per id, to cut down the number of requests.
+
+    The patches to the same id are merged into one with the
+    `RFC 7396 JSON Merge Patch` semantics `MetadataUpdateMode.PATCH`
+    uses, so many patches to an id are sent as a single
+    `update(..., metadata_update_mode=MetadataUpdateMode.PATCH)`.
+
+    The patches are sent with `update_many` once `max_pending` ids have
+    pending patches, `max_delay` seconds after the first pending patch,
+    or when `flush` is called, whichever comes first. The patches sent
+    together are applied concurrently, but the patches of an id are
+    always applied in the order they are made.
+
+    `close` sends the pending patches, and waits for them to be applied.
+    It is also called when the interpreter exits, if the buffer is not
+    closed by then. In that case, the flush in progress in the background
+    is waited for, and the patches are sent one by one, as no new threads
+    can be started.
+
+    Example usage:
+
+    ```python
+    from upstash_vector import Index
+    from upstash_vector.buffer import MetadataPatchBuffer
+
+    index = Index(url=<url>, token=<token>)
+
+    with MetadataPatchBuffer(index, max_pending=1000, max_delay=1.0) as buffer:
+        # called from many threads
+        buffer.patch("id-1", {"views": 10, "tags": {"new": None}})
+    ```
+    """
+
+    def __init__(
+        self,
+        index: IndexOperations,
+        max_pending: int = 1000,
+        max_delay: float = 1.0,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_flush: Optional[Callable[[UpdateManyResult], None]] = None,
+        flush_at_exit: bool = True,
+    ):
+        """
+        :param index: The index to send the patches to.
+        :param max_pending: Maximum number of ids with pending patches, before they are sent.
+        :param max_delay: Maximum time to wait for more patches after the first pending patch, in seconds.
+        :param max_workers: Maximum number of updates in flight at the same time.
+        :param on_flush: Callback to call with the result of each flush, including the ones made in the background.
+        :param flush_at_exit: Whether to send the pending patches when the interpreter exits, if the buffer is not closed by then.
+        """
+        _validate(max_pending, max_delay)
+
+        if max_workers <= 0:
+            raise ClientError("max_workers must be greater than 0")
+
+        self._index = index
+        self._max_pending = max_pending
+        self._max_delay = max_delay
+        self._max_workers = max_workers
+        self._on_flush = on_flush
+
+        self._condition = threading.Condition()
+        self._pending = _PendingPatches()
+        self._deadline = 0.0
+        self._closed = False
+        # whether the interpreter is exiting, in which case the patches
+        # are sent without starting new threads
+        self._exiting = False
+        # flushes are sent one at a time, so that they are applied in order
+        self._send_lock = threading.Lock()
+
+        self._exit_hook: Optional[Callable[[], None]] = None
+        if flush_at_exit:
+            ref = weakref.ref(self)
+            self._exit_hook = lambda: _flush_at_exit(ref)
+            atexit.register(self._exit_hook)
+
+        self._flusher = threading.Thread(
+            target=self._flush_due, name="upstash-vector-patch-buffer", daemon=True
+        )
+        self._flusher.start()
+
+    def __enter__(self) -> "MetadataPatchBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of ids with pending patches.
+        """
+        with self._condition:
+            return len(self._pending)
+
+    def patch(
+        self,
+        id: str,
+        metadata: Dict[str, Any],
+        namespace: str = DEFAULT_NAMESPACE,
+    ) -> None:
+        """
+        Adds the metadata patch of the vector to the buffer, without blocking.
+
+        :param id: The id of the vector.
+        :param metadata: The patch to apply to the metadata, as a `RFC 7396 JSON Merge Patch`. A `None` value removes the field.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        """
+        patch = _to_patch(metadata)
+
+        with self._condition:
+            if self._closed:
+                raise ClientError("The buffer is closed.")
+
+            if not self._pending:
+                self._deadline = time.monotonic() + self._max_delay
+                self._condition.notify()
+
+            self._pending.add((namespace, id), patch)
+
+            if len(self._pending) >= self._max_pending:
+                self._condition.notify()
+
+    def flush(self) -> UpdateManyResult:
+        """
+        Sends the pending patches, and waits for them to be applied.
+        """
+        return self._flush(sequential=False)
+
+    def close(self) -> UpdateManyResult:
+        """
+        Sends the pending patches, and waits for them to be applied.
+        No patches can be made afterwards.
+        """
+        return self._close(sequential=False)
+
+    def _close(self, sequential: bool) -> UpdateManyResult:
+        with self._condition:
+            if self._closed:
+                return UpdateManyResult(updated=0, not_found=0, errors=[])
+
+            self._closed = True
+            # a flush the flusher is in the middle of sends the rest of
+            # its patches sequentially as well
+            self._exiting = sequential
+            self._condition.notify()
+
+        if self._exit_hook is not None:
+            atexit.unregister(self._exit_hook)
+            self._exit_hook = None
+
+        # wait for the flush in progress, so that the final flush is sent
+        # after it, and contains all the patches left
+        self._flusher.join()
+        return self._flush(sequential)
+
+    def _is_due(self) -> bool:
+        return bool(self._pending) and (
+            len(self._pending) >= self._max_pending
+            or time.monotonic() >= self._deadline
+        )
+
+    def _flush_due(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and not self._is_due():
+                    timeout = (
+                        self._deadline - time.monotonic() if self._pending else None
+                    )
+                    self._condition.wait(timeout)
+
+                if self._closed:
+                    return
+
+            self._flush(sequential=False)
+
+    def _flush(self, sequential: bool) -> UpdateManyResult:
+        with self._send_lock:
+            with self._condition:
+                pending = self._pending
+                self._pending = _PendingPatches()
+
+            if not pending:
+                return UpdateManyResult(updated=0, not_found=0, errors=[])
+
+            flushed = _FlushResult()
+            for updates_by_namespace in pending.rounds():
+                for namespace, updates in updates_by_namespace.items():
+                    updates = flushed.skip_failed(namespace, updates)
+                    if not updates:
+                        continue
+
+                    try:
+                        result = self._send(updates, namespace, sequential)
+                    except Exception as e:
+                        flushed.add(namespace, updates, None, e)
+                    else:
+                        flushed.add(namespace, updates, result, None)
+
+            result = flushed.to_result()
+
+        if self._on_flush is not None:
+            self._on_flush(result)
+
+        return result
+
+    def _send(
+        self, updates: List[UpdateRequest], namespace: str, sequential: bool
+    ) -> UpdateManyResult:
+        if not sequential and not self._exiting:
+            try:
+                return self._index.update_many(
+                    updates, namespace=namespace, max_workers=self._max_workers
+                )
+            except RuntimeError:
+                # the executors cannot schedule new work once the interpreter
+                # starts to exit, which can happen before the exit hook runs.
+                # Some of the updates may have been applied, but applying a
+                # merge patch again has no effect, so they are sent again.
+                pass
+
+        # new threads cannot be started while the interpreter exits
+        updated = 0
+        errors = []
+        for i, update in enumerate(updates):
+            try:
+                updated += self._index.update(**update, namespace=namespace)
+            except Exception as e:
+                errors.append(BatchError(i, [update["id"]], e))
+
+        return UpdateManyResult(
+            updated=updated,
+            not_found=len(updates) - updated - len(errors),
+            errors=errors,
+        )
+
+
+class AsyncMetadataPatchBuffer:
+    """
+    Buffers the metadata patches of many small updates, and sends them
+    asynchronously later, merged per id, to cut down the number of requests.
+
+    The patches to the same id are merged into one with the
+    `RFC 7396 JSON Merge Patch` semantics `MetadataUpdateMode.PATCH`
+    uses, so many patches to an id are sent as a single
+    `update(..., metadata_update_mode=MetadataUpdateMode.PATCH)`.
+
+    The patches are sent with `update_many` once `max_pending` ids have
+    pending patches, `max_delay` seconds after the first pending patch,
+    or when `flush` is called, whichever comes first. The patches sent
+    together are applied concurrently, but the patches of an id are
+    always applied in the order they are made.
+
+    `close` sends the pending patches, and waits for them to be applied.
+    It must be awaited before the event loop is closed, or the pending
+    patches are lost.
+
+    Example usage:
+
+    ```python
+    from upstash_vector import AsyncIndex
+    from upstash_vector.buffer import AsyncMetadataPatchBuffer
+
+    index = AsyncIndex(url=<url>, token=<token>)
+
+    async with AsyncMetadataPatchBuffer(index, max_pending=1000, max_delay=1.0) as buffer:
+        # called from many coroutines
+        buffer.patch("id-1", {"views": 10, "tags": {"new": None}})
+    ```
+    """
+
+    def __init__(
+        self,
+        index: AsyncIndexOperations,
+        max_pending: int = 1000,
+        max_delay: float = 1.0,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_flush: Optional[Callable[[UpdateManyResult], None]] = None,
+    ):
+        """
+        :param index: The index to send the patches to.
+        :param max_pending: Maximum number of ids with pending patches, before they are sent.
+        :param max_delay: Maximum time to wait for more patches after the first pending patch, in seconds.
+        :param max_workers: Maximum number of updates in flight at the same time.
+        :param on_flush: Callback to call with the result of each flush, including the ones made in the background.
+        """
+        _validate(max_pending, max_delay)
+
+        if max_workers <= 0:
+            raise ClientError("max_workers must be greater than 0")
+
+        self._index = index
+        self._max_pending = max_pending
+        self._max_delay = max_delay
+        self._max_workers = max_workers
+        self._on_flush = on_flush
+
+        self._pending = _PendingPatches()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._closed = False
+        self._send_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self) -> "AsyncMetadataPatchBuffer":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of ids with pending patches.
+        """
+        return len(self._pending)
+
+    def patch(
+        self,
+        id: str,
+        metadata: Dict[str, Any],
+        namespace: str = DEFAULT_NAMESPACE,
+    ) -> None:
+        """
+        Adds the metadata patch of the vector to the buffer, without blocking.
+        Must be called from a running event loop.
+
+        :param id: The id of the vector.
+        :param metadata: The patch to apply to the metadata, as a `RFC 7396 JSON Merge Patch`. A `None` value removes the field.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        """
+        patch = _to_patch(metadata)
+
+        if self._closed:
+            raise ClientError("The buffer is closed.")
+
+        loop = asyncio.get_running_loop()
+        if not self._pending:
+            self._timer = loop.call_at(loop.time() + self._max_delay, self._dispatch)
+
+        self._pending.add((namespace, id), patch)
+
+        if len(self._pending) >= self._max_pending:
+            self._dispatch()
+
+    async def flush(self) -> UpdateManyResult:
+        """
+        Sends the pending patches, and waits for them to be applied.
+        """
+        if self._send_lock is None:
+            self._send_lock = asyncio.Lock()
+
+        # flushes are sent one at a time, so that they are applied in order
+        async with self._send_lock:
+            pending = self._take_pending()
+            if not pending:
+                return UpdateManyResult(updated=0, not_found=0, errors=[])
+
+            flushed = _FlushResult()
+            for updates_by_namespace in pending.rounds():
+                for namespace, updates in updates_by_namespace.items():
+                    updates = flushed.skip_failed(namespace, updates)
+                    if not updates:
+                        continue
+
+                    try:
+                        result = await self._index.update_many(
+                            updates,
+                            namespace=namespace,
+                            max_workers=self._max_workers,
+                        )
+                    except Exception as e:
+                        flushed.add(namespace, updates, None, e)
+                    else:
+                        flushed.add(namespace, updates, result, None)
+
+            result = flushed.to_result()
+
+        if self._on_flush is not None:
+            self._on_flush(result)
+
+        return result
+
+    async def close(self) -> UpdateManyResult:
+        """
+        Sends the pending patches, and waits for them to be applied.
+        No patches can be made afterwards.
+        """
+        self._closed = True
+        result = await self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        return result
+
+    def _take_pending(self) -> _PendingPatches:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending = self._pending
+        self._pending = _PendingPatches()
+        return pending
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        task = asyncio.ensure_future(self.flush())
+        # keep a reference, so that the task is not garbage collected
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
@@ -0,0 +1,660 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from upstash_vector.codec import JSONCodec
+from upstash_vector.errors import ClientError
+
+_CacheKey = Tuple[str, bytes]
+
+_QUERY_DEFAULTS = {
+    "topK": 10,
+    "includeVectors": False,
+    "includeMetadata": False,
+    "includeData": False,
+    "filter": "",
+}
+
+
+class _Entry:
+    __slots__ = ("value", "size", "expires_at")
+
+    def __init__(self, value: Any, size: int, expires_at: float):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+
+class _GenerationalCache:
+    """
+    Keeps track of the writes to the namespaces, so that the results of
+    the requests in flight during a write are not cached.
+    """
+
+    def __init__(self, ttl: Optional[float]) -> None:
+        if ttl is not None and ttl <= 0:
+            raise ClientError("ttl must be greater than 0")
+
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        # bumped on each invalidation of all namespaces
+        self._epoch = 0
+        # bumped on each invalidation of a namespace
+        self._generations: Dict[str, int] = {}
+
+        self.hits = 0
+        """Number of queries served from the cache."""
+
+        self.misses = 0
+        """Number of queries not found in the cache."""
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """
+        Removes the cached results of the given namespace, or all
+        of them when no namespace is given.
+        """
+        with self._lock:
+            if namespace is None:
+                self._epoch += 1
+            else:
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+            self._remove_namespace(namespace)
+
+    def _generation(self, namespace: str) -> Tuple[int, int]:
+        with self._lock:
+            return self._epoch, self._generations.get(namespace, 0)
+
+    def _is_current(self, namespace: str, generation: Tuple[int, int]) -> bool:
+        # must be called with the lock held
+        return generation == (self._epoch, self._generations.get(namespace, 0))
+
+    def _expires_at(self) -> float:
+        return float("inf") if self._ttl is None else time.monotonic() + self._ttl
+
+    def _remove_namespace(self, namespace: Optional[str]) -> None:
+        raise NotImplementedError("_remove_namespace")
+
+
+class _BaseQueryCache(_GenerationalCache):
+    def _key(
+        self, codec: JSONCodec, namespace: str, path: str, payload: Dict[str, Any]
+    ) -> Optional[Any]:
+        """Returns the key of the query, or `None` if it cannot be cached."""
+        raise NotImplementedError("_key")
+
+    def _get(self, key: Any) -> Optional[Any]:
+        raise NotImplementedError("_get")
+
+    def _put(
+        self, codec: JSONCodec, key: Any, value: Any, generation: Tuple[int, int]
+    ) -> None:
+        raise NotImplementedError("_put")
+
+
+def _digest(codec: JSONCodec, path: str, payload: Dict[str, Any]) -> bytes:
+    # fill in the defaults omitted by `query_many`, so that the same
+    # query is cached under the same key regardless of how it is made
+    canonical = dict(sorted({**_QUERY_DEFAULTS, **payload}.items()))
+    digest = hashlib.blake2b(path.encode(), digest_size=16)
+    digest.update(codec.dumps(canonical))
+    return digest.digest()
+
+
+class QueryCache(_BaseQueryCache):
+    """
+    Client-side cache for the query results, with LRU eviction,
+    a time to live, and a memory cap.
+
+    The results are cached per query, keyed on a hash of the query
+    payload (the vector, filter, `top_k`, include flags, weighting and
+    fusion options), the endpoint, and the namespace. So, the queries of
+    a `query_many` call are looked up one by one, and only the missing
+    ones are sent to the server.
+
+    Writes made through the clients the cache is given to (`upsert`,
+    `update`, `delete`, `reset`, and their bulk variants) invalidate the
+    cached results of the affected namespace. Writes made by other
+    clients are only reflected once the entries expire.
+
+    The same cache can be shared by many `Index` and `AsyncIndex`
+    instances of the same index, across threads and coroutines.
+
+    Example usage:
+
+    ```python
+    from upstash_vector import Index
+    from upstash_vector.cache import QueryCache
+
+    cache = QueryCache(max_entries=10_000, ttl=300, max_bytes=64 * 1024 * 1024)
+    index = Index(url=<url>, token=<token>, query_cache=cache)
+
+    index.query(data="hello")  # sent to the server
+    index.query(data="hello")  # served from the cache
+    ```
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: Optional[float] = 60.0,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+    ):
+        """
+        :param max_entries: Maximum number of query results to keep.
+        :param ttl: How long the results are served from the cache, in seconds. When `None`, they do not expire.
+        :param max_bytes: Maximum total size of the results to keep, approximated by their size in JSON.
+        """
+        super().__init__(ttl)
+
+        if max_entries <= 0:
+            raise ClientError("max_entries must be greater than 0")
+
+        if max_bytes is not None and max_bytes <= 0:
+            raise ClientError("max_bytes must be greater than 0")
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+        self._entries: "OrderedDict[_CacheKey, _Entry]" = OrderedDict()
+        self._keys_by_namespace: Dict[str, Set[_CacheKey]] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Approximate total size of the cached results, in bytes."""
+        return self._size
+
+    def _remove_namespace(self, namespace: Optional[str]) -> None:
+        if namespace is None:
+            self._entries.clear()
+            self._keys_by_namespace.clear()
+            self._size = 0
+            return
+
+        for key in self._keys_by_namespace.pop(namespace, ()):
+            entry = self._entries.pop(key)
+            self._size -= entry.size
+
+    def _key(
+        self, codec: JSONCodec, namespace: str, path: str, payload: Dict[str, Any]
+    ) -> Optional[_CacheKey]:
+        return namespace, _digest(codec, path, payload)
+
+    def _get(self, key: _CacheKey) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def _put(
+        self,
+        codec: JSONCodec,
+        key: _CacheKey,
+        value: Any,
+        generation: Tuple[int, int],
+    ) -> None:
+        size = len(codec.dumps(value))
+        if self._max_bytes is not None and size > self._max_bytes:
+            return
+
+        expires_at = self._expires_at()
+
+        with self._lock:
+            namespace = key[0]
+            if not self._is_current(namespace, generation):
+                # the namespace is written to while the query is in flight
+                return
+
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = _Entry(value, size, expires_at)
+            self._keys_by_namespace.setdefault(namespace, set()).add(key)
+            self._size += size
+
+            while len(self._entries) > self._max_entries or (
+                self._max_bytes is not None and self._size > self._max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: _CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+        keys = self._keys_by_namespace[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_namespace[key[0]]
+
+
+class SemanticQueryCache(_BaseQueryCache):
+    """
+    Client-side cache for the results of the vector queries, which also
+    serves the queries that are close to a cached one.
+
+    When a query vector is within `max_distance` cosine distance of
+    a cached query vector, and the rest of the query (the filter, `top_k`,
+    include flags, sparse vector, weighting and fusion options) and the
+    namespace are the same, the cached results are returned. The lookup
+    is vectorized over a matrix of the cached query vectors, and the
+    least recently used entries are evicted once `max_entries` is reached.
+
+    Data queries are not cached, as their vectors are not known on the
+    client side. Requires `numpy` to be installed.
+
+    As with the `QueryCache`, writes made through the clients the cache
+    is given to invalidate the cached results of the affected namespace.
+
+    Example usage:
+
+    ```python
+    from upstash_vector import Index
+    from upstash_vector.cache import SemanticQueryCache
+
+    cache = SemanticQueryCache(max_entries=10_000, max_distance=0.02)
+    index = Index(url=<url>, token=<token>, semantic_cache=cache)
+
+    index.query(vector=embed("what is the capital of France?"))
+    index.query(vector=embed("what's the capital of France"))  # served from the cache
+    ```
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_distance: float = 0.05,
+        ttl: Optional[float] = 60.0,
+    ):
+        """
+        :param max_entries: Maximum number of query results to keep.
+        :param max_distance: Maximum cosine distance between the query vectors to serve from the cache.
+        :param ttl: How long the results are served from the cache, in seconds. When `None`, they do not expire.
+        """
+        import numpy as np
+
+        super().__init__(ttl)
+
+        if max_entries <= 0:
+            raise ClientError("max_entries must be greater than 0")
+
+        if not 0 <= max_distance < 2:
+            raise ClientError("max_distance must be between 0 and 2")
+
+        self._np = np
+        self._max_entries = max_entries
+        self._min_similarity = 1 - max_distance
+
+        # allocated on the first put, once the dimension is known
+        self._vectors: Optional[np.ndarray] = None
+        self._contexts = np.zeros(max_entries, dtype=np.int64)
+        self._namespaces = np.empty(max_entries, dtype=object)
+        self._expiry = np.full(max_entries, -np.inf)
+        self._last_used = np.zeros(max_entries, dtype=np.int64)
+        self._results: List[Any] = [None] * max_entries
+        self._count = 0
+        self._clock = 0
+
+    def __len__(self) -> int:
+        now = time.monotonic()
+        return int((self._expiry[: self._count] > now).sum())
+
+    def _remove_namespace(self, namespace: Optional[str]) -> None:
+        if namespace is None:
+            removed = slice(None)
+        else:
+            removed = self._namespaces == namespace
+
+        self._expiry[removed] = -self._np.inf
+
+    def _key(
+        self, codec: JSONCodec, namespace: str, path: str, payload: Dict[str, Any]
+    ) -> Optional[Tuple[str, int, Any]]:
+        vector = payload.get("vector")
+        if vector is None:
+            return None
+
+        np = self._np
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if vector.ndim != 1 or norm == 0:
+            return None
+
+        if self._vectors is not None and self._vectors.shape[1] != vector.shape[0]:
+            return None
+
+        # rest of the query, the endpoint, and the namespace
+        rest = {k: v for k, v in payload.items() if k != "vector"}
+        digest = _digest(codec, f"{path}/{namespace}", rest)
+        context = int.from_bytes(digest[:8], "little", signed=True)
+        return namespace, context, vector / norm
+
+    def _get(self, key: Tuple[str, int, Any]) -> Optional[Any]:
+        np = self._np
+        namespace, context, vector = key
+
+        with self._lock:
+            n = self._count
+            if self._vectors is None or n == 0:
+                self.misses += 1
+                return None
+
+            valid = (self._contexts[:n] == context) & (
+                self._expiry[:n] > time.monotonic()
+            )
+            if not valid.any():
+                self.misses += 1
+                return None
+
+            similarities = np.where(valid, self._vectors[:n] @ vector, -np.inf)
+            best = int(np.argmax(similarities))
+            if similarities[best] < self._min_similarity:
+                self.misses += 1
+                return None
+
+            self._clock += 1
+            self._last_used[best] = self._clock
+            self.hits += 1
+            return self._results[best]
+
+    def _put(
+        self,
+        codec: JSONCodec,
+        key: Tuple[str, int, Any],
+        value: Any,
+        generation: Tuple[int, int],
+    ) -> None:
+        np = self._np
+        namespace, context, vector = key
+
+        with self._lock:
+            if not self._is_current(namespace, generation):
+                return
+
+            if self._vectors is None:
+                self._vectors = np.zeros(
+                    (self._max_entries, vector.shape[0]), dtype=np.float32
+                )
+            elif self._vectors.shape[1] != vector.shape[0]:
+                return
+
+            if self._count < self._max_entries:
+                slot = self._count
+                self._count += 1
+            else:
+                # the expired entries first, then the least recently used one
+                expired = self._expiry <= time.monotonic()
+                slot = int(np.argmin(np.where(expired, -1, self._last_used)))
+
+            self._clock += 1
+            self._vectors[slot] = vector
+            self._contexts[slot] = context
+            self._namespaces[slot] = namespace
+            self._expiry[slot] = self._expires_at()
+            self._last_used[slot] = self._clock
+            self._results[slot] = value
+
+
+_FetchKey = Tuple[str, str]
+
+# include flags of the fetch requests, and the fields they control
+_FETCH_FIELDS = (
+    ("includeVectors", ("vector", "sparseVector")),
+    ("includeMetadata", ("metadata",)),
+    ("includeData", ("data",)),
+)
+
+
+class _FetchEntry:
+    __slots__ = ("value", "flags", "size", "expires_at", "frequency")
+
+    def __init__(
+        self, value: Any, flags: Tuple[bool, ...], size: int, expires_at: float
+    ):
+        self.value = value
+        self.flags = flags
+        self.size = size
+        self.expires_at = expires_at
+        self.frequency = 1
+
+
+def _fetch_flags(payload: Dict[str, Any]) -> Tuple[bool, ...]:
+    return tuple(bool(payload.get(flag)) for flag, _ in _FETCH_FIELDS)
+
+
+class FetchCache(_GenerationalCache):
+    """
+    Client-side cache for the fetched vectors, keyed on their ids, with
+    LRU or LFU eviction, a time to live, and a memory cap.
+
+    A cached vector is only served to the fetches that do not ask for more
+    than it is fetched with. For example, a vector fetched without its
+    vector values is never served to a fetch that includes the vectors,
+    while a vector fetched with everything is served to all the fetches,
+    with the fields that are not asked for left out. Only the ids missing
+    from the cache are sent to the server. The ids that do not exist are
+    not cached.
+
+    Writes made through the clients the cache is given to invalidate the
+    cached vectors of the written ids (`upsert` and `update`), of the
+    deleted ids (`delete`), or of the whole namespace (`delete` with a
+    prefix or a filter, and `reset`). Writes made by other clients are only
+    reflected once the entries expire.
+
+    Example usage:
+
+    ```python
+    from upstash_vector import Index
+    from upstash_vector.cache import FetchCache
+
+    cache = FetchCache(max_entries=100_000, ttl=600, policy="lfu")
+    index = Index(url=<url>, token=<token>, fetch_cache=cache)
+
+    index.fetch(["id1", "id2"], include_metadata=True)  # sent to the server
+    index.fetch(["id1", "id3"], include_metadata=True)  # only id3 is sent
+    ```
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl: Optional[float] = 60.0,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+        policy: str = "lru",
+    ):
+        """
+        :param max_entries: Maximum number of vectors to keep.
+        :param ttl: How long the vectors are served from the cache, in seconds. When `None`, they do not expire.
+        :param max_bytes: Maximum total size of the vectors to keep, approximated by their size in JSON.
+        :param policy: Eviction policy, either `lru` (least recently used) or `lfu` (least frequently used).
+        """
+        super().__init__(ttl)
+
+        if max_entries <= 0:
+            raise ClientError("max_entries must be greater than 0")
+
+        if max_bytes is not None and max_bytes <= 0:
+            raise ClientError("max_bytes must be greater than 0")
+
+        if policy not in ("lru", "lfu"):
+            raise ClientError(f"Unsupported eviction policy: {policy}")
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._lfu = policy == "lfu"
+
+        # in the order of use, for the LRU policy
+        self._entries: "OrderedDict[_FetchKey, _FetchEntry]" = OrderedDict()
+        # keys by their frequency of use, in the order of use, for the LFU policy
+        self._frequencies: "Dict[int, OrderedDict[_FetchKey, None]]" = {}
+        self._min_frequency = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Approximate total size of the cached vectors, in bytes."""
+        return self._size
+
+    def invalidate_ids(self, namespace: str, ids: Iterable[str]) -> None:
+        """
+        Removes the cached vectors of the given ids in the namespace.
+        """
+        with self._lock:
+            # the fetches in flight may have read the old values
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+            for id in ids:
+                key = (namespace, str(id))
+                if key in self._entries:
+                    self._remove(key)
+
+    def _remove_namespace(self, namespace: Optional[str]) -> None:
+        if namespace is None:
+            self._entries.clear()
+            self._frequencies.clear()
+            self._min_frequency = 0
+            self._size = 0
+            return
+
+        for key in [key for key in self._entries if key[0] == namespace]:
+            self._remove(key)
+
+    def _get_many(
+        self, namespace: str, ids: List[str], payload: Dict[str, Any]
+    ) -> List[Optional[Any]]:
+        """
+        Returns the cached vectors of the ids, with only the fields the
+        payload asks for, or `None` for the ones that cannot be served.
+        """
+        flags = _fetch_flags(payload)
+        now = time.monotonic()
+        results: List[Optional[Any]] = []
+
+        with self._lock:
+            for id in ids:
+                key = (namespace, str(id))
+                entry = self._entries.get(key)
+                if entry is not None and entry.expires_at <= now:
+                    self._remove(key)
+                    entry = None
+
+                if entry is None or not all(
+                    has or not wants for has, wants in zip(entry.flags, flags)
+                ):
+                    self.misses += 1
+                    results.append(None)
+                    continue
+
+                self._touch(key, entry)
+                self.hits += 1
+                results.append(_strip(entry.value, entry.flags, flags))
+
+        return results
+
+    def _put_many(
+        self,
+        codec: JSONCodec,
+        namespace: str,
+        values: List[Any],
+        payload: Dict[str, Any],
+        generation: Tuple[int, int],
+    ) -> None:
+        flags = _fetch_flags(payload)
+        expires_at = self._expires_at()
+        sized = [(value, len(codec.dumps(value))) for value in values if value]
+
+        with self._lock:
+            if not self._is_current(namespace, generation):
+                # the namespace is written to while the fetch is in flight
+                return
+
+            for value, size in sized:
+                if self._max_bytes is not None and size > self._max_bytes:
+                    continue
+
+                key = (namespace, str(value["id"]))
+                if key in self._entries:
+                    self._remove(key)
+
+                # evict before inserting, so that the new entry is not the victim
+                while self._entries and (
+                    len(self._entries) >= self._max_entries
+                    or (
+                        self._max_bytes is not None
+                        and self._size + size > self._max_bytes
+                    )
+                ):
+                    self._remove(self._victim())
+
+                self._entries[key] = _FetchEntry(value, flags, size, expires_at)
+                self._size += size
+                if self._lfu:
+                    self._frequencies.setdefault(1, OrderedDict())[key] = None
+                    self._min_frequency = 1
+
+    def _touch(self, key: _FetchKey, entry: _FetchEntry) -> None:
+        if not self._lfu:
+            self._entries.move_to_end(key)
+            return
+
+        frequency = entry.frequency
+        self._unlink(key, frequency)
+        entry.frequency = frequency + 1
+        self._frequencies.setdefault(frequency + 1, OrderedDict())[key] = None
+        if frequency == self._min_frequency and frequency not in self._frequencies:
+            self._min_frequency = frequency + 1
+
+    def _victim(self) -> _FetchKey:
+        if self._lfu:
+            return next(iter(self._frequencies[self._min_frequency]))
+
+        return next(iter(self._entries))
+
+    def _unlink(self, key: _FetchKey, frequency: int) -> None:
+        keys = self._frequencies[frequency]
+        del keys[key]
+        if not keys:
+            del self._frequencies[frequency]
+
+    def _remove(self, key: _FetchKey) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+        if self._lfu:
+            self._unlink(key, entry.frequency)
+            if entry.frequency == self._min_frequency:
+                self._min_frequency = min(self._frequencies, default=0)
+
+
+def _strip(
+    value: Dict[str, Any], has: Tuple[bool, ...], wants: Tuple[bool, ...]
+) -> Dict[str, Any]:
+    # leave out the fields the fetch does not ask for
+    if has == wants:
+        return value
+
+    removed = {
+        field
+        for (_, fields), has_flag, wants_flag in zip(_FETCH_FIELDS, has, wants)
+        if has_flag and not wants_flag
+        for field in fields
+    }
+    return {k: v for k, v in value.items() if k not in removed}
@@ -1,14 +1,151 @@
 from os import environ
-from typing import Any
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 import httpx
 
+from upstash_vector.cache import (
+    FetchCache,
+    QueryCache,
+    SemanticQueryCache,
+    _GenerationalCache,
+)
+from upstash_vector.codec import JSONCodec, default_codec
 from upstash_vector.core.index_operations import AsyncIndexOperations, IndexOperations
 from upstash_vector.http import (
+    Compression,
+    RetryPolicy,
     execute_with_parameters,
     execute_with_parameters_async,
     generate_headers,
 )
+from upstash_vector.errors import ClientError
+from upstash_vector.limiter import AdaptiveConcurrencyLimiter, RateLimiter
+
+DEFAULT_TIMEOUT = httpx.Timeout(timeout=600.0, connect=10.0)
+
+
+def _http_client_options(
+    http_client: Optional[Union[httpx.Client, httpx.AsyncClient]],
+    limits: Optional[httpx.Limits],
+    http2: bool,
+    timeout: Optional[Union[float, httpx.Timeout]],
+) -> Dict[str, Any]:
+    if http_client is not None and (limits is not None or http2 or timeout is not None):
+        raise ClientError(
+            "`limits`, `http2` and `timeout` cannot be set together with `http_client`. "
+            "Configure the given client instead."
+        )
+
+    options: Dict[str, Any] = {
+        "timeout": DEFAULT_TIMEOUT if timeout is None else timeout,
+        "http2": http2,
+    }
+    if limits is not None:
+        options["limits"] = limits
+
+    return options
+
+
+def _operation_of(path: str) -> str:
+    # "/upsert-data/ns" -> "upsert-data", "/reset?all" -> "reset"
+    return path.lstrip("/").split("/", 1)[0].split("?", 1)[0]
+
+
+# endpoints of the operations that the timeouts can be configured for
+_OPERATION_ENDPOINTS: Dict[str, Tuple[str, ...]] = {
+    "upsert": ("upsert", "upsert-data"),
+    "query": (
+        "query",
+        "query-data",
+        "resumable-query",
+        "resumable-query-data",
+        "resumable-query-next",
+        "resumable-query-end",
+    ),
+    "fetch": ("fetch",),
+    "range": ("range",),
+    "update": ("update",),
+    "delete": ("delete",),
+    "reset": ("reset",),
+    "info": ("info",),
+    "list_namespaces": ("list-namespaces",),
+    "delete_namespace": ("delete-namespace",),
+}
+
+
+def _endpoint_timeouts(
+    operation_timeouts: Optional[Dict[str, Union[float, httpx.Timeout]]],
+) -> Dict[str, Union[float, httpx.Timeout]]:
+    """
+    Returns the timeouts of the operations, keyed by their endpoints.
+    """
+    timeouts: Dict[str, Union[float, httpx.Timeout]] = {}
+    for operation, timeout in (operation_timeouts or {}).items():
+        endpoints = _OPERATION_ENDPOINTS.get(operation)
+        if endpoints is None:
+            raise ClientError(
+                f"Unknown operation `{operation}` in `operation_timeouts`. "
+                f"Expected one of: {', '.join(_OPERATION_ENDPOINTS)}."
+            )
+
+        for endpoint in endpoints:
+            timeouts[endpoint] = timeout
+
+    return timeouts
+
+
+_WRITE_OPERATIONS = frozenset(
+    {"upsert", "upsert-data", "update", "delete", "reset", "delete-namespace"}
+)
+
+
+def _written_ids(operation: str, payload: Any) -> Optional[List[str]]:
+    """
+    Returns the ids written by the request, or `None` if it may write
+    to any id in the namespace.
+    """
+    try:
+        if operation in ("upsert", "upsert-data"):
+            return [str(v["id"]) for v in payload]
+
+        if operation == "update":
+            return [str(payload["id"])]
+
+        if operation == "delete" and isinstance(payload.get("ids"), list):
+            return [str(id) for id in payload["ids"]]
+    except (KeyError, TypeError, AttributeError):
+        pass
+
+    return None
+
+
+def _invalidate_caches(
+    path: str,
+    payload: Any,
+    fetch_cache: Optional[FetchCache],
+    *caches: Optional[_GenerationalCache],
+) -> None:
+    operation = _operation_of(path)
+    if operation not in _WRITE_OPERATIONS:
+        return
+
+    namespace: Optional[str]
+    if path.endswith("?all"):
+        namespace = None
+    else:
+        # "/upsert/ns" -> "ns", "/upsert" -> ""
+        _, _, namespace = path.lstrip("/").partition("/")
+
+    for cache in caches:
+        if cache is not None:
+            cache.invalidate(namespace)
+
+    if fetch_cache is not None:
+        ids = None if namespace is None else _written_ids(operation, payload)
+        if ids is None:
+            fetch_cache.invalidate(namespace)
+        else:
+            fetch_cache.invalidate_ids(cast(str, namespace), ids)
 
 
 class Index(IndexOperations):
@@ -24,8 +161,75 @@ class Index(IndexOperations):
 
     # alternatively, configure retry mechanism as well
 
-    # retry 5 times, waiting 100ms between consequent requests
+    # retry 5 times, waiting up to 100ms, 200ms, 400ms... between consequent requests
     index = Index(url=<url>, token=<token>, retries=5, retry_interval=0.1)
+
+    # or, configure the retry policy in more detail
+    from upstash_vector.http import RetryPolicy
+    index = Index(
+        url=<url>,
+        token=<token>,
+        retry_policy=RetryPolicy(
+            retries=10,
+            initial_backoff=0.1,
+            max_backoff=5.0,
+            retry_statuses=frozenset({429, 500, 502, 503, 504}),
+            total_timeout=30.0,
+        ),
+    )
+
+    # use a particular JSON codec for the request and response bodies.
+    # by default, orjson or msgspec is used when installed, and the
+    # json module of the standard library otherwise.
+    from upstash_vector.codec import StdlibJSONCodec
+    index = Index(url=<url>, token=<token>, json_codec=StdlibJSONCodec())
+
+    # limit the request rate on the client side. the same limiter
+    # can be shared by many clients, to keep all of them under a quota.
+    from upstash_vector.limiter import RateLimiter
+    limiter = RateLimiter(requests_per_second=100, bytes_per_second=1_000_000)
+    index = Index(url=<url>, token=<token>, rate_limiter=limiter)
+
+    # adapt the number of requests in flight to the latencies observed
+    from upstash_vector.limiter import AdaptiveConcurrencyLimiter
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=64)
+    index = Index(url=<url>, token=<token>, concurrency_limiter=limiter)
+
+    # configure the connection pool, HTTP/2, and the timeouts.
+    # HTTP/2 requires the `http2` extra to be installed.
+    import httpx
+    index = Index(
+        url=<url>,
+        token=<token>,
+        limits=httpx.Limits(
+            max_connections=200,
+            max_keepalive_connections=100,
+            keepalive_expiry=60.0,
+        ),
+        http2=True,
+        timeout=httpx.Timeout(timeout=60.0, connect=5.0),
+        operation_timeouts={"query": 5.0, "upsert": 120.0},
+    )
+
+    # or, use a client configured as needed
+    index = Index(url=<url>, token=<token>, http_client=httpx.Client(...))
+
+    # compress the request bodies larger than 16KB
+    from upstash_vector.http import Compression
+    index = Index(url=<url>, token=<token>, compression=Compression("gzip"))
+
+    # cache the query results on the client side
+    from upstash_vector.cache import QueryCache
+    index = Index(url=<url>, token=<token>, query_cache=QueryCache(ttl=300))
+
+    # serve the queries close to a cached one from the cache as well
+    from upstash_vector.cache import SemanticQueryCache
+    cache = SemanticQueryCache(max_distance=0.02)
+    index = Index(url=<url>, token=<token>, semantic_cache=cache)
+
+    # cache the fetched vectors on the client side
+    from upstash_vector.cache import FetchCache
+    index = Index(url=<url>, token=<token>, fetch_cache=FetchCache(policy="lfu"))
     ```
     """
 
@@ -36,28 +240,60 @@ class Index(IndexOperations):
         retries: int = 3,
         retry_interval: float = 1.0,
         allow_telemetry: bool = True,
+        json_codec: Optional[JSONCodec] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        http_client: Optional[httpx.Client] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        timeout: Optional[Union[float, httpx.Timeout]] = None,
+        operation_timeouts: Optional[Dict[str, Union[float, httpx.Timeout]]] = None,
+        compression: Optional[Compression] = None,
+        query_cache: Optional[QueryCache] = None,
+        semantic_cache: Optional[SemanticQueryCache] = None,
+        fetch_cache: Optional[FetchCache] = None,
     ):
         self._url = url
-        self._client = httpx.Client(
-            timeout=httpx.Timeout(
-                timeout=600.0,
-                connect=10.0,
-            )
+        options = _http_client_options(http_client, limits, http2, timeout)
+        self._client = http_client or httpx.Client(**options)
+        self._timeouts = _endpoint_timeouts(operation_timeouts)
+        self._compression = compression
+        self._query_cache = query_cache
+        self._semantic_cache = semantic_cache
+        self._fetch_cache = fetch_cache
+        self._retry_policy = retry_policy or RetryPolicy(
+            retries=retries,
+            initial_backoff=retry_interval,
         )
-        self._retries = retries
-        self._retry_interval = retry_interval
         self._headers = generate_headers(token, allow_telemetry)
+        self._codec = json_codec or default_codec()
+        self._rate_limiter = rate_limiter
+        self._concurrency_limiter = concurrency_limiter
 
     def _execute_request(self, payload: Any = "", path: str = ""):
         url_with_path = f"{self._url}{path}"
-        return execute_with_parameters(
-            url=url_with_path,
-            client=self._client,
-            headers=self._headers,
-            retries=self._retries,
-            retry_interval=self._retry_interval,
-            payload=payload,
-        )
+        try:
+            return execute_with_parameters(
+                url=url_with_path,
+                client=self._client,
+                headers=self._headers,
+                retry_policy=self._retry_policy,
+                payload=payload,
+                codec=self._codec,
+                rate_limiter=self._rate_limiter,
+                concurrency_limiter=self._concurrency_limiter,
+                timeout=self._timeouts.get(_operation_of(path)),
+                compression=self._compression,
+            )
+        finally:
+            _invalidate_caches(
+                path,
+                payload,
+                self._fetch_cache,
+                self._query_cache,
+                self._semantic_cache,
+            )
 
     @classmethod
     def from_env(
@@ -65,9 +301,12 @@ class Index(IndexOperations):
         retries: int = 3,
         retry_interval: float = 1.0,
         allow_telemetry: bool = True,
+        **kwargs: Any,
     ) -> "Index":
         """
         Load the credentials from environment, and returns a client.
+
+        Rest of the keyword arguments are passed to the constructor.
         """
 
         return cls(
@@ -76,6 +315,7 @@ class Index(IndexOperations):
             retries,
             retry_interval,
             allow_telemetry,
+            **kwargs,
         )
 
 
@@ -92,8 +332,75 @@ class AsyncIndex(AsyncIndexOperations):
 
     # alternatively, configure retry mechanism as well
 
-    # retry 5 times, waiting 100ms between consequent requests
+    # retry 5 times, waiting up to 100ms, 200ms, 400ms... between consequent requests
     index = AsyncIndex(url=<url>, token=<token>, retries=5, retry_interval=0.1)
+
+    # or, configure the retry policy in more detail
+    from upstash_vector.http import RetryPolicy
+    index = AsyncIndex(
+        url=<url>,
+        token=<token>,
+        retry_policy=RetryPolicy(
+            retries=10,
+            initial_backoff=0.1,
+            max_backoff=5.0,
+            retry_statuses=frozenset({429, 500, 502, 503, 504}),
+            total_timeout=30.0,
+        ),
+    )
+
+    # use a particular JSON codec for the request and response bodies.
+    # by default, orjson or msgspec is used when installed, and the
+    # json module of the standard library otherwise.
+    from upstash_vector.codec import StdlibJSONCodec
+    index = AsyncIndex(url=<url>, token=<token>, json_codec=StdlibJSONCodec())
+
+    # limit the request rate on the client side. the same limiter
+    # can be shared by many clients, to keep all of them under a quota.
+    from upstash_vector.limiter import RateLimiter
+    limiter = RateLimiter(requests_per_second=100, bytes_per_second=1_000_000)
+    index = AsyncIndex(url=<url>, token=<token>, rate_limiter=limiter)
+
+    # adapt the number of requests in flight to the latencies observed
+    from upstash_vector.limiter import AdaptiveConcurrencyLimiter
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=64)
+    index = AsyncIndex(url=<url>, token=<token>, concurrency_limiter=limiter)
+
+    # configure the connection pool, HTTP/2, and the timeouts.
+    # HTTP/2 requires the `http2` extra to be installed.
+    import httpx
+    index = AsyncIndex(
+        url=<url>,
+        token=<token>,
+        limits=httpx.Limits(
+            max_connections=200,
+            max_keepalive_connections=100,
+            keepalive_expiry=60.0,
+        ),
+        http2=True,
+        timeout=httpx.Timeout(timeout=60.0, connect=5.0),
+        operation_timeouts={"query": 5.0, "upsert": 120.0},
+    )
+
+    # or, use a client configured as needed
+    index = AsyncIndex(url=<url>, token=<token>, http_client=httpx.AsyncClient(...))
+
+    # compress the request bodies larger than 16KB
+    from upstash_vector.http import Compression
+    index = AsyncIndex(url=<url>, token=<token>, compression=Compression("gzip"))
+
+    # cache the query results on the client side
+    from upstash_vector.cache import QueryCache
+    index = AsyncIndex(url=<url>, token=<token>, query_cache=QueryCache(ttl=300))
+
+    # serve the queries close to a cached one from the cache as well
+    from upstash_vector.cache import SemanticQueryCache
+    cache = SemanticQueryCache(max_distance=0.02)
+    index = AsyncIndex(url=<url>, token=<token>, semantic_cache=cache)
+
+    # cache the fetched vectors on the client side
+    from upstash_vector.cache import FetchCache
+    index = AsyncIndex(url=<url>, token=<token>, fetch_cache=FetchCache(policy="lfu"))
     ```
     """
 
@@ -104,28 +411,60 @@ class AsyncIndex(AsyncIndexOperations):
         retries: int = 3,
         retry_interval: float = 1.0,
         allow_telemetry: bool = True,
+        json_codec: Optional[JSONCodec] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        timeout: Optional[Union[float, httpx.Timeout]] = None,
+        operation_timeouts: Optional[Dict[str, Union[float, httpx.Timeout]]] = None,
+        compression: Optional[Compression] = None,
+        query_cache: Optional[QueryCache] = None,
+        semantic_cache: Optional[SemanticQueryCache] = None,
+        fetch_cache: Optional[FetchCache] = None,
     ):
         self._url = url
-        self._client = httpx.AsyncClient(
-            timeout=httpx.Timeout(
-                timeout=600.0,
-                connect=10.0,
-            )
+        options = _http_client_options(http_client, limits, http2, timeout)
+        self._client = http_client or httpx.AsyncClient(**options)
+        self._timeouts = _endpoint_timeouts(operation_timeouts)
+        self._compression = compression
+        self._query_cache = query_cache
+        self._semantic_cache = semantic_cache
+        self._fetch_cache = fetch_cache
+        self._retry_policy = retry_policy or RetryPolicy(
+            retries=retries,
+            initial_backoff=retry_interval,
         )
-        self._retries = retries
-        self._retry_interval = retry_interval
         self._headers = generate_headers(token, allow_telemetry)
+        self._codec = json_codec or default_codec()
+        self._rate_limiter = rate_limiter
+        self._concurrency_limiter = concurrency_limiter
 
     async def _execute_request_async(self, payload: Any = "", path: str = ""):
         url_with_path = f"{self._url}{path}"
-        return await execute_with_parameters_async(
-            client=self._client,
-            url=url_with_path,
-            headers=self._headers,
-            retries=self._retries,
-            retry_interval=self._retry_interval,
-            payload=payload,
-        )
+        try:
+            return await execute_with_parameters_async(
+                client=self._client,
+                url=url_with_path,
+                headers=self._headers,
+                retry_policy=self._retry_policy,
+                payload=payload,
+                codec=self._codec,
+                rate_limiter=self._rate_limiter,
+                concurrency_limiter=self._concurrency_limiter,
+                timeout=self._timeouts.get(_operation_of(path)),
+                compression=self._compression,
+            )
+        finally:
+            _invalidate_caches(
+                path,
+                payload,
+                self._fetch_cache,
+                self._query_cache,
+                self._semantic_cache,
+            )
 
     @classmethod
     def from_env(
@@ -133,9 +472,12 @@ class AsyncIndex(AsyncIndexOperations):
         retries: int = 3,
         retry_interval: float = 1.0,
         allow_telemetry: bool = True,
+        **kwargs: Any,
     ) -> "AsyncIndex":
         """
         Load the credentials from environment, and returns a client.
+
+        Rest of the keyword arguments are passed to the constructor.
         """
 
         return cls(
@@ -144,4 +486,5 @@ class AsyncIndex(AsyncIndexOperations):
             retries,
             retry_interval,
             allow_telemetry,
+            **kwargs,
         )
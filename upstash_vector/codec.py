@@ -0,0 +1,97 @@
+import json
+from typing import Any, Protocol
+
+
+class JSONCodec(Protocol):
+    """
+    Encodes the request bodies to, and decodes the response
+    bodies from JSON.
+    """
+
+    serializes_numpy: bool
+    """
+    Whether numpy arrays can be encoded natively, without converting
+    them to lists first.
+    """
+
+    def dumps(self, obj: Any) -> bytes: ...
+
+    def loads(self, data: bytes) -> Any: ...
+
+
+def _default(obj: Any) -> Any:
+    # numpy and pandas arrays, and numpy scalars
+    if hasattr(obj, "tolist") and callable(obj.tolist):
+        return obj.tolist()
+
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+class StdlibJSONCodec:
+    """
+    JSON codec using the `json` module of the standard library.
+    """
+
+    serializes_numpy = False
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), default=_default).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """
+    JSON codec using the `orjson` library.
+
+    Encodes numpy arrays natively.
+    """
+
+    serializes_numpy = True
+
+    def __init__(self) -> None:
+        import orjson  # type: ignore[import-not-found]
+
+        self._orjson = orjson
+        self._options = orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, default=_default, option=self._options)
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec:
+    """
+    JSON codec using the `msgspec` library.
+    """
+
+    serializes_numpy = False
+
+    def __init__(self) -> None:
+        import msgspec  # type: ignore[import-not-found]
+
+        self._encoder = msgspec.json.Encoder(enc_hook=_default)
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+
+def default_codec() -> JSONCodec:
+    """
+    Returns the fastest JSON codec available, trying
+    `orjson`, `msgspec`, and the standard library in order.
+    """
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec()
+        except ImportError:
+            continue
+
+    return StdlibJSONCodec()
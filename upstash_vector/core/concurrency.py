@@ -0,0 +1,211 @@
+import asyncio
+import dataclasses
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from upstash_vector.errors import ClientError
+from upstash_vector.types import BatchError, BatchProgress
+from upstash_vector.utils import to_async_iterable
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def run_batches(
+    fn: Callable[[T], R],
+    batches: Iterable[T],
+    max_workers: int,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[Tuple[int, T, Optional[R], Optional[Exception]]]:
+    """
+    Runs `fn` for each batch over a bounded thread pool.
+
+    Batches are pulled from the iterable lazily, and at most `max_in_flight`
+    of them (twice the `max_workers`, if not set) are submitted or running at
+    the same time, so that the memory usage does not depend on the
+    number of batches.
+
+    Yields `(batch index, batch, result, error)` tuples in the order
+    the batches complete. Exactly one of the result or the error is set.
+    """
+    if max_workers <= 0:
+        raise ClientError("max_workers must be greater than 0")
+
+    if max_in_flight is None:
+        max_in_flight = 2 * max_workers
+    elif max_in_flight < max_workers:
+        raise ClientError("max_in_flight must not be less than max_workers")
+
+    iterator = enumerate(batches)
+    exhausted = False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: Dict[Future, Tuple[int, T]] = {}
+
+        while True:
+            while not exhausted and len(pending) < max_in_flight:
+                try:
+                    i, batch = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+
+                pending[executor.submit(fn, batch)] = (i, batch)
+
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                i, batch = pending.pop(future)
+                yield i, batch, *future_outcome(future)
+
+
+async def run_batches_async(
+    fn: Callable[[T], Awaitable[R]],
+    batches: Union[Iterable[T], AsyncIterable[T]],
+    max_workers: int,
+) -> AsyncIterator[Tuple[int, T, Optional[R], Optional[Exception]]]:
+    """
+    Runs `fn` for each batch concurrently, with at most `max_workers`
+    of them in flight at the same time.
+
+    Batches are pulled from the iterable lazily, only when there is
+    room for a new one.
+
+    Yields `(batch index, batch, result, error)` tuples in the order
+    the batches complete. Exactly one of the result or the error is set.
+    """
+    if max_workers <= 0:
+        raise ClientError("max_workers must be greater than 0")
+
+    iterator = to_async_iterable(batches).__aiter__()
+    exhausted = False
+    i = 0
+    pending: Dict[asyncio.Future, Tuple[int, T]] = {}
+
+    try:
+        while True:
+            while not exhausted and len(pending) < max_workers:
+                try:
+                    batch = await iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+
+                pending[asyncio.ensure_future(fn(batch))] = (i, batch)
+                i += 1
+
+            if not pending:
+                return
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                j, batch = pending.pop(future)
+                yield j, batch, *future_outcome(future)
+    finally:
+        for future in pending:
+            future.cancel()
+
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+def future_outcome(
+    future: Union[Future, asyncio.Future],
+) -> Tuple[Optional[R], Optional[Exception]]:
+    error = future.exception()
+    if error is None:
+        return future.result(), None
+
+    if not isinstance(error, Exception):
+        raise error
+
+    return None, error
+
+
+class BatchCollector(Generic[R]):
+    """
+    Collects the outcomes of the batches in the order they complete,
+    and reports the progress after each one.
+    """
+
+    def __init__(
+        self,
+        on_progress: Optional[Callable[[BatchProgress], None]],
+        keep_results: bool = True,
+    ):
+        self._on_progress = on_progress
+        self._keep_results = keep_results
+        self._results: Dict[int, R] = {}
+        self._errors: List[BatchError] = []
+        self.progress = BatchProgress(
+            completed_batches=0,
+            failed_batches=0,
+            completed_items=0,
+            failed_items=0,
+        )
+
+    def add(
+        self,
+        batch: int,
+        ids: List[Union[int, str]],
+        result: Optional[R],
+        error: Optional[Exception],
+    ) -> None:
+        if error is not None:
+            self._errors.append(BatchError(batch=batch, ids=ids, error=error))
+            self.progress.failed_batches += 1
+            self.progress.failed_items += len(ids)
+        else:
+            if self._keep_results:
+                self._results[batch] = result  # type: ignore[assignment]
+
+            self.progress.completed_batches += 1
+            self.progress.completed_items += len(ids)
+
+        if self._on_progress is not None:
+            self._on_progress(dataclasses.replace(self.progress))
+
+    @property
+    def results(self) -> List[R]:
+        """Results of the successful batches, in the order the batches are created."""
+        return [self._results[i] for i in sorted(self._results)]
+
+    @property
+    def errors(self) -> List[BatchError]:
+        """Failed batches, in the order the batches are created."""
+        return sorted(self._errors, key=lambda e: e.batch)
+
+
+def adapt_page_size(
+    limit: int,
+    latency: float,
+    target_latency: float,
+    max_limit: int,
+) -> int:
+    """
+    Scales the page size so that fetching a page takes about `target_latency`
+    seconds, at most doubling or halving it at each step to damp the noise
+    in the observed latencies.
+    """
+    if latency <= 0:
+        scaled = 2 * limit
+    else:
+        scaled = int(limit * target_latency / latency)
+
+    return max(1, min(max_limit, 2 * limit, max(limit // 2, scaled)))
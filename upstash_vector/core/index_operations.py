@@ -1,43 +1,96 @@
+import asyncio
+import dataclasses
+import heapq
+import itertools
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import (
     Any,
+    AsyncIterable,
+    AsyncIterator,
     Awaitable,
     Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
     Tuple,
     Union,
+    cast,
 )
 
+from upstash_vector.cache import (
+    FetchCache,
+    QueryCache,
+    SemanticQueryCache,
+    _BaseQueryCache,
+)
+from upstash_vector.codec import JSONCodec, StdlibJSONCodec
+from upstash_vector.core.concurrency import (
+    BatchCollector,
+    adapt_page_size,
+    future_outcome,
+    run_batches,
+    run_batches_async,
+)
 from upstash_vector.errors import ClientError
 from upstash_vector.types import (
+    BatchProgress,
     Data,
+    DeleteManyResult,
+    DeleteNamespacesResult,
     DeleteResult,
     FetchResult,
     FusionAlgorithm,
     InfoResult,
     MetadataUpdateMode,
+    NamespaceQueryResult,
+    QueryNamespacesResult,
     QueryRequest,
     QueryResult,
     RangeResult,
     SparseVector,
     SupportsToList,
+    SupportsToMatrix,
     TupleAsSparseVectorT,
+    UpdateManyResult,
+    UpdateRequest,
+    UpsertManyResult,
     Vector,
     WeightingStrategy,
     QueryMode,
 )
 from upstash_vector.utils import (
+    frame_to_payload_batches,
+    id_batches,
+    matrix_to_payload_batches,
+    payload_chunks,
+    prefix_partitions,
     query_requests_to_payload,
     sequence_to_vectors,
     to_list,
     to_sparse_vector,
+    update_request_ids,
+    update_request_to_payload,
+    update_to_payload,
     vectors_to_payload,
+    vectors_to_payload_batches,
+    vectors_to_payload_batches_async,
 )
 
 DEFAULT_NAMESPACE = ""
 
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_MAX_BATCH_BYTES = 5 * 1024 * 1024
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_FETCH_BATCH_SIZE = 1000
+
+DEFAULT_RANGE_LIMIT = 100
+DEFAULT_RANGE_MAX_LIMIT = 1000
+DEFAULT_RANGE_TARGET_LATENCY = 0.5
+
 UPSERT_PATH = "/upsert"
 UPSERT_DATA_PATH = "/upsert-data"
 QUERY_PATH = "/query"
@@ -58,16 +111,205 @@ RESUMABLE_QUERY_END_PATH = "/resumable-query-end"
 
 
 def _path_for(namespace: str, path: str) -> str:
-    if namespace == DEFAULT_NAMESPACE or not namespace:
+    if namespace == DEFAULT_NAMESPACE:
         return path
 
     return f"{path}/{namespace}"
 
 
+def _to_fetch_results(vectors: List[Any]) -> List[Optional[FetchResult]]:
+    return [FetchResult._from_json(vector) if vector else None for vector in vectors]
+
+
+class _QueryLookup:
+    """
+    Looks the queries up in the caches in order, and stores the
+    results of the missing ones in all of them.
+    """
+
+    def __init__(
+        self,
+        caches: Sequence[_BaseQueryCache],
+        codec: JSONCodec,
+        namespace: str,
+        path: str,
+        payloads: List[Dict[str, Any]],
+    ):
+        self._caches = caches
+        self._codec = codec
+        self._generations = [cache._generation(namespace) for cache in caches]
+        self._keys = [
+            [cache._key(codec, namespace, path, p) for p in payloads]
+            for cache in caches
+        ]
+
+        self.results: List[Any] = [None] * len(payloads)
+        self.missing: List[int] = []
+        for i in range(len(payloads)):
+            for cache, keys in zip(caches, self._keys):
+                if keys[i] is not None:
+                    self.results[i] = cache._get(keys[i])
+                    if self.results[i] is not None:
+                        break
+            else:
+                self.missing.append(i)
+
+    def store(self, fetched: List[Any]) -> None:
+        for i, result in zip(self.missing, fetched):
+            self.results[i] = result
+            for cache, keys, generation in zip(
+                self._caches, self._keys, self._generations
+            ):
+                if keys[i] is not None:
+                    cache._put(self._codec, keys[i], result, generation)
+
+
+def _send_queries(
+    execute: Callable[[Any, str], Any],
+    payloads: List[Dict[str, Any]],
+    path: str,
+    namespace: str,
+) -> List[Any]:
+    if not payloads:
+        return []
+
+    if len(payloads) == 1:
+        # the server returns a single response, when
+        # the length of the array is 1
+        return [execute(payloads[0], _path_for(namespace, path))]
+
+    return execute(payloads, _path_for(namespace, path))
+
+
+async def _send_queries_async(
+    execute: Callable[[Any, str], Awaitable[Any]],
+    payloads: List[Dict[str, Any]],
+    path: str,
+    namespace: str,
+) -> List[Any]:
+    if not payloads:
+        return []
+
+    if len(payloads) == 1:
+        return [await execute(payloads[0], _path_for(namespace, path))]
+
+    return await execute(payloads, _path_for(namespace, path))
+
+
+def _merge_namespace_results(
+    namespaces: List[str],
+    results: Dict[str, List[QueryResult]],
+    errors: Dict[str, Exception],
+    top_k: int,
+) -> QueryNamespacesResult:
+    for error in errors.values():
+        if isinstance(error, ClientError):
+            # invalid queries fail for all the namespaces alike
+            raise error
+
+    # the results of each namespace are already sorted by score,
+    # so a k-way merge over them is enough for the global top k
+    merged = heapq.merge(
+        *[[(ns, r) for r in results[ns]] for ns in namespaces if ns in results],
+        key=lambda pair: pair[1].score,
+        reverse=True,
+    )
+
+    return QueryNamespacesResult(
+        results=[
+            NamespaceQueryResult(**vars(r), namespace=ns)
+            for ns, r in itertools.islice(merged, top_k)
+        ],
+        errors={ns: errors[ns] for ns in namespaces if ns in errors},
+    )
+
+
+class _NamespaceProgress:
+    """
+    Collects the outcomes of the deletes from the namespaces in the order
+    they complete, and reports the progress after each one.
+    """
+
+    def __init__(self, on_progress: Optional[Callable[[BatchProgress], None]]):
+        self._on_progress = on_progress
+        self._results: Dict[str, int] = {}
+        self._errors: Dict[str, Exception] = {}
+        self.progress = BatchProgress(
+            completed_batches=0,
+            failed_batches=0,
+            completed_items=0,
+            failed_items=0,
+        )
+
+    def add(
+        self, namespace: str, deleted: Optional[int], error: Optional[Exception]
+    ) -> None:
+        if error is not None:
+            if isinstance(error, ClientError):
+                # invalid deletes fail for all the namespaces alike
+                raise error
+
+            self._errors[namespace] = error
+            self.progress.failed_batches += 1
+        else:
+            assert deleted is not None
+            self._results[namespace] = deleted
+            self.progress.completed_batches += 1
+            self.progress.completed_items += deleted
+
+        if self._on_progress is not None:
+            self._on_progress(dataclasses.replace(self.progress))
+
+    def to_result(self) -> DeleteNamespacesResult:
+        return DeleteNamespacesResult(
+            deleted=self.progress.completed_items,
+            results=self._results,
+            errors=self._errors,
+        )
+
+
 class IndexOperations:
+    _codec: JSONCodec = StdlibJSONCodec()
+    _query_cache: Optional[QueryCache] = None
+    _semantic_cache: Optional[SemanticQueryCache] = None
+    _fetch_cache: Optional[FetchCache] = None
+
+    @property
+    def codec(self) -> JSONCodec:
+        """JSON codec the requests are serialized, and the responses are parsed with."""
+        return self._codec
+
     def _execute_request(self, payload, path):
         raise NotImplementedError("execute_request")
 
+    def _execute_queries(
+        self, payloads: List[Dict[str, Any]], path: str, namespace: str
+    ) -> List[Any]:
+        """
+        Executes the queries with the same path in a single request, and
+        returns their raw results in order. When there are query caches,
+        only the queries missing from them are sent.
+        """
+        caches = [
+            cache
+            for cache in (self._query_cache, self._semantic_cache)
+            if cache is not None
+        ]
+        if not caches:
+            return _send_queries(self._execute_request, payloads, path, namespace)
+
+        lookup = _QueryLookup(caches, self._codec, namespace, path, payloads)
+        if lookup.missing:
+            fetched = _send_queries(
+                self._execute_request,
+                [payloads[i] for i in lookup.missing],
+                path,
+                namespace,
+            )
+            lookup.store(fetched)
+
+        return lookup.results
+
     def upsert(
         self,
         vectors: Sequence[Union[Dict, tuple, Vector, Data]],
@@ -145,6 +387,237 @@ class IndexOperations:
 
         return self._execute_request(payload=payload, path=_path_for(namespace, path))
 
+    def upsert_many(
+        self,
+        vectors: Iterable[Union[Dict, tuple, Vector, Data]],
+        namespace: str = DEFAULT_NAMESPACE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batch_bytes: Optional[int] = DEFAULT_MAX_BATCH_BYTES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+    ) -> UpsertManyResult:
+        """
+        Upserts(update or insert) vectors in batches, sending the batches concurrently.
+
+        Accepts the same kinds of vectors with the `upsert` method, from
+        any iterable, including generators. The vectors are converted
+        lazily, and only a bounded number of batches are kept in memory
+        at any time, so that arbitrarily large inputs can be streamed.
+
+        A failing batch does not stop the rest of the batches. The failed
+        batches are reported in the `errors` field of the result.
+
+        :param vectors: The iterable of vectors to upsert.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param batch_size: Maximum number of vectors in a single request.
+        :param max_batch_bytes: Maximum serialized size of a single request in bytes. When set to `None`, batches are only limited by `batch_size`.
+        :param max_workers: Maximum number of requests in flight at the same time.
+        :param on_progress: Callback to call with the overall progress after each batch completes.
+
+        Example usage:
+
+        ```python
+        res = index.upsert_many(
+            vectors=[(f"id-{i}", [0.1 * i, 0.2 * i]) for i in range(100_000)],
+            batch_size=1000,
+            max_workers=8,
+        )
+
+        print(res.upserted)
+        for error in res.errors:
+            print(error.batch, error.ids, error.error)
+        ```
+
+        ```python
+        def read_vectors(path):
+            with open(path) as f:
+                for line in f:
+                    yield json.loads(line)
+
+        res = index.upsert_many(vectors=read_vectors("embeddings.jsonl"))
+        ```
+        """
+        batches = vectors_to_payload_batches(
+            vectors, batch_size, max_batch_bytes, self._codec
+        )
+
+        def upsert_batch(batch: Tuple[List[Dict[str, Any]], bool]) -> str:
+            payload, is_vector = batch
+            path = UPSERT_PATH if is_vector else UPSERT_DATA_PATH
+            return self._execute_request(
+                payload=payload, path=_path_for(namespace, path)
+            )
+
+        collector: BatchCollector[str] = BatchCollector(on_progress)
+        for i, (payload, _), result, error in run_batches(
+            upsert_batch, batches, max_workers
+        ):
+            collector.add(i, [v["id"] for v in payload], result, error)
+
+        return UpsertManyResult(
+            upserted=collector.progress.completed_items,
+            results=collector.results,
+            errors=collector.errors,
+        )
+
+    def upsert_matrix(
+        self,
+        ids: Union[Sequence[Union[int, str]], SupportsToList],
+        vectors: Union[List[List[float]], SupportsToMatrix],
+        metadata: Optional[Sequence[Optional[Dict]]] = None,
+        data: Optional[Sequence[Optional[str]]] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+    ) -> UpsertManyResult:
+        """
+        Upserts(update or insert) dense vectors given as rows of a 2-D matrix,
+        such as a numpy array of shape `(n, d)`, in batches that are sent concurrently.
+
+        Rows are converted to lists for a whole batch at once, which is
+        much faster than upserting the rows one by one with `upsert_many`.
+
+        A failing batch does not stop the rest of the batches. The failed
+        batches are reported in the `errors` field of the result.
+
+        :param ids: The ids of the vectors, one for each row.
+        :param vectors: The matrix of vector values, one row for each vector.
+        :param metadata: The metadata of the vectors, one for each row.
+        :param data: The unstructured data of the vectors, one for each row.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param batch_size: Maximum number of vectors in a single request.
+        :param max_workers: Maximum number of requests in flight at the same time.
+        :param on_progress: Callback to call with the overall progress after each batch completes.
+
+        Example usage:
+
+        ```python
+        import numpy as np
+
+        res = index.upsert_matrix(
+            ids=[f"id-{i}" for i in range(10_000)],
+            vectors=np.random.rand(10_000, 256).astype(np.float32),
+            metadata=[{"i": i} for i in range(10_000)],
+        )
+        ```
+        """
+        batches = matrix_to_payload_batches(
+            ids,
+            vectors,
+            metadata,
+            data,
+            batch_size,
+            convert_rows=not self._codec.serializes_numpy,
+        )
+
+        def upsert_batch(payload: List[Dict[str, Any]]) -> str:
+            return self._execute_request(
+                payload=payload, path=_path_for(namespace, UPSERT_PATH)
+            )
+
+        collector: BatchCollector[str] = BatchCollector(on_progress)
+        for i, payload, result, error in run_batches(
+            upsert_batch, batches, max_workers
+        ):
+            collector.add(i, [v["id"] for v in payload], result, error)
+
+        return UpsertManyResult(
+            upserted=collector.progress.completed_items,
+            results=collector.results,
+            errors=collector.errors,
+        )
+
+    def upsert_dataframe(
+        self,
+        frame: Any,
+        id_column: str = "id",
+        vector_column: Optional[str] = None,
+        sparse_vector_column: Optional[str] = None,
+        metadata_column: Optional[str] = None,
+        metadata_columns: Optional[Sequence[str]] = None,
+        data_column: Optional[str] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+    ) -> UpsertManyResult:
+        """
+        Upserts(update or insert) the rows of a pandas DataFrame or a pyarrow Table,
+        in batches that are sent concurrently.
+
+        The frame is read in batches, column by column, without converting
+        its rows to Python objects first.
+
+        When none of the `vector_column` or `sparse_vector_column` is set, the rows are
+        upserted as raw data, to be embedded by the Upstash-hosted embedding model.
+
+        A failing batch does not stop the rest of the batches. The failed
+        batches are reported in the `errors` field of the result.
+
+        :param frame: The pandas DataFrame or the pyarrow Table to upsert.
+        :param id_column: Name of the column containing the vector ids.
+        :param vector_column: Name of the column containing the dense vectors.
+        :param sparse_vector_column: Name of the column containing the sparse vectors, as `SparseVector`s, `(indices, values)` tuples, or `{"indices": ..., "values": ...}` structs.
+        :param metadata_column: Name of the column containing the metadata dicts.
+        :param metadata_columns: Names of the columns to put into the metadata, keyed with the column names. Missing values are left out, and numpy arrays and scalars are converted to lists and numbers. Other values must be JSON compatible. Cannot be set together with the `metadata_column`.
+        :param data_column: Name of the column containing the unstructured data.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param batch_size: Maximum number of vectors in a single request.
+        :param max_workers: Maximum number of requests in flight at the same time.
+        :param on_progress: Callback to call with the overall progress after each batch completes.
+
+        Example usage:
+
+        ```python
+        import pandas as pd
+
+        df = pd.DataFrame(
+            {
+                "id": ["id-0", "id-1"],
+                "embedding": [[0.1, 0.2], [0.3, 0.4]],
+                "genre": ["fiction", "poetry"],
+                "year": [1999, 2001],
+            }
+        )
+
+        res = index.upsert_dataframe(
+            df,
+            vector_column="embedding",
+            metadata_columns=["genre", "year"],
+        )
+        ```
+        """
+        batches = frame_to_payload_batches(
+            frame,
+            id_column,
+            vector_column,
+            sparse_vector_column,
+            metadata_column,
+            metadata_columns,
+            data_column,
+            batch_size,
+        )
+
+        def upsert_batch(batch: Tuple[List[Dict[str, Any]], bool]) -> str:
+            payload, is_vector = batch
+            path = UPSERT_PATH if is_vector else UPSERT_DATA_PATH
+            return self._execute_request(
+                payload=payload, path=_path_for(namespace, path)
+            )
+
+        collector: BatchCollector[str] = BatchCollector(on_progress)
+        for i, (payload, _), result, error in run_batches(
+            upsert_batch, batches, max_workers
+        ):
+            collector.add(i, [v["id"] for v in payload], result, error)
+
+        return UpsertManyResult(
+            upserted=collector.progress.completed_items,
+            results=collector.results,
+            errors=collector.errors,
+        )
+
     def query(
         self,
         vector: Optional[Union[List[float], SupportsToList]] = None,
@@ -243,18 +716,17 @@ class IndexOperations:
 
             path = QUERY_PATH
 
-        return [
-            QueryResult._from_json(obj)
-            for obj in self._execute_request(
-                payload=payload, path=_path_for(namespace, path)
-            )
-        ]
+        [result] = self._execute_queries([payload], path, namespace)
+        return [QueryResult._from_json(obj) for obj in result]
 
     def query_many(
         self,
         *,
         queries: List[QueryRequest],
         namespace: str = DEFAULT_NAMESPACE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batch_bytes: Optional[int] = DEFAULT_MAX_BATCH_BYTES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> List[List[QueryResult]]:
         """
         Makes a batch query request.
@@ -262,6 +734,16 @@ class IndexOperations:
         The batch should only contain elements whose `data`
         or `vector` fields set.
 
+        Large batches are split into chunks of at most `batch_size` queries
+        and `max_batch_bytes` bytes, which are sent concurrently. The results
+        are returned in the order of the queries.
+
+        :param queries: The queries to make.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param batch_size: Maximum number of queries to send in a request.
+        :param max_batch_bytes: Maximum size of a request body in bytes. When `None`, the requests are only limited by `batch_size`.
+        :param max_workers: Maximum number of requests in flight at the same time.
+
         Example usage:
 
         ```python
@@ -299,15 +781,196 @@ class IndexOperations:
             single_result = self.query(**query, namespace=namespace)
             return [single_result]
 
-        has_vector_query, payload = query_requests_to_payload(queries)
-        path = QUERY_PATH if has_vector_query else QUERY_DATA_PATH
-        result = self._execute_request(payload=payload, path=_path_for(namespace, path))
+        results: List[Any] = [None] * len(queries)
+        for start, chunk_results in self._query_chunks(
+            queries, namespace, batch_size, max_batch_bytes, max_workers
+        ):
+            results[start : start + len(chunk_results)] = chunk_results
 
         return [
             [QueryResult._from_json(obj) for obj in query_result]
-            for query_result in result
+            for query_result in results
         ]
 
+    def iter_query_many(
+        self,
+        *,
+        queries: List[QueryRequest],
+        namespace: str = DEFAULT_NAMESPACE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batch_bytes: Optional[int] = DEFAULT_MAX_BATCH_BYTES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> Iterator[Tuple[int, List[QueryResult]]]:
+        """
+        Makes a batch query request like `query_many`, but yields the
+        results as soon as their chunks complete, instead of waiting for
+        all of them.
+
+        Yields `(position of the query, results of the query)` tuples, in
+        the order the chunks complete.
+
+        :param queries: The queries to make.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param batch_size: Maximum number of queries to send in a request.
+        :param max_batch_bytes: Maximum size of a request body in bytes. When `None`, the requests are only limited by `batch_size`.
+        :param max_workers: Maximum number of requests in flight at the same time.
+
+        Example usage:
+
+        ```python
+        for i, res in index.iter_query_many(queries=queries, batch_size=500):
+            print(queries[i], res)
+        ```
+        """
+        for start, chunk_results in self._query_chunks(
+            queries, namespace, batch_size, max_batch_bytes, max_workers
+        ):
+            for i, query_result in enumerate(chunk_results, start):
+                yield i, [QueryResult._from_json(obj) for obj in query_result]
+
+    def _query_chunks(
+        self,
+        queries: List[QueryRequest],
+        namespace: str,
+        batch_size: int,
+        max_batch_bytes: Optional[int],
+        max_workers: int,
+    ) -> Iterator[Tuple[int, List[Any]]]:
+        has_vector_query, payloads = query_requests_to_payload(queries)
+        path = QUERY_PATH if has_vector_query else QUERY_DATA_PATH
+
+        chunks = payload_chunks(payloads, batch_size, max_batch_bytes, self._codec)
+        first = next(chunks, None)
+        if first is None:
+            return
+
+        second = next(chunks, None)
+        if second is None:
+            # no need for concurrency
+            start, chunk = first
+            yield start, self._execute_queries(chunk, path, namespace)
+            return
+
+        def query_chunk(chunk: Tuple[int, List[Dict[str, Any]]]) -> List[Any]:
+            return self._execute_queries(chunk[1], path, namespace)
+
+        for _, (start, _), chunk_results, error in run_batches(
+            query_chunk, itertools.chain([first, second], chunks), max_workers
+        ):
+            if error is not None:
+                raise error
+
+            yield start, cast(List[Any], chunk_results)
+
+    def query_namespaces(
+        self,
+        namespaces: List[str],
+        vector: Optional[Union[List[float], SupportsToList]] = None,
+        top_k: int = 10,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        filter: str = "",
+        data: Optional[str] = None,
+        include_data: bool = False,
+        sparse_vector: Optional[Union[SparseVector, TupleAsSparseVectorT]] = None,
+        weighting_strategy: Optional[WeightingStrategy] = None,
+        fusion_algorithm: Optional[FusionAlgorithm] = None,
+        query_mode: Optional[QueryMode] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: Optional[float] = None,
+    ) -> QueryNamespacesResult:
+        """
+        Queries `top_k` many similar vectors across the given namespaces.
+
+        The namespaces are queried concurrently, and their results are
+        merged into the global `top_k` by score, each tagged with the
+        namespace it is found in. The namespaces that fail, or do not
+        complete within the `timeout`, are reported in the errors instead of
+        failing the whole query.
+
+        When the `timeout` expires, the queries of the namespaces that are not
+        started yet are cancelled. The queries already in flight are not
+        interrupted. They complete in the background, and their results are
+        discarded.
+
+        Takes the same query parameters as `query`.
+
+        :param namespaces: The namespaces to query.
+        :param max_workers: Maximum number of namespaces queried at the same time.
+        :param timeout: Time to wait for the namespaces to complete, in seconds. When `None`, there is no limit.
+
+        Example usage:
+
+        ```python
+        res = index.query_namespaces(
+            namespaces=["tenant-1", "tenant-2", "tenant-3"],
+            vector=[0.6, 0.9],
+            top_k=5,
+            timeout=2.0,
+        )
+
+        for r in res.results:
+            print(r.namespace, r.id, r.score)
+
+        for namespace, error in res.errors.items():
+            print(namespace, error)
+        ```
+        """
+        if max_workers <= 0:
+            raise ClientError("max_workers must be greater than 0")
+
+        namespaces = list(dict.fromkeys(namespaces))
+        results: Dict[str, List[QueryResult]] = {}
+        errors: Dict[str, Exception] = {}
+        if not namespaces:
+            return QueryNamespacesResult(results=[], errors=errors)
+
+        def query(namespace: str) -> List[QueryResult]:
+            return self.query(
+                vector=vector,
+                top_k=top_k,
+                include_vectors=include_vectors,
+                include_metadata=include_metadata,
+                filter=filter,
+                data=data,
+                namespace=namespace,
+                include_data=include_data,
+                sparse_vector=sparse_vector,
+                weighting_strategy=weighting_strategy,
+                fusion_algorithm=fusion_algorithm,
+                query_mode=query_mode,
+            )
+
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(namespaces)))
+        futures: Dict[Future, str] = {}
+        try:
+            for ns in namespaces:
+                futures[executor.submit(query, ns)] = ns
+
+            done, not_done = wait(futures, timeout=timeout)
+
+            for future in not_done:
+                errors[futures[future]] = TimeoutError(
+                    f"The query did not complete in {timeout} seconds."
+                )
+
+            for future in done:
+                result, error = future_outcome(future)
+                if error is not None:
+                    errors[futures[future]] = error
+                else:
+                    results[futures[future]] = cast(List[QueryResult], result)
+        finally:
+            # the queries not started yet are cancelled, and the ones
+            # already in flight are left to complete in the background,
+            # as the threads cannot be interrupted
+            for future in futures:
+                future.cancel()
+
+            executor.shutdown(wait=False)
+
+        return _merge_namespace_results(namespaces, results, errors, top_k)
+
     def resumable_query(
         self,
         vector: Optional[Union[List[float], SupportsToList]] = None,
@@ -459,6 +1122,116 @@ class IndexOperations:
             )
         )
 
+    def delete_many(
+        self,
+        ids: Iterable[str],
+        namespace: str = DEFAULT_NAMESPACE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+    ) -> DeleteManyResult:
+        """
+        Deletes the vectors with the given ids in batches, sending the
+        batches concurrently.
+
+        The ids are pulled from the iterable lazily, so that arbitrarily
+        large inputs, like generators, can be streamed.
+
+        A failing batch does not stop the rest of the batches. The failed
+        batches are reported in the `errors` field of the result.
+
+        :param ids: The iterable of ids of the vectors to delete.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param batch_size: Maximum number of ids in a single request.
+        :param max_workers: Maximum number of requests in flight at the same time.
+        :param on_progress: Callback to call with the overall progress after each batch completes.
+
+        Example usage:
+
+        ```python
+        res = index.delete_many(
+            ids=(f"id-{i}" for i in range(100_000)),
+            batch_size=1000,
+            max_workers=8,
+        )
+
+        print(res.deleted)
+        for error in res.errors:
+            print(error.batch, error.ids, error.error)
+        ```
+        """
+        path = _path_for(namespace, DELETE_PATH)
+
+        def delete_batch(batch: List[str]) -> int:
+            result = self._execute_request(payload={"ids": batch}, path=path)
+            return DeleteResult._from_json(result).deleted
+
+        collector: BatchCollector[int] = BatchCollector(on_progress, keep_results=False)
+        deleted = 0
+        for i, batch, result, error in run_batches(
+            delete_batch, id_batches(ids, batch_size), max_workers
+        ):
+            collector.add(i, list(batch), result, error)
+            if result is not None:
+                deleted += result
+
+        return DeleteManyResult(deleted=deleted, errors=collector.errors)
+
+    def delete_from_namespaces(
+        self,
+        namespaces: List[str],
+        prefix: Optional[str] = None,
+        filter: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+    ) -> DeleteNamespacesResult:
+        """
+        Deletes the vectors whose ids start with the `prefix`, or whose
+        metadata match with the `filter`, from each of the given namespaces.
+
+        The namespaces are deleted from concurrently. The namespaces that
+        fail are reported in the errors instead of failing the whole delete.
+        The namespaces themselves are not deleted.
+
+        :param namespaces: The namespaces to delete from.
+        :param prefix: Prefix of vector ids to delete.
+        :param filter: Metadata filter for the vectors to delete.
+        :param max_workers: Maximum number of namespaces deleted from at the same time.
+        :param on_progress: Callback to call with the overall progress after each namespace completes, where each batch is a namespace, and the items are the deleted vectors.
+
+        Example usage:
+
+        ```python
+        res = index.delete_from_namespaces(
+            namespaces=["tenant-1", "tenant-2", "tenant-3"],
+            filter="expired = true",
+            on_progress=lambda p: print(p.completed_batches, p.completed_items),
+        )
+
+        print(res.deleted)
+        for namespace, deleted in res.results.items():
+            print(namespace, deleted)
+
+        for namespace, error in res.errors.items():
+            print(namespace, error)
+        ```
+        """
+        if prefix is None and filter is None:
+            raise ClientError("Either `prefix` or `filter` must be given.")
+
+        def delete(namespace: str) -> int:
+            return self.delete(
+                namespace=namespace, prefix=prefix, filter=filter
+            ).deleted
+
+        progress = _NamespaceProgress(on_progress)
+        for _, namespace, deleted, error in run_batches(
+            delete, dict.fromkeys(namespaces), max_workers
+        ):
+            progress.add(namespace, deleted, error)
+
+        return progress.to_result()
+
     def reset(self, namespace: str = DEFAULT_NAMESPACE, all: bool = False) -> str:
         """
         Resets a namespace of an index. All vectors are removed for that namespace.
@@ -526,53 +1299,320 @@ class IndexOperations:
             )
         )
 
-    def fetch(
+    def iter_range(
         self,
-        ids: Optional[Union[str, List[str]]] = None,
+        cursor: str = "",
+        limit: int = DEFAULT_RANGE_LIMIT,
         include_vectors: bool = False,
         include_metadata: bool = False,
         namespace: str = DEFAULT_NAMESPACE,
         include_data: bool = False,
         prefix: Optional[str] = None,
-    ) -> List[Optional[FetchResult]]:
+        prefetch: bool = True,
+        adaptive: bool = True,
+        target_latency: float = DEFAULT_RANGE_TARGET_LATENCY,
+        max_limit: int = DEFAULT_RANGE_MAX_LIMIT,
+    ) -> Iterator[FetchResult]:
         """
-        Fetches details of a set of vectors.
+        Scans the vectors starting from `cursor`, and yields them one by one,
+        fetching the pages lazily.
 
-        :param ids: List of vector ids to fetch details of.
+        While the vectors of a page are being processed, the next page is
+        fetched in the background. The page size starts from `limit`, and
+        is adapted to the observed latencies, such that fetching a page takes
+        about `target_latency` seconds.
+
+        :param cursor: Marker that indicates where the scanning was left off when running through all existing vectors.
+        :param limit: How many vectors to fetch with the first request.
         :param include_vectors: Whether the resulting vectors will have their vector values or not.
         :param include_metadata: Whether the resulting vectors will have their metadata or not.
         :param namespace: The namespace to use. When not specified, the default namespace is used.
-        :param include_data: Whether the resulting `top_k` vectors will have their unstructured data or not.
-        :param prefix: Prefix of vector ids to fetch.
+        :param include_data: Whether the resulting vectors will have their unstructured data or not.
+        :param prefix: Prefix of vector ids to range.
+        :param prefetch: Whether to fetch the next page while the current one is being processed.
+        :param adaptive: Whether to adapt the page size to the observed latencies. When `False`, all the pages are fetched with `limit`.
+        :param target_latency: Latency to aim for when adapting the page size, in seconds.
+        :param max_limit: Maximum page size to adapt up to.
 
         Example usage:
 
         ```python
-        res = index.fetch(["id1", "id2"], include_vectors=False, include_metadata=True)
+        for vector in index.iter_range(include_metadata=True):
+            print(vector.id, vector.metadata)
         ```
         """
-        payload: Dict[str, Any] = {
-            "includeVectors": include_vectors,
-            "includeMetadata": include_metadata,
-            "includeData": include_data,
-        }
+        if limit <= 0:
+            raise ClientError("limit must be greater than 0")
 
-        if ids is not None:
-            if not isinstance(ids, list):
-                ids = [ids]
+        if target_latency <= 0:
+            raise ClientError("target_latency must be greater than 0")
+
+        if max_limit < limit:
+            raise ClientError("max_limit must not be less than limit")
+
+        def range_page(cursor: str, limit: int) -> Tuple[RangeResult, float]:
+            start = time.monotonic()
+            page = self.range(
+                cursor=cursor,
+                limit=limit,
+                include_vectors=include_vectors,
+                include_metadata=include_metadata,
+                namespace=namespace,
+                include_data=include_data,
+                prefix=prefix,
+            )
+            return page, time.monotonic() - start
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        next_page: Optional[Future] = None
+        try:
+            page, latency = range_page(cursor, limit)
+            while True:
+                if adaptive:
+                    limit = adapt_page_size(limit, latency, target_latency, max_limit)
+
+                if page.next_cursor and executor is not None:
+                    next_page = executor.submit(range_page, page.next_cursor, limit)
+
+                yield from page.vectors
+
+                if not page.next_cursor:
+                    return
+
+                if next_page is not None:
+                    page, latency = next_page.result()
+                    next_page = None
+                else:
+                    page, latency = range_page(page.next_cursor, limit)
+        finally:
+            if next_page is not None:
+                # the caller stopped early
+                next_page.cancel()
+
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def parallel_range(
+        self,
+        prefixes: Optional[List[str]] = None,
+        alphabet: Optional[str] = None,
+        prefix: str = "",
+        limit: int = DEFAULT_RANGE_LIMIT,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        namespace: str = DEFAULT_NAMESPACE,
+        include_data: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> Iterator[FetchResult]:
+        """
+        Scans the vectors by splitting the ids into prefix partitions,
+        and ranging over the partitions concurrently.
+
+        The partitions are either the given `prefixes`, or `prefix` extended
+        with each character of the `alphabet`, one of which must be given.
+        Only the vectors in the partitions are scanned, so when the alphabet
+        is used, it must contain all the characters the ids can continue with
+        after the `prefix`. The vectors are yielded as soon as their pages
+        arrive, so the vectors of different partitions are interleaved.
+
+        :param prefixes: Non-overlapping id prefixes to scan. Cannot be set together with the `alphabet`.
+        :param alphabet: All the characters the ids can continue with after `prefix`, to derive the partitions from. Cannot be set together with the `prefixes`.
+        :param prefix: Prefix of vector ids to extend with the alphabet. Cannot be set together with the `prefixes`.
+        :param limit: Limits how many vectors will be fetched with each request.
+        :param include_vectors: Whether the resulting vectors will have their vector values or not.
+        :param include_metadata: Whether the resulting vectors will have their metadata or not.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param include_data: Whether the resulting vectors will have their unstructured data or not.
+        :param max_workers: Maximum number of partitions scanned at the same time.
 
-            payload["ids"] = ids
+        Example usage:
+
+        ```python
+        for vector in index.parallel_range(alphabet="0123456789abcdef", max_workers=8):
+            print(vector.id)
+        ```
+        """
+        if limit <= 0:
+            raise ClientError("limit must be greater than 0")
+
+        if max_workers <= 0:
+            raise ClientError("max_workers must be greater than 0")
+
+        partitions = iter(prefix_partitions(prefix, prefixes, alphabet))
+
+        def range_page(partition: str, cursor: str) -> RangeResult:
+            return self.range(
+                cursor=cursor,
+                limit=limit,
+                include_vectors=include_vectors,
+                include_metadata=include_metadata,
+                namespace=namespace,
+                include_data=include_data,
+                prefix=partition,
+            )
+
+        if prefixes is None and prefix:
+            # the id equal to the prefix itself is not in any partition
+            yield from (
+                v
+                for v in self.fetch(
+                    ids=[prefix],
+                    include_vectors=include_vectors,
+                    include_metadata=include_metadata,
+                    namespace=namespace,
+                    include_data=include_data,
+                )
+                if v is not None
+            )
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending: Dict[Future, str] = {}
+        try:
+            for partition in itertools.islice(partitions, max_workers):
+                pending[executor.submit(range_page, partition, "")] = partition
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    partition = pending.pop(future)
+                    page: RangeResult = future.result()
+
+                    # keep the worker busy with the next page of the
+                    # partition, or with a new partition
+                    if page.next_cursor:
+                        next_page = executor.submit(
+                            range_page, partition, page.next_cursor
+                        )
+                        pending[next_page] = partition
+                    else:
+                        new_partition = next(partitions, None)
+                        if new_partition is not None:
+                            next_page = executor.submit(range_page, new_partition, "")
+                            pending[next_page] = new_partition
+
+                    yield from page.vectors
+        finally:
+            for future in pending:
+                future.cancel()
+
+            executor.shutdown(wait=False)
+
+    def fetch(
+        self,
+        ids: Optional[Union[str, List[str]]] = None,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        namespace: str = DEFAULT_NAMESPACE,
+        include_data: bool = False,
+        prefix: Optional[str] = None,
+        batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> List[Optional[FetchResult]]:
+        """
+        Fetches details of a set of vectors.
+
+        :param ids: List of vector ids to fetch details of.
+        :param include_vectors: Whether the resulting vectors will have their vector values or not.
+        :param include_metadata: Whether the resulting vectors will have their metadata or not.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param include_data: Whether the resulting `top_k` vectors will have their unstructured data or not.
+        :param prefix: Prefix of vector ids to fetch.
+        :param batch_size: Maximum number of ids to fetch in a request. Longer lists of ids are split into many requests.
+        :param max_workers: Maximum number of requests in flight at the same time.
+
+        Example usage:
+
+        ```python
+        res = index.fetch(["id1", "id2"], include_vectors=False, include_metadata=True)
+        ```
+        """
+        payload: Dict[str, Any] = {
+            "includeVectors": include_vectors,
+            "includeMetadata": include_metadata,
+            "includeData": include_data,
+        }
 
         if prefix is not None:
             payload["prefix"] = prefix
 
-        vectors = self._execute_request(
+            if ids is not None:
+                payload["ids"] = ids if isinstance(ids, list) else [ids]
+
+            return _to_fetch_results(self._execute_fetch(payload, namespace))
+
+        if ids is None:
+            return _to_fetch_results(self._execute_fetch(payload, namespace))
+
+        if not isinstance(ids, list):
+            ids = [ids]
+
+        return self._fetch_ids(ids, payload, namespace, batch_size, max_workers)
+
+    def _execute_fetch(self, payload: Dict[str, Any], namespace: str) -> List[Any]:
+        return self._execute_request(
             payload=payload, path=_path_for(namespace, FETCH_PATH)
         )
 
-        return [
-            FetchResult._from_json(vector) if vector else None for vector in vectors
-        ]
+    def _fetch_ids(
+        self,
+        ids: List[str],
+        payload: Dict[str, Any],
+        namespace: str,
+        batch_size: int,
+        max_workers: int,
+    ) -> List[Optional[FetchResult]]:
+        """
+        Fetches the vectors of the ids in chunks, and returns them in the
+        order of the ids. When there is a fetch cache, only the ids missing
+        from it are fetched.
+        """
+        if batch_size <= 0:
+            raise ClientError("batch_size must be greater than 0")
+
+        cache = self._fetch_cache
+        if cache is None:
+            return _to_fetch_results(
+                self._fetch_chunks(ids, payload, namespace, batch_size, max_workers)
+            )
+
+        generation = cache._generation(namespace)
+        vectors = cache._get_many(namespace, ids, payload)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            fetched = self._fetch_chunks(
+                [ids[i] for i in missing], payload, namespace, batch_size, max_workers
+            )
+            cache._put_many(self._codec, namespace, fetched, payload, generation)
+            for i, vector in zip(missing, fetched):
+                vectors[i] = vector
+
+        return _to_fetch_results(vectors)
+
+    def _fetch_chunks(
+        self,
+        ids: List[str],
+        payload: Dict[str, Any],
+        namespace: str,
+        batch_size: int,
+        max_workers: int,
+    ) -> List[Any]:
+        if len(ids) <= batch_size:
+            return self._execute_fetch({**payload, "ids": ids}, namespace)
+
+        def fetch_chunk(start: int) -> List[Any]:
+            chunk = ids[start : start + batch_size]
+            return self._execute_fetch({**payload, "ids": chunk}, namespace)
+
+        vectors: List[Any] = [None] * len(ids)
+        for _, start, fetched, error in run_batches(
+            fetch_chunk, range(0, len(ids), batch_size), max_workers
+        ):
+            if error is not None:
+                raise error
+
+            vectors[start : start + batch_size] = cast(List[Any], fetched)
+
+        return vectors
 
     def update(
         self,
@@ -603,26 +1643,14 @@ class IndexOperations:
         updated = index.update("id1", metadata={"new_field": "new_value"})
         ```
         """
-        payload: Dict[str, Any] = {
-            "id": id,
-            "metadataUpdateMode": metadata_update_mode.value,
-        }
-
-        if vector is not None:
-            payload["vector"] = to_list(vector)
-
-        if sparse_vector is not None:
-            sparse = to_sparse_vector(sparse_vector)
-            payload["sparseVector"] = {
-                "indices": sparse.indices,
-                "values": sparse.values,
-            }
-
-        if data is not None:
-            payload["data"] = data
-
-        if metadata is not None:
-            payload["metadata"] = metadata
+        payload = update_to_payload(
+            id,
+            vector=vector,
+            data=data,
+            metadata=metadata,
+            metadata_update_mode=metadata_update_mode,
+            sparse_vector=sparse_vector,
+        )
 
         result = self._execute_request(
             payload=payload, path=_path_for(namespace, UPDATE_PATH)
@@ -630,6 +1658,72 @@ class IndexOperations:
         updated = result["updated"]
         return updated == 1
 
+    def update_many(
+        self,
+        updates: Iterable[UpdateRequest],
+        namespace: str = DEFAULT_NAMESPACE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+    ) -> UpdateManyResult:
+        """
+        Updates many vectors, sending the updates concurrently.
+
+        Each update takes the same fields as the parameters of `update`.
+        The updates are pulled from the iterable lazily, so that
+        arbitrarily large inputs, like generators, can be streamed.
+
+        A failing update does not stop the rest of the updates. The failed
+        updates are reported in the `errors` field of the result.
+
+        :param updates: The iterable of updates to make.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param max_workers: Maximum number of requests in flight at the same time.
+        :param on_progress: Callback to call with the overall progress after each update completes.
+
+        Example usage:
+
+        ```python
+        from upstash_vector.types import MetadataUpdateMode
+
+        res = index.update_many(
+            updates=(
+                {
+                    "id": id,
+                    "metadata": {"score": score},
+                    "metadata_update_mode": MetadataUpdateMode.PATCH,
+                }
+                for id, score in scores.items()
+            ),
+            max_workers=16,
+        )
+
+        print(res.updated, res.not_found)
+        for error in res.errors:
+            print(error.batch, error.ids, error.error)
+        ```
+        """
+        path = _path_for(namespace, UPDATE_PATH)
+
+        def update_one(update: UpdateRequest) -> bool:
+            payload = update_request_to_payload(update)
+            result = self._execute_request(payload=payload, path=path)
+            return result["updated"] == 1
+
+        collector: BatchCollector[bool] = BatchCollector(
+            on_progress, keep_results=False
+        )
+        updated = 0
+        for i, update, result, error in run_batches(update_one, updates, max_workers):
+            collector.add(i, update_request_ids(update), result, error)
+            if result:
+                updated += 1
+
+        return UpdateManyResult(
+            updated=updated,
+            not_found=collector.progress.completed_items - updated,
+            errors=collector.errors,
+        )
+
     def info(self) -> InfoResult:
         """
         Returns the index info, including:
@@ -662,9 +1756,49 @@ class IndexOperations:
 
 
 class AsyncIndexOperations:
+    _codec: JSONCodec = StdlibJSONCodec()
+    _query_cache: Optional[QueryCache] = None
+    _semantic_cache: Optional[SemanticQueryCache] = None
+    _fetch_cache: Optional[FetchCache] = None
+
+    @property
+    def codec(self) -> JSONCodec:
+        """JSON codec the requests are serialized, and the responses are parsed with."""
+        return self._codec
+
     async def _execute_request_async(self, payload, path):
         raise NotImplementedError("execute_request")
 
+    async def _execute_queries_async(
+        self, payloads: List[Dict[str, Any]], path: str, namespace: str
+    ) -> List[Any]:
+        """
+        Executes the queries with the same path in a single request, and
+        returns their raw results in order. When there are query caches,
+        only the queries missing from them are sent.
+        """
+        caches = [
+            cache
+            for cache in (self._query_cache, self._semantic_cache)
+            if cache is not None
+        ]
+        if not caches:
+            return await _send_queries_async(
+                self._execute_request_async, payloads, path, namespace
+            )
+
+        lookup = _QueryLookup(caches, self._codec, namespace, path, payloads)
+        if lookup.missing:
+            fetched = await _send_queries_async(
+                self._execute_request_async,
+                [payloads[i] for i in lookup.missing],
+                path,
+                namespace,
+            )
+            lookup.store(fetched)
+
+        return lookup.results
+
     async def upsert(
         self,
         vectors: Sequence[Union[Dict, tuple, Vector, Data]],
@@ -742,6 +1876,233 @@ class AsyncIndexOperations:
             payload=payload, path=_path_for(namespace, path)
         )
 
+    async def upsert_many(
+        self,
+        vectors: Union[
+            Iterable[Union[Dict, tuple, Vector, Data]],
+            AsyncIterable[Union[Dict, tuple, Vector, Data]],
+        ],
+        namespace: str = DEFAULT_NAMESPACE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batch_bytes: Optional[int] = DEFAULT_MAX_BATCH_BYTES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+    ) -> UpsertManyResult:
+        """
+        Upserts(update or insert) vectors in batches asynchronously, sending the batches concurrently.
+
+        Accepts the same kinds of vectors with the `upsert` method, from
+        any iterable or asynchronous iterable, including generators. The
+        vectors are converted lazily, and only a bounded number of batches
+        are kept in memory at any time, so that arbitrarily large inputs
+        can be streamed.
+
+        A failing batch does not stop the rest of the batches. The failed
+        batches are reported in the `errors` field of the result.
+
+        :param vectors: The iterable or asynchronous iterable of vectors to upsert.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param batch_size: Maximum number of vectors in a single request.
+        :param max_batch_bytes: Maximum serialized size of a single request in bytes. When set to `None`, batches are only limited by `batch_size`.
+        :param max_workers: Maximum number of requests in flight at the same time.
+        :param on_progress: Callback to call with the overall progress after each batch completes.
+
+        Example usage:
+
+        ```python
+        res = await index.upsert_many(
+            vectors=[(f"id-{i}", [0.1 * i, 0.2 * i]) for i in range(100_000)],
+            batch_size=1000,
+            max_workers=8,
+            on_progress=lambda p: print(p.completed_items, p.failed_items),
+        )
+
+        print(res.upserted)
+        for error in res.errors:
+            print(error.batch, error.ids, error.error)
+        ```
+        """
+        batches = vectors_to_payload_batches_async(
+            vectors, batch_size, max_batch_bytes, self._codec
+        )
+
+        async def upsert_batch(batch: Tuple[List[Dict[str, Any]], bool]) -> str:
+            payload, is_vector = batch
+            path = UPSERT_PATH if is_vector else UPSERT_DATA_PATH
+            return await self._execute_request_async(
+                payload=payload, path=_path_for(namespace, path)
+            )
+
+        collector: BatchCollector[str] = BatchCollector(on_progress)
+        async for i, (payload, _), result, error in run_batches_async(
+            upsert_batch, batches, max_workers
+        ):
+            collector.add(i, [v["id"] for v in payload], result, error)
+
+        return UpsertManyResult(
+            upserted=collector.progress.completed_items,
+            results=collector.results,
+            errors=collector.errors,
+        )
+
+    async def upsert_matrix(
+        self,
+        ids: Union[Sequence[Union[int, str]], SupportsToList],
+        vectors: Union[List[List[float]], SupportsToMatrix],
+        metadata: Optional[Sequence[Optional[Dict]]] = None,
+        data: Optional[Sequence[Optional[str]]] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+    ) -> UpsertManyResult:
+        """
+        Upserts(update or insert) dense vectors given as rows of a 2-D matrix,
+        such as a numpy array of shape `(n, d)`, in batches that are sent concurrently.
+
+        Rows are converted to lists for a whole batch at once, which is
+        much faster than upserting the rows one by one with `upsert_many`.
+
+        A failing batch does not stop the rest of the batches. The failed
+        batches are reported in the `errors` field of the result.
+
+        :param ids: The ids of the vectors, one for each row.
+        :param vectors: The matrix of vector values, one row for each vector.
+        :param metadata: The metadata of the vectors, one for each row.
+        :param data: The unstructured data of the vectors, one for each row.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param batch_size: Maximum number of vectors in a single request.
+        :param max_workers: Maximum number of requests in flight at the same time.
+        :param on_progress: Callback to call with the overall progress after each batch completes.
+
+        Example usage:
+
+        ```python
+        import numpy as np
+
+        res = await index.upsert_matrix(
+            ids=[f"id-{i}" for i in range(10_000)],
+            vectors=np.random.rand(10_000, 256).astype(np.float32),
+            metadata=[{"i": i} for i in range(10_000)],
+        )
+        ```
+        """
+        batches = matrix_to_payload_batches(
+            ids,
+            vectors,
+            metadata,
+            data,
+            batch_size,
+            convert_rows=not self._codec.serializes_numpy,
+        )
+
+        async def upsert_batch(payload: List[Dict[str, Any]]) -> str:
+            return await self._execute_request_async(
+                payload=payload, path=_path_for(namespace, UPSERT_PATH)
+            )
+
+        collector: BatchCollector[str] = BatchCollector(on_progress)
+        async for i, payload, result, error in run_batches_async(
+            upsert_batch, batches, max_workers
+        ):
+            collector.add(i, [v["id"] for v in payload], result, error)
+
+        return UpsertManyResult(
+            upserted=collector.progress.completed_items,
+            results=collector.results,
+            errors=collector.errors,
+        )
+
+    async def upsert_dataframe(
+        self,
+        frame: Any,
+        id_column: str = "id",
+        vector_column: Optional[str] = None,
+        sparse_vector_column: Optional[str] = None,
+        metadata_column: Optional[str] = None,
+        metadata_columns: Optional[Sequence[str]] = None,
+        data_column: Optional[str] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+    ) -> UpsertManyResult:
+        """
+        Upserts(update or insert) the rows of a pandas DataFrame or a pyarrow Table,
+        in batches that are sent concurrently.
+
+        The frame is read in batches, column by column, without converting
+        its rows to Python objects first.
+
+        When none of the `vector_column` or `sparse_vector_column` is set, the rows are
+        upserted as raw data, to be embedded by the Upstash-hosted embedding model.
+
+        A failing batch does not stop the rest of the batches. The failed
+        batches are reported in the `errors` field of the result.
+
+        :param frame: The pandas DataFrame or the pyarrow Table to upsert.
+        :param id_column: Name of the column containing the vector ids.
+        :param vector_column: Name of the column containing the dense vectors.
+        :param sparse_vector_column: Name of the column containing the sparse vectors, as `SparseVector`s, `(indices, values)` tuples, or `{"indices": ..., "values": ...}` structs.
+        :param metadata_column: Name of the column containing the metadata dicts.
+        :param metadata_columns: Names of the columns to put into the metadata, keyed with the column names. Missing values are left out, and numpy arrays and scalars are converted to lists and numbers. Other values must be JSON compatible. Cannot be set together with the `metadata_column`.
+        :param data_column: Name of the column containing the unstructured data.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param batch_size: Maximum number of vectors in a single request.
+        :param max_workers: Maximum number of requests in flight at the same time.
+        :param on_progress: Callback to call with the overall progress after each batch completes.
+
+        Example usage:
+
+        ```python
+        import pandas as pd
+
+        df = pd.DataFrame(
+            {
+                "id": ["id-0", "id-1"],
+                "embedding": [[0.1, 0.2], [0.3, 0.4]],
+                "genre": ["fiction", "poetry"],
+                "year": [1999, 2001],
+            }
+        )
+
+        res = await index.upsert_dataframe(
+            df,
+            vector_column="embedding",
+            metadata_columns=["genre", "year"],
+        )
+        ```
+        """
+        batches = frame_to_payload_batches(
+            frame,
+            id_column,
+            vector_column,
+            sparse_vector_column,
+            metadata_column,
+            metadata_columns,
+            data_column,
+            batch_size,
+        )
+
+        async def upsert_batch(batch: Tuple[List[Dict[str, Any]], bool]) -> str:
+            payload, is_vector = batch
+            path = UPSERT_PATH if is_vector else UPSERT_DATA_PATH
+            return await self._execute_request_async(
+                payload=payload, path=_path_for(namespace, path)
+            )
+
+        collector: BatchCollector[str] = BatchCollector(on_progress)
+        async for i, (payload, _), result, error in run_batches_async(
+            upsert_batch, batches, max_workers
+        ):
+            collector.add(i, [v["id"] for v in payload], result, error)
+
+        return UpsertManyResult(
+            upserted=collector.progress.completed_items,
+            results=collector.results,
+            errors=collector.errors,
+        )
+
     async def query(
         self,
         vector: Optional[Union[List[float], SupportsToList]] = None,
@@ -840,18 +2201,17 @@ class AsyncIndexOperations:
 
             path = QUERY_PATH
 
-        return [
-            QueryResult._from_json(obj)
-            for obj in await self._execute_request_async(
-                payload=payload, path=_path_for(namespace, path)
-            )
-        ]
+        [result] = await self._execute_queries_async([payload], path, namespace)
+        return [QueryResult._from_json(obj) for obj in result]
 
     async def query_many(
         self,
         *,
         queries: List[QueryRequest],
         namespace: str = DEFAULT_NAMESPACE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batch_bytes: Optional[int] = DEFAULT_MAX_BATCH_BYTES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> List[List[QueryResult]]:
         """
         Makes a batch query request.
@@ -859,6 +2219,16 @@ class AsyncIndexOperations:
         The batch should only contain elements whose `data`
         or `vector` fields set.
 
+        Large batches are split into chunks of at most `batch_size` queries
+        and `max_batch_bytes` bytes, which are sent concurrently. The results
+        are returned in the order of the queries.
+
+        :param queries: The queries to make.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param batch_size: Maximum number of queries to send in a request.
+        :param max_batch_bytes: Maximum size of a request body in bytes. When `None`, the requests are only limited by `batch_size`.
+        :param max_workers: Maximum number of requests in flight at the same time.
+
         Example usage:
 
         ```python
@@ -896,17 +2266,191 @@ class AsyncIndexOperations:
             single_result = await self.query(**query, namespace=namespace)
             return [single_result]
 
-        has_vector_query, payload = query_requests_to_payload(queries)
-        path = QUERY_PATH if has_vector_query else QUERY_DATA_PATH
-        result = await self._execute_request_async(
-            payload=payload, path=_path_for(namespace, path)
-        )
+        results: List[Any] = [None] * len(queries)
+        async for start, chunk_results in self._query_chunks(
+            queries, namespace, batch_size, max_batch_bytes, max_workers
+        ):
+            results[start : start + len(chunk_results)] = chunk_results
 
         return [
             [QueryResult._from_json(obj) for obj in query_result]
-            for query_result in result
+            for query_result in results
         ]
 
+    async def iter_query_many(
+        self,
+        *,
+        queries: List[QueryRequest],
+        namespace: str = DEFAULT_NAMESPACE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batch_bytes: Optional[int] = DEFAULT_MAX_BATCH_BYTES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> AsyncIterator[Tuple[int, List[QueryResult]]]:
+        """
+        Makes a batch query request like `query_many`, but yields the
+        results as soon as their chunks complete, instead of waiting for
+        all of them.
+
+        Yields `(position of the query, results of the query)` tuples, in
+        the order the chunks complete.
+
+        :param queries: The queries to make.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param batch_size: Maximum number of queries to send in a request.
+        :param max_batch_bytes: Maximum size of a request body in bytes. When `None`, the requests are only limited by `batch_size`.
+        :param max_workers: Maximum number of requests in flight at the same time.
+
+        Example usage:
+
+        ```python
+        async for i, res in index.iter_query_many(queries=queries, batch_size=500):
+            print(queries[i], res)
+        ```
+        """
+        async for start, chunk_results in self._query_chunks(
+            queries, namespace, batch_size, max_batch_bytes, max_workers
+        ):
+            for i, query_result in enumerate(chunk_results, start):
+                yield i, [QueryResult._from_json(obj) for obj in query_result]
+
+    async def _query_chunks(
+        self,
+        queries: List[QueryRequest],
+        namespace: str,
+        batch_size: int,
+        max_batch_bytes: Optional[int],
+        max_workers: int,
+    ) -> AsyncIterator[Tuple[int, List[Any]]]:
+        has_vector_query, payloads = query_requests_to_payload(queries)
+        path = QUERY_PATH if has_vector_query else QUERY_DATA_PATH
+
+        chunks = payload_chunks(payloads, batch_size, max_batch_bytes, self._codec)
+        first = next(chunks, None)
+        if first is None:
+            return
+
+        second = next(chunks, None)
+        if second is None:
+            # no need for concurrency
+            start, chunk = first
+            yield start, await self._execute_queries_async(chunk, path, namespace)
+            return
+
+        async def query_chunk(chunk: Tuple[int, List[Dict[str, Any]]]) -> List[Any]:
+            return await self._execute_queries_async(chunk[1], path, namespace)
+
+        async for _, (start, _), chunk_results, error in run_batches_async(
+            query_chunk, itertools.chain([first, second], chunks), max_workers
+        ):
+            if error is not None:
+                raise error
+
+            yield start, cast(List[Any], chunk_results)
+
+    async def query_namespaces(
+        self,
+        namespaces: List[str],
+        vector: Optional[Union[List[float], SupportsToList]] = None,
+        top_k: int = 10,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        filter: str = "",
+        data: Optional[str] = None,
+        include_data: bool = False,
+        sparse_vector: Optional[Union[SparseVector, TupleAsSparseVectorT]] = None,
+        weighting_strategy: Optional[WeightingStrategy] = None,
+        fusion_algorithm: Optional[FusionAlgorithm] = None,
+        query_mode: Optional[QueryMode] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: Optional[float] = None,
+    ) -> QueryNamespacesResult:
+        """
+        Queries `top_k` many similar vectors across the given namespaces.
+
+        The namespaces are queried concurrently, and their results are
+        merged into the global `top_k` by score, each tagged with the
+        namespace it is found in. The namespaces that fail, or do not
+        complete within the `timeout`, are reported in the errors instead of
+        failing the whole query.
+
+        Takes the same query parameters as `query`.
+
+        :param namespaces: The namespaces to query.
+        :param max_workers: Maximum number of namespaces queried at the same time.
+        :param timeout: Time to wait for the namespaces to complete, in seconds. When `None`, there is no limit.
+
+        Example usage:
+
+        ```python
+        res = await index.query_namespaces(
+            namespaces=["tenant-1", "tenant-2", "tenant-3"],
+            vector=[0.6, 0.9],
+            top_k=5,
+            timeout=2.0,
+        )
+
+        for r in res.results:
+            print(r.namespace, r.id, r.score)
+
+        for namespace, error in res.errors.items():
+            print(namespace, error)
+        ```
+        """
+        if max_workers <= 0:
+            raise ClientError("max_workers must be greater than 0")
+
+        namespaces = list(dict.fromkeys(namespaces))
+        results: Dict[str, List[QueryResult]] = {}
+        errors: Dict[str, Exception] = {}
+        if not namespaces:
+            return QueryNamespacesResult(results=[], errors=errors)
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def query(namespace: str) -> List[QueryResult]:
+            async with semaphore:
+                return await self.query(
+                    vector=vector,
+                    top_k=top_k,
+                    include_vectors=include_vectors,
+                    include_metadata=include_metadata,
+                    filter=filter,
+                    data=data,
+                    namespace=namespace,
+                    include_data=include_data,
+                    sparse_vector=sparse_vector,
+                    weighting_strategy=weighting_strategy,
+                    fusion_algorithm=fusion_algorithm,
+                    query_mode=query_mode,
+                )
+
+        tasks = {asyncio.ensure_future(query(ns)): ns for ns in namespaces}
+        try:
+            done, not_done = await asyncio.wait(tasks, timeout=timeout)
+        finally:
+            # the queries still running, after a timeout or when the caller
+            # is cancelled, are cancelled, and waited for to complete
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        for task in not_done:
+            errors[tasks[task]] = TimeoutError(
+                f"The query did not complete in {timeout} seconds."
+            )
+
+        for task in done:
+            result, error = future_outcome(task)
+            if error is not None:
+                errors[tasks[task]] = error
+            else:
+                results[tasks[task]] = cast(List[QueryResult], result)
+
+        return _merge_namespace_results(namespaces, results, errors, top_k)
+
     async def resumable_query(
         self,
         vector: Optional[Union[List[float], SupportsToList]] = None,
@@ -1060,6 +2604,119 @@ class AsyncIndexOperations:
             )
         )
 
+    async def delete_many(
+        self,
+        ids: Iterable[str],
+        namespace: str = DEFAULT_NAMESPACE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+    ) -> DeleteManyResult:
+        """
+        Deletes the vectors with the given ids asynchronously in batches, sending the
+        batches concurrently.
+
+        The ids are pulled from the iterable lazily, so that arbitrarily
+        large inputs, like generators, can be streamed.
+
+        A failing batch does not stop the rest of the batches. The failed
+        batches are reported in the `errors` field of the result.
+
+        :param ids: The iterable of ids of the vectors to delete.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param batch_size: Maximum number of ids in a single request.
+        :param max_workers: Maximum number of requests in flight at the same time.
+        :param on_progress: Callback to call with the overall progress after each batch completes.
+
+        Example usage:
+
+        ```python
+        res = await index.delete_many(
+            ids=(f"id-{i}" for i in range(100_000)),
+            batch_size=1000,
+            max_workers=8,
+        )
+
+        print(res.deleted)
+        for error in res.errors:
+            print(error.batch, error.ids, error.error)
+        ```
+        """
+        path = _path_for(namespace, DELETE_PATH)
+
+        async def delete_batch(batch: List[str]) -> int:
+            result = await self._execute_request_async(
+                payload={"ids": batch}, path=path
+            )
+            return DeleteResult._from_json(result).deleted
+
+        collector: BatchCollector[int] = BatchCollector(on_progress, keep_results=False)
+        deleted = 0
+        async for i, batch, result, error in run_batches_async(
+            delete_batch, id_batches(ids, batch_size), max_workers
+        ):
+            collector.add(i, list(batch), result, error)
+            if result is not None:
+                deleted += result
+
+        return DeleteManyResult(deleted=deleted, errors=collector.errors)
+
+    async def delete_from_namespaces(
+        self,
+        namespaces: List[str],
+        prefix: Optional[str] = None,
+        filter: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+    ) -> DeleteNamespacesResult:
+        """
+        Deletes the vectors asynchronously whose ids start with the `prefix`, or whose
+        metadata match with the `filter`, from each of the given namespaces.
+
+        The namespaces are deleted from concurrently. The namespaces that
+        fail are reported in the errors instead of failing the whole delete.
+        The namespaces themselves are not deleted.
+
+        :param namespaces: The namespaces to delete from.
+        :param prefix: Prefix of vector ids to delete.
+        :param filter: Metadata filter for the vectors to delete.
+        :param max_workers: Maximum number of namespaces deleted from at the same time.
+        :param on_progress: Callback to call with the overall progress after each namespace completes, where each batch is a namespace, and the items are the deleted vectors.
+
+        Example usage:
+
+        ```python
+        res = await index.delete_from_namespaces(
+            namespaces=["tenant-1", "tenant-2", "tenant-3"],
+            filter="expired = true",
+            on_progress=lambda p: print(p.completed_batches, p.completed_items),
+        )
+
+        print(res.deleted)
+        for namespace, deleted in res.results.items():
+            print(namespace, deleted)
+
+        for namespace, error in res.errors.items():
+            print(namespace, error)
+        ```
+        """
+        if prefix is None and filter is None:
+            raise ClientError("Either `prefix` or `filter` must be given.")
+
+        async def delete(namespace: str) -> int:
+            result = await self.delete(
+                namespace=namespace, prefix=prefix, filter=filter
+            )
+            return result.deleted
+
+        progress = _NamespaceProgress(on_progress)
+        async for _, namespace, deleted, error in run_batches_async(
+            delete, dict.fromkeys(namespaces), max_workers
+        ):
+            progress.add(namespace, deleted, error)
+
+        return progress.to_result()
+
     async def reset(self, namespace: str = DEFAULT_NAMESPACE, all: bool = False) -> str:
         """
         Resets a namespace of an index. All vectors are removed for that namespace.
@@ -1127,6 +2784,203 @@ class AsyncIndexOperations:
             )
         )
 
+    async def iter_range(
+        self,
+        cursor: str = "",
+        limit: int = DEFAULT_RANGE_LIMIT,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        namespace: str = DEFAULT_NAMESPACE,
+        include_data: bool = False,
+        prefix: Optional[str] = None,
+        prefetch: bool = True,
+        adaptive: bool = True,
+        target_latency: float = DEFAULT_RANGE_TARGET_LATENCY,
+        max_limit: int = DEFAULT_RANGE_MAX_LIMIT,
+    ) -> AsyncIterator[FetchResult]:
+        """
+        Scans the vectors asynchronously starting from `cursor`, and yields
+        them one by one, fetching the pages lazily.
+
+        While the vectors of a page are being processed, the next page is
+        fetched in the background. The page size starts from `limit`, and
+        is adapted to the observed latencies, such that fetching a page takes
+        about `target_latency` seconds.
+
+        :param cursor: Marker that indicates where the scanning was left off when running through all existing vectors.
+        :param limit: How many vectors to fetch with the first request.
+        :param include_vectors: Whether the resulting vectors will have their vector values or not.
+        :param include_metadata: Whether the resulting vectors will have their metadata or not.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param include_data: Whether the resulting vectors will have their unstructured data or not.
+        :param prefix: Prefix of vector ids to range.
+        :param prefetch: Whether to fetch the next page while the current one is being processed.
+        :param adaptive: Whether to adapt the page size to the observed latencies. When `False`, all the pages are fetched with `limit`.
+        :param target_latency: Latency to aim for when adapting the page size, in seconds.
+        :param max_limit: Maximum page size to adapt up to.
+
+        Example usage:
+
+        ```python
+        async for vector in index.iter_range(include_metadata=True):
+            print(vector.id, vector.metadata)
+        ```
+        """
+        if limit <= 0:
+            raise ClientError("limit must be greater than 0")
+
+        if target_latency <= 0:
+            raise ClientError("target_latency must be greater than 0")
+
+        if max_limit < limit:
+            raise ClientError("max_limit must not be less than limit")
+
+        async def range_page(cursor: str, limit: int) -> Tuple[RangeResult, float]:
+            start = time.monotonic()
+            page = await self.range(
+                cursor=cursor,
+                limit=limit,
+                include_vectors=include_vectors,
+                include_metadata=include_metadata,
+                namespace=namespace,
+                include_data=include_data,
+                prefix=prefix,
+            )
+            return page, time.monotonic() - start
+
+        next_page: Optional[asyncio.Future] = None
+        try:
+            page, latency = await range_page(cursor, limit)
+            while True:
+                if adaptive:
+                    limit = adapt_page_size(limit, latency, target_latency, max_limit)
+
+                if page.next_cursor and prefetch:
+                    next_page = asyncio.ensure_future(
+                        range_page(page.next_cursor, limit)
+                    )
+
+                for vector in page.vectors:
+                    yield vector
+
+                if not page.next_cursor:
+                    return
+
+                if next_page is not None:
+                    page, latency = await next_page
+                    next_page = None
+                else:
+                    page, latency = await range_page(page.next_cursor, limit)
+        finally:
+            if next_page is not None:
+                # the caller stopped early
+                next_page.cancel()
+                await asyncio.gather(next_page, return_exceptions=True)
+
+    async def parallel_range(
+        self,
+        prefixes: Optional[List[str]] = None,
+        alphabet: Optional[str] = None,
+        prefix: str = "",
+        limit: int = DEFAULT_RANGE_LIMIT,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        namespace: str = DEFAULT_NAMESPACE,
+        include_data: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> AsyncIterator[FetchResult]:
+        """
+        Scans the vectors asynchronously by splitting the ids into prefix
+        partitions, and ranging over the partitions concurrently.
+
+        The partitions are either the given `prefixes`, or `prefix` extended
+        with each character of the `alphabet`, one of which must be given.
+        Only the vectors in the partitions are scanned, so when the alphabet
+        is used, it must contain all the characters the ids can continue with
+        after the `prefix`. The vectors are yielded as soon as their pages
+        arrive, so the vectors of different partitions are interleaved.
+
+        :param prefixes: Non-overlapping id prefixes to scan. Cannot be set together with the `alphabet`.
+        :param alphabet: All the characters the ids can continue with after `prefix`, to derive the partitions from. Cannot be set together with the `prefixes`.
+        :param prefix: Prefix of vector ids to extend with the alphabet. Cannot be set together with the `prefixes`.
+        :param limit: Limits how many vectors will be fetched with each request.
+        :param include_vectors: Whether the resulting vectors will have their vector values or not.
+        :param include_metadata: Whether the resulting vectors will have their metadata or not.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param include_data: Whether the resulting vectors will have their unstructured data or not.
+        :param max_workers: Maximum number of partitions scanned at the same time.
+
+        Example usage:
+
+        ```python
+        async for vector in index.parallel_range(alphabet="0123456789abcdef", max_workers=8):
+            print(vector.id)
+        ```
+        """
+        if limit <= 0:
+            raise ClientError("limit must be greater than 0")
+
+        if max_workers <= 0:
+            raise ClientError("max_workers must be greater than 0")
+
+        partitions = iter(prefix_partitions(prefix, prefixes, alphabet))
+
+        def range_page(partition: str, cursor: str) -> asyncio.Future:
+            return asyncio.ensure_future(
+                self.range(
+                    cursor=cursor,
+                    limit=limit,
+                    include_vectors=include_vectors,
+                    include_metadata=include_metadata,
+                    namespace=namespace,
+                    include_data=include_data,
+                    prefix=partition,
+                )
+            )
+
+        if prefixes is None and prefix:
+            # the id equal to the prefix itself is not in any partition
+            for v in await self.fetch(
+                ids=[prefix],
+                include_vectors=include_vectors,
+                include_metadata=include_metadata,
+                namespace=namespace,
+                include_data=include_data,
+            ):
+                if v is not None:
+                    yield v
+
+        pending: Dict[asyncio.Future, str] = {}
+        try:
+            for partition in itertools.islice(partitions, max_workers):
+                pending[range_page(partition, "")] = partition
+
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    partition = pending.pop(future)
+                    page: RangeResult = future.result()
+
+                    # keep the worker busy with the next page of the
+                    # partition, or with a new partition
+                    if page.next_cursor:
+                        pending[range_page(partition, page.next_cursor)] = partition
+                    else:
+                        new_partition = next(partitions, None)
+                        if new_partition is not None:
+                            pending[range_page(new_partition, "")] = new_partition
+
+                    for vector in page.vectors:
+                        yield vector
+        finally:
+            for future in pending:
+                future.cancel()
+
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
     async def fetch(
         self,
         ids: Optional[Union[str, List[str]]] = None,
@@ -1135,6 +2989,8 @@ class AsyncIndexOperations:
         namespace: str = DEFAULT_NAMESPACE,
         include_data: bool = False,
         prefix: Optional[str] = None,
+        batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> List[Optional[FetchResult]]:
         """
         Fetches details of a set of vectors asynchronously.
@@ -1145,6 +3001,8 @@ class AsyncIndexOperations:
         :param namespace: The namespace to use. When not specified, the default namespace is used.
         :param include_data: Whether the resulting `top_k` vectors will have their unstructured data or not.
         :param prefix: Prefix of vector ids to fetch.
+        :param batch_size: Maximum number of ids to fetch in a request. Longer lists of ids are split into many requests.
+        :param max_workers: Maximum number of requests in flight at the same time.
 
         Example usage:
 
@@ -1158,22 +3016,91 @@ class AsyncIndexOperations:
             "includeData": include_data,
         }
 
-        if ids is not None:
-            if not isinstance(ids, list):
-                ids = [ids]
-
-            payload["ids"] = ids
-
         if prefix is not None:
             payload["prefix"] = prefix
 
-        vectors = await self._execute_request_async(
+            if ids is not None:
+                payload["ids"] = ids if isinstance(ids, list) else [ids]
+
+            return _to_fetch_results(await self._execute_fetch(payload, namespace))
+
+        if ids is None:
+            return _to_fetch_results(await self._execute_fetch(payload, namespace))
+
+        if not isinstance(ids, list):
+            ids = [ids]
+
+        return await self._fetch_ids(ids, payload, namespace, batch_size, max_workers)
+
+    async def _execute_fetch(
+        self, payload: Dict[str, Any], namespace: str
+    ) -> List[Any]:
+        return await self._execute_request_async(
             payload=payload, path=_path_for(namespace, FETCH_PATH)
         )
 
-        return [
-            FetchResult._from_json(vector) if vector else None for vector in vectors
-        ]
+    async def _fetch_ids(
+        self,
+        ids: List[str],
+        payload: Dict[str, Any],
+        namespace: str,
+        batch_size: int,
+        max_workers: int,
+    ) -> List[Optional[FetchResult]]:
+        """
+        Fetches the vectors of the ids in chunks, and returns them in the
+        order of the ids. When there is a fetch cache, only the ids missing
+        from it are fetched.
+        """
+        if batch_size <= 0:
+            raise ClientError("batch_size must be greater than 0")
+
+        cache = self._fetch_cache
+        if cache is None:
+            return _to_fetch_results(
+                await self._fetch_chunks(
+                    ids, payload, namespace, batch_size, max_workers
+                )
+            )
+
+        generation = cache._generation(namespace)
+        vectors = cache._get_many(namespace, ids, payload)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            fetched = await self._fetch_chunks(
+                [ids[i] for i in missing], payload, namespace, batch_size, max_workers
+            )
+            cache._put_many(self._codec, namespace, fetched, payload, generation)
+            for i, vector in zip(missing, fetched):
+                vectors[i] = vector
+
+        return _to_fetch_results(vectors)
+
+    async def _fetch_chunks(
+        self,
+        ids: List[str],
+        payload: Dict[str, Any],
+        namespace: str,
+        batch_size: int,
+        max_workers: int,
+    ) -> List[Any]:
+        if len(ids) <= batch_size:
+            return await self._execute_fetch({**payload, "ids": ids}, namespace)
+
+        async def fetch_chunk(start: int) -> List[Any]:
+            chunk = ids[start : start + batch_size]
+            return await self._execute_fetch({**payload, "ids": chunk}, namespace)
+
+        vectors: List[Any] = [None] * len(ids)
+        async for _, start, fetched, error in run_batches_async(
+            fetch_chunk, range(0, len(ids), batch_size), max_workers
+        ):
+            if error is not None:
+                raise error
+
+            vectors[start : start + batch_size] = cast(List[Any], fetched)
+
+        return vectors
 
     async def update(
         self,
@@ -1204,26 +3131,14 @@ class AsyncIndexOperations:
         updated = await index.update("id1", metadata={"new_field": "new_value"})
         ```
         """
-        payload: Dict[str, Any] = {
-            "id": id,
-            "metadataUpdateMode": metadata_update_mode.value,
-        }
-
-        if vector is not None:
-            payload["vector"] = to_list(vector)
-
-        if sparse_vector is not None:
-            sparse = to_sparse_vector(sparse_vector)
-            payload["sparseVector"] = {
-                "indices": sparse.indices,
-                "values": sparse.values,
-            }
-
-        if data is not None:
-            payload["data"] = data
-
-        if metadata is not None:
-            payload["metadata"] = metadata
+        payload = update_to_payload(
+            id,
+            vector=vector,
+            data=data,
+            metadata=metadata,
+            metadata_update_mode=metadata_update_mode,
+            sparse_vector=sparse_vector,
+        )
 
         result = await self._execute_request_async(
             payload=payload, path=_path_for(namespace, UPDATE_PATH)
@@ -1231,6 +3146,74 @@ class AsyncIndexOperations:
         updated = result["updated"]
         return updated == 1
 
+    async def update_many(
+        self,
+        updates: Union[Iterable[UpdateRequest], AsyncIterable[UpdateRequest]],
+        namespace: str = DEFAULT_NAMESPACE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+    ) -> UpdateManyResult:
+        """
+        Updates many vectors asynchronously, sending the updates concurrently.
+
+        Each update takes the same fields as the parameters of `update`.
+        The updates are pulled from the iterable lazily, so that
+        arbitrarily large inputs, like generators, can be streamed.
+
+        A failing update does not stop the rest of the updates. The failed
+        updates are reported in the `errors` field of the result.
+
+        :param updates: The iterable of updates to make.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param max_workers: Maximum number of requests in flight at the same time.
+        :param on_progress: Callback to call with the overall progress after each update completes.
+
+        Example usage:
+
+        ```python
+        from upstash_vector.types import MetadataUpdateMode
+
+        res = await index.update_many(
+            updates=(
+                {
+                    "id": id,
+                    "metadata": {"score": score},
+                    "metadata_update_mode": MetadataUpdateMode.PATCH,
+                }
+                for id, score in scores.items()
+            ),
+            max_workers=16,
+        )
+
+        print(res.updated, res.not_found)
+        for error in res.errors:
+            print(error.batch, error.ids, error.error)
+        ```
+        """
+        path = _path_for(namespace, UPDATE_PATH)
+
+        async def update_one(update: UpdateRequest) -> bool:
+            payload = update_request_to_payload(update)
+            result = await self._execute_request_async(payload=payload, path=path)
+            return result["updated"] == 1
+
+        collector: BatchCollector[bool] = BatchCollector(
+            on_progress, keep_results=False
+        )
+        updated = 0
+        async for i, update, result, error in run_batches_async(
+            update_one, updates, max_workers
+        ):
+            collector.add(i, update_request_ids(update), result, error)
+            if result:
+                updated += 1
+
+        return UpdateManyResult(
+            updated=updated,
+            not_found=collector.progress.completed_items - updated,
+            errors=collector.errors,
+        )
+
     async def info(self) -> InfoResult:
         """
         Returns the index info asynchronously, including:
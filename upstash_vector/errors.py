@@ -1,5 +1,11 @@
+from typing import Optional
+
+
 class UpstashError(Exception):
-    pass
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        """HTTP status code of the response the error is read from, if any."""
 
 
 class ClientError(Exception):
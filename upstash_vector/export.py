@@ -0,0 +1,403 @@
+import os
+from typing import Any, AsyncIterable, Iterable, Iterator, List, Optional
+
+from upstash_vector.client import AsyncIndex, Index
+from upstash_vector.codec import JSONCodec
+from upstash_vector.core.index_operations import (
+    DEFAULT_NAMESPACE,
+    DEFAULT_RANGE_MAX_LIMIT,
+)
+from upstash_vector.errors import ClientError
+from upstash_vector.types import ExportResult, FetchResult, InfoResult
+
+DENSE_VECTORS_FILE = "vectors.f32"
+SPARSE_INDICES_FILE = "sparse_indices.i32"
+SPARSE_VALUES_FILE = "sparse_values.f32"
+SPARSE_INDPTR_FILE = "sparse_indptr.i64"
+MANIFEST_FILE = "manifest.json"
+RECORDS_FILES = {
+    "jsonl": "records.jsonl",
+    "parquet": "records.parquet",
+}
+
+
+class _ExportWriter:
+    """
+    Writes the vectors to the export files, a batch at a time.
+
+    The dense vectors are written to a memory mapped file that is grown
+    when the namespace has more vectors than expected, and truncated to the
+    number of vectors at the end. The sparse vectors are appended to the
+    files of the CSR arrays.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        format: str,
+        dimension: int,
+        sparse: bool,
+        capacity: int,
+        codec: JSONCodec,
+    ):
+        import numpy as np
+
+        if format not in RECORDS_FILES:
+            raise ClientError(
+                f"Unsupported export format: {format}. Must be one of {list(RECORDS_FILES)}"
+            )
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._np = np
+        self._directory = directory
+        self._format = format
+        self._dimension = dimension
+        self._sparse = sparse
+        self._codec = codec
+        self._count = 0
+        self._nnz = 0
+
+        self._dense: Any = None
+        if dimension > 0:
+            # memmap cannot map an empty file, so at least a row is allocated
+            self._capacity = max(capacity, 1)
+            self._dense = np.memmap(
+                self._path(DENSE_VECTORS_FILE),
+                dtype=np.float32,
+                mode="w+",
+                shape=(self._capacity, dimension),
+            )
+
+        self._sparse_files: List[Any] = []
+        if sparse:
+            self._sparse_files = [
+                open(self._path(name), "wb")
+                for name in (
+                    SPARSE_INDICES_FILE,
+                    SPARSE_VALUES_FILE,
+                    SPARSE_INDPTR_FILE,
+                )
+            ]
+            np.zeros(1, dtype=np.int64).tofile(self._sparse_files[2])
+
+        self._records: Any
+        if format == "parquet":
+            import pyarrow as pa  # type: ignore[import-untyped]
+            import pyarrow.parquet as pq  # type: ignore[import-untyped]
+
+            self._pa = pa
+            self._schema = pa.schema(
+                [("id", pa.string()), ("metadata", pa.string()), ("data", pa.string())]
+            )
+            self._records = pq.ParquetWriter(
+                self._path(RECORDS_FILES[format]), self._schema
+            )
+        else:
+            self._records = open(self._path(RECORDS_FILES[format]), "wb")
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._directory, name)
+
+    def write(self, vectors: List[FetchResult]) -> None:
+        if not vectors:
+            return
+
+        self._write_records(vectors)
+
+        if self._dense is not None:
+            self._write_dense(vectors)
+
+        if self._sparse:
+            self._write_sparse(vectors)
+
+        self._count += len(vectors)
+
+    def _write_records(self, vectors: List[FetchResult]) -> None:
+        codec = self._codec
+
+        if self._format == "parquet":
+            metadata = [
+                None if v.metadata is None else codec.dumps(v.metadata).decode()
+                for v in vectors
+            ]
+            batch = self._pa.record_batch(
+                [
+                    self._pa.array([v.id for v in vectors], self._pa.string()),
+                    self._pa.array(metadata, self._pa.string()),
+                    self._pa.array([v.data for v in vectors], self._pa.string()),
+                ],
+                schema=self._schema,
+            )
+            self._records.write_batch(batch)
+            return
+
+        self._records.write(
+            b"".join(
+                codec.dumps({"id": v.id, "metadata": v.metadata, "data": v.data})
+                + b"\n"
+                for v in vectors
+            )
+        )
+
+    def _write_dense(self, vectors: List[FetchResult]) -> None:
+        np = self._np
+        end = self._count + len(vectors)
+        if end > self._capacity:
+            self._grow(max(end, 2 * self._capacity))
+
+        rows = self._dense[self._count : end]
+        for row, v in zip(rows, vectors):
+            if v.vector is None:
+                row[:] = 0
+            else:
+                row[:] = np.asarray(v.vector, dtype=np.float32)
+
+    def _grow(self, capacity: int) -> None:
+        # the namespace has more vectors than at the start of the export
+        self._dense.flush()
+        self._dense = None
+        self._capacity = capacity
+        self._dense = self._np.memmap(
+            self._path(DENSE_VECTORS_FILE),
+            dtype=self._np.float32,
+            mode="r+",
+            shape=(capacity, self._dimension),
+        )
+
+    def _write_sparse(self, vectors: List[FetchResult]) -> None:
+        np = self._np
+        indices_file, values_file, indptr_file = self._sparse_files
+
+        indptr = np.empty(len(vectors), dtype=np.int64)
+        for i, v in enumerate(vectors):
+            if v.sparse_vector is not None:
+                indices = np.asarray(v.sparse_vector.indices, dtype=np.int32)
+                indices.tofile(indices_file)
+                np.asarray(v.sparse_vector.values, dtype=np.float32).tofile(values_file)
+                self._nnz += len(indices)
+
+            indptr[i] = self._nnz
+
+        indptr.tofile(indptr_file)
+
+    def close(self) -> None:
+        if self._dense is not None:
+            self._dense.flush()
+            self._dense = None
+
+        for f in self._sparse_files:
+            f.close()
+
+        self._records.close()
+
+    def finish(self, namespace: str) -> ExportResult:
+        self.close()
+
+        if self._dimension > 0:
+            # drop the rows allocated, but not written to
+            os.truncate(
+                self._path(DENSE_VECTORS_FILE), self._count * self._dimension * 4
+            )
+
+        result = ExportResult(
+            directory=self._directory,
+            vector_count=self._count,
+            dimension=self._dimension,
+            format=self._format,
+            sparse=self._sparse,
+        )
+
+        manifest = {
+            "namespace": namespace,
+            "vectorCount": result.vector_count,
+            "dimension": result.dimension,
+            "format": result.format,
+            "sparse": result.sparse,
+        }
+        with open(self._path(MANIFEST_FILE), "wb") as f:
+            f.write(self._codec.dumps(manifest))
+
+        return result
+
+
+def _open_writer(
+    index: Any,
+    info: InfoResult,
+    directory: str,
+    namespace: str,
+    format: str,
+    include_vectors: bool,
+) -> _ExportWriter:
+    dense = info.dense_index is not None or info.sparse_index is None
+    ns_info = info.namespaces.get(namespace)
+    capacity = (
+        0 if ns_info is None else ns_info.vector_count + ns_info.pending_vector_count
+    )
+
+    return _ExportWriter(
+        directory=directory,
+        format=format,
+        dimension=info.dimension if include_vectors and dense else 0,
+        sparse=include_vectors and info.sparse_index is not None,
+        capacity=capacity,
+        codec=index.codec,
+    )
+
+
+def _batches(
+    vectors: Iterable[FetchResult], batch_size: int
+) -> Iterator[List[FetchResult]]:
+    batch: List[FetchResult] = []
+    for vector in vectors:
+        batch.append(vector)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def export_namespace(
+    index: Index,
+    directory: str,
+    namespace: str = DEFAULT_NAMESPACE,
+    format: str = "jsonl",
+    include_vectors: bool = True,
+    include_metadata: bool = True,
+    include_data: bool = True,
+    prefix: Optional[str] = None,
+    batch_size: int = DEFAULT_RANGE_MAX_LIMIT,
+) -> ExportResult:
+    """
+    Exports the vectors of a namespace to files in the given directory,
+    by scanning the namespace with `range`.
+
+    The vectors are written a batch at a time, so the namespace is never
+    held in memory as a whole. The i-th row of all the files belongs to
+    the same vector:
+
+    - `vectors.f32`: Dense vectors, as a raw float32 matrix of shape `(vector_count, dimension)`, to be opened with `np.memmap`.
+    - `sparse_indices.i32`, `sparse_values.f32`, and `sparse_indptr.i64`: Sparse vectors, as the arrays of a CSR matrix.
+    - `records.jsonl` or `records.parquet`: Ids, metadata as JSON, and data.
+    - `manifest.json`: Number of vectors and the dimension, written once the export completes.
+
+    Requires `numpy` to be installed, and `pyarrow` for the Parquet format.
+
+    :param index: The index to export from.
+    :param directory: Directory to write the files to. It is created if it does not exist.
+    :param namespace: The namespace to export. When not specified, the default namespace is used.
+    :param format: Format of the ids, metadata, and data. Either `jsonl` or `parquet`.
+    :param include_vectors: Whether to export the dense and sparse vectors or not.
+    :param include_metadata: Whether to export the metadata or not.
+    :param include_data: Whether to export the unstructured data or not.
+    :param prefix: Prefix of vector ids to export.
+    :param batch_size: Number of vectors to write to the files at once.
+
+    Example usage:
+
+    ```python
+    from upstash_vector.export import export_namespace
+
+    res = export_namespace(index, "backup", namespace="ns", format="parquet")
+    vectors = np.memmap(
+        "backup/vectors.f32",
+        dtype=np.float32,
+        mode="r",
+        shape=(res.vector_count, res.dimension),
+    )
+    ```
+    """
+    if batch_size <= 0:
+        raise ClientError("batch_size must be greater than 0")
+
+    writer = _open_writer(
+        index, index.info(), directory, namespace, format, include_vectors
+    )
+    try:
+        vectors = index.iter_range(
+            limit=batch_size,
+            max_limit=max(batch_size, DEFAULT_RANGE_MAX_LIMIT),
+            include_vectors=include_vectors,
+            include_metadata=include_metadata,
+            include_data=include_data,
+            namespace=namespace,
+            prefix=prefix,
+        )
+        for batch in _batches(vectors, batch_size):
+            writer.write(batch)
+    except BaseException:
+        writer.close()
+        raise
+
+    return writer.finish(namespace)
+
+
+async def export_namespace_async(
+    index: AsyncIndex,
+    directory: str,
+    namespace: str = DEFAULT_NAMESPACE,
+    format: str = "jsonl",
+    include_vectors: bool = True,
+    include_metadata: bool = True,
+    include_data: bool = True,
+    prefix: Optional[str] = None,
+    batch_size: int = DEFAULT_RANGE_MAX_LIMIT,
+) -> ExportResult:
+    """
+    Exports the vectors of a namespace asynchronously to files in the given
+    directory, by scanning the namespace with `range`.
+
+    The files are the same as the ones of `export_namespace`. Writing to
+    the files is blocking, but the next page is fetched while a batch is
+    being written.
+
+    :param index: The index to export from.
+    :param directory: Directory to write the files to. It is created if it does not exist.
+    :param namespace: The namespace to export. When not specified, the default namespace is used.
+    :param format: Format of the ids, metadata, and data. Either `jsonl` or `parquet`.
+    :param include_vectors: Whether to export the dense and sparse vectors or not.
+    :param include_metadata: Whether to export the metadata or not.
+    :param include_data: Whether to export the unstructured data or not.
+    :param prefix: Prefix of vector ids to export.
+    :param batch_size: Number of vectors to write to the files at once.
+
+    Example usage:
+
+    ```python
+    from upstash_vector.export import export_namespace_async
+
+    res = await export_namespace_async(index, "backup", namespace="ns")
+    ```
+    """
+    if batch_size <= 0:
+        raise ClientError("batch_size must be greater than 0")
+
+    writer = _open_writer(
+        index, await index.info(), directory, namespace, format, include_vectors
+    )
+    try:
+        vectors: AsyncIterable[FetchResult] = index.iter_range(
+            limit=batch_size,
+            max_limit=max(batch_size, DEFAULT_RANGE_MAX_LIMIT),
+            include_vectors=include_vectors,
+            include_metadata=include_metadata,
+            include_data=include_data,
+            namespace=namespace,
+            prefix=prefix,
+        )
+
+        batch: List[FetchResult] = []
+        async for vector in vectors:
+            batch.append(vector)
+            if len(batch) == batch_size:
+                writer.write(batch)
+                batch = []
+
+        writer.write(batch)
+    except BaseException:
+        writer.close()
+        raise
+
+    return writer.finish(namespace)
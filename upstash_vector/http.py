@@ -1,18 +1,33 @@
 import asyncio
+import gzip
+import math
 import os
+import random
 import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
 from platform import python_version
-from typing import Any, Dict
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple, Type, Union
 
-from httpx import AsyncClient, Client
+from httpx import (
+    USE_CLIENT_DEFAULT,
+    AsyncClient,
+    Client,
+    Response,
+    Timeout,
+    TransportError,
+)
 
 from upstash_vector import __version__
-from upstash_vector.errors import UpstashError
+from upstash_vector.codec import JSONCodec
+from upstash_vector.errors import ClientError, UpstashError
+from upstash_vector.limiter import AdaptiveConcurrencyLimiter, RateLimiter
 
 
 def generate_headers(token: str, allow_telemetry: bool) -> Dict[str, str]:
     headers = {
         "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
     }
 
     if allow_telemetry:
@@ -31,65 +46,358 @@ def generate_headers(token: str, allow_telemetry: bool) -> Dict[str, str]:
     return headers
 
 
+@dataclass
+class RetryPolicy:
+    """
+    Configures how the failed requests are retried.
+
+    The delay before the n-th retry is chosen uniformly at random between
+    zero and `min(max_backoff, initial_backoff * multiplier ** n)` (i.e. full
+    jitter), so that the clients failing at the same time do not retry in
+    lockstep. When the response has a `Retry-After` header, the delay is
+    at least as long as that, up to `max_backoff`.
+    """
+
+    retries: int = 3
+    """Maximum number of retries, after the first attempt."""
+
+    initial_backoff: float = 1.0
+    """Upper bound of the delay before the first retry, in seconds."""
+
+    max_backoff: float = 30.0
+    """
+    Upper bound of the delay before any retry, in seconds. It applies to
+    the delays asked for by the `Retry-After` headers as well.
+    """
+
+    multiplier: float = 2.0
+    """Factor the upper bound of the delay grows by, after each retry."""
+
+    jitter: bool = True
+    """Whether to randomize the delays, or use their upper bounds as they are."""
+
+    retry_statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    """HTTP status codes of the responses to retry."""
+
+    retry_exceptions: Tuple[Type[Exception], ...] = (TransportError,)
+    """Types of the exceptions raised while sending the request to retry."""
+
+    respect_retry_after: bool = True
+    """Whether to wait at least as long as the `Retry-After` header of the response."""
+
+    total_timeout: Optional[float] = None
+    """
+    Time budget for all the attempts, in seconds. No more retries are
+    made once the next one cannot be started within the budget.
+    """
+
+    def _delay(
+        self,
+        retry: int,
+        response: Optional[Response],
+        deadline: Optional[float],
+    ) -> Optional[float]:
+        """
+        Returns the delay before the given retry, or `None` if
+        it should not be made.
+        """
+        if retry >= self.retries:
+            return None
+
+        delay = min(self.max_backoff, self.initial_backoff * self.multiplier**retry)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        if self.respect_retry_after and response is not None:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = max(delay, min(self.max_backoff, retry_after))
+
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            return None
+
+        return delay
+
+    def _deadline(self) -> Optional[float]:
+        if self.total_timeout is None:
+            return None
+
+        return time.monotonic() + self.total_timeout
+
+
+@dataclass
+class Compression:
+    """
+    Configures the compression of the request bodies.
+
+    Bodies smaller than the threshold are sent as they are, since
+    compressing them does not pay off.
+
+    The responses are decompressed transparently, as the `gzip` and
+    `deflate` encodings (and `br` and `zstd`, when their decoders are
+    installed) are advertised in the `Accept-Encoding` header.
+    """
+
+    algorithm: str = "gzip"
+    """
+    Compression algorithm, either `gzip` or `zstd`. `zstd` requires
+    the `zstd` extra to be installed.
+    """
+
+    threshold: int = 16 * 1024
+    """Minimum size of the request body to compress, in bytes."""
+
+    level: Optional[int] = None
+    """Compression level. Defaults to the default level of the algorithm."""
+
+    _compress: Callable[[bytes], bytes] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.threshold < 0:
+            raise ClientError("threshold must not be negative")
+
+        if self.algorithm == "gzip":
+            level = 6 if self.level is None else self.level
+            self._compress = lambda data: gzip.compress(
+                data, compresslevel=level, mtime=0
+            )
+        elif self.algorithm == "zstd":
+            import zstandard  # type: ignore[import-not-found]
+
+            level = 3 if self.level is None else self.level
+            # compressors cannot be shared across threads
+            self._compress = lambda data: zstandard.ZstdCompressor(
+                level=level
+            ).compress(data)
+        else:
+            raise ClientError(
+                f"Unsupported compression algorithm: {self.algorithm}. "
+                "Use `gzip` or `zstd`."
+            )
+
+    def _apply(
+        self, content: bytes, headers: Dict[str, str]
+    ) -> Tuple[bytes, Dict[str, str]]:
+        if len(content) < self.threshold:
+            return content, headers
+
+        return self._compress(content), {
+            **headers,
+            "Content-Encoding": self.algorithm,
+        }
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        # reject the values like `inf`, `nan`, or `-1`
+        if not math.isfinite(seconds) or seconds < 0:
+            return None
+
+        return seconds
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, date.timestamp() - time.time())
+
+
 def execute_with_parameters(
     url: str,
     client: Client,
     headers: Dict[str, str],
-    retries: int,
-    retry_interval: float,
+    retry_policy: RetryPolicy,
     payload: Any,
+    codec: JSONCodec,
+    rate_limiter: Optional[RateLimiter] = None,
+    concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    timeout: Optional[Union[float, Timeout]] = None,
+    compression: Optional[Compression] = None,
 ) -> Any:
-    response = None
-    last_error = None
+    content = None if payload is None else codec.dumps(payload)
+    if content is not None and compression is not None:
+        content, headers = compression._apply(content, headers)
 
-    for attempts_left in range(max(0, retries), -1, -1):
-        try:
-            response = client.post(url=url, headers=headers, json=payload)
-            break
+    deadline = retry_policy._deadline()
+    retry = 0
 
-        except Exception as e:
-            last_error = e
-            if attempts_left > 0:
-                time.sleep(retry_interval)
+    while True:
+        if rate_limiter is not None:
+            rate_limiter.acquire(len(content) if content else 0)
 
-    if response is None:
-        assert last_error is not None
-        raise last_error
+        try:
+            response = _post(
+                client,
+                url,
+                headers,
+                content,
+                timeout,
+                retry_policy,
+                concurrency_limiter,
+            )
+        except retry_policy.retry_exceptions:
+            delay = retry_policy._delay(retry, None, deadline)
+            if delay is None:
+                raise
+        else:
+            if response.status_code not in retry_policy.retry_statuses:
+                break
 
-    body = response.json()
-    if "error" in body:
-        raise UpstashError(body["error"])
+            delay = retry_policy._delay(retry, response, deadline)
+            if delay is None:
+                break
 
-    return body["result"]
+        time.sleep(delay)
+        retry += 1
+
+    return _parse_response(response, codec)
 
 
 async def execute_with_parameters_async(
     client: AsyncClient,
     url: str,
     headers: Dict[str, str],
-    retries: int,
-    retry_interval: float,
+    retry_policy: RetryPolicy,
     payload: Any,
+    codec: JSONCodec,
+    rate_limiter: Optional[RateLimiter] = None,
+    concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    timeout: Optional[Union[float, Timeout]] = None,
+    compression: Optional[Compression] = None,
 ) -> Any:
-    response = None
-    last_error = None
+    content = None if payload is None else codec.dumps(payload)
+    if content is not None and compression is not None:
+        content, headers = compression._apply(content, headers)
+
+    deadline = retry_policy._deadline()
+    retry = 0
+
+    while True:
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async(len(content) if content else 0)
 
-    for attempts_left in range(max(0, retries), -1, -1):
         try:
-            response = await client.post(url=url, headers=headers, json=payload)
-            break
+            response = await _post_async(
+                client,
+                url,
+                headers,
+                content,
+                timeout,
+                retry_policy,
+                concurrency_limiter,
+            )
+        except retry_policy.retry_exceptions:
+            delay = retry_policy._delay(retry, None, deadline)
+            if delay is None:
+                raise
+        else:
+            if response.status_code not in retry_policy.retry_statuses:
+                break
+
+            delay = retry_policy._delay(retry, response, deadline)
+            if delay is None:
+                break
+
+        await asyncio.sleep(delay)
+        retry += 1
+
+    return _parse_response(response, codec)
+
+
+def _post(
+    client: Client,
+    url: str,
+    headers: Dict[str, str],
+    content: Optional[bytes],
+    timeout: Optional[Union[float, Timeout]],
+    retry_policy: RetryPolicy,
+    concurrency_limiter: Optional[AdaptiveConcurrencyLimiter],
+) -> Response:
+    if concurrency_limiter is not None:
+        concurrency_limiter.acquire()
+
+    start = time.monotonic()
+    latency: Optional[float] = None
+    overloaded = False
+    try:
+        response = client.post(
+            url=url,
+            headers=headers,
+            content=content,
+            timeout=USE_CLIENT_DEFAULT if timeout is None else timeout,
+        )
+        latency = time.monotonic() - start
+        overloaded = response.status_code in retry_policy.retry_statuses
+        return response
+    except retry_policy.retry_exceptions:
+        latency = time.monotonic() - start
+        overloaded = True
+        raise
+    finally:
+        # the requests that do not complete for other reasons, like
+        # the cancelled ones, release their slot without adapting the limit
+        if concurrency_limiter is not None:
+            concurrency_limiter.release(latency, overloaded)
+
+
+async def _post_async(
+    client: AsyncClient,
+    url: str,
+    headers: Dict[str, str],
+    content: Optional[bytes],
+    timeout: Optional[Union[float, Timeout]],
+    retry_policy: RetryPolicy,
+    concurrency_limiter: Optional[AdaptiveConcurrencyLimiter],
+) -> Response:
+    if concurrency_limiter is not None:
+        await concurrency_limiter.acquire_async()
+
+    start = time.monotonic()
+    latency: Optional[float] = None
+    overloaded = False
+    try:
+        response = await client.post(
+            url=url,
+            headers=headers,
+            content=content,
+            timeout=USE_CLIENT_DEFAULT if timeout is None else timeout,
+        )
+        latency = time.monotonic() - start
+        overloaded = response.status_code in retry_policy.retry_statuses
+        return response
+    except retry_policy.retry_exceptions:
+        latency = time.monotonic() - start
+        overloaded = True
+        raise
+    finally:
+        # the requests that do not complete for other reasons, like
+        # the cancelled ones, release their slot without adapting the limit
+        if concurrency_limiter is not None:
+            concurrency_limiter.release(latency, overloaded)
+
 
-        except Exception as e:
-            last_error = e
-            if attempts_left > 0:
-                await asyncio.sleep(retry_interval)
+def _parse_response(response: Response, codec: JSONCodec) -> Any:
+    try:
+        body = codec.loads(response.content)
+    except Exception:
+        if response.is_error:
+            # the error responses of the proxies in front of
+            # the server might not be in JSON
+            raise UpstashError(
+                f"{response.status_code}: {response.text}", response.status_code
+            )
 
-    if response is None:
-        assert last_error is not None
-        raise last_error
+        raise
 
-    body = response.json()
     if "error" in body:
-        raise UpstashError(body["error"])
+        raise UpstashError(body["error"], response.status_code)
 
     return body["result"]
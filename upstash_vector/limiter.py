@@ -0,0 +1,317 @@
+import asyncio
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from upstash_vector.errors import ClientError
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0:
+            raise ClientError("rate must be greater than 0")
+
+        if capacity <= 0:
+            raise ClientError("burst must be greater than 0")
+
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+
+    def reserve(self, cost: float, now: float) -> float:
+        """
+        Takes the tokens out of the bucket, and returns how long to
+        wait before they become available.
+
+        The bucket is allowed to go into debt, so that the costs larger
+        than the capacity of the bucket are still served, by making the
+        following reservations wait longer.
+        """
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._last) * self._rate
+        )
+        self._last = now
+
+        self._tokens -= cost
+        if self._tokens >= 0:
+            return 0.0
+
+        return -self._tokens / self._rate
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter, based on the token bucket algorithm.
+
+    Limits the number of requests per second, the number of bytes
+    of the request bodies sent per second, or both.
+
+    The same limiter can be shared by many `Index` and `AsyncIndex`
+    instances, across threads and coroutines, to keep the whole process
+    under a quota.
+
+    Example usage:
+
+    ```python
+    from upstash_vector import Index
+    from upstash_vector.limiter import RateLimiter
+
+    limiter = RateLimiter(requests_per_second=100, bytes_per_second=5 * 1024 * 1024)
+
+    index1 = Index(url=<url>, token=<token>, rate_limiter=limiter)
+    index2 = Index(url=<url>, token=<token>, rate_limiter=limiter)
+    ```
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        bytes_per_second: Optional[float] = None,
+        request_burst: Optional[float] = None,
+        byte_burst: Optional[float] = None,
+    ):
+        """
+        :param requests_per_second: Maximum number of requests per second, on average.
+        :param bytes_per_second: Maximum number of request body bytes per second, on average.
+        :param request_burst: Maximum number of requests that can be sent at once, after being idle. Defaults to `requests_per_second`.
+        :param byte_burst: Maximum number of bytes that can be sent at once, after being idle. Defaults to `bytes_per_second`.
+        """
+        if requests_per_second is None and bytes_per_second is None:
+            raise ClientError(
+                "At least one of `requests_per_second` or `bytes_per_second` must be set."
+            )
+
+        self._lock = threading.Lock()
+
+        self._requests = None
+        if requests_per_second is not None:
+            self._requests = _TokenBucket(
+                requests_per_second, request_burst or requests_per_second
+            )
+
+        self._bytes = None
+        if bytes_per_second is not None:
+            self._bytes = _TokenBucket(bytes_per_second, byte_burst or bytes_per_second)
+
+    def _reserve(self, size: int) -> float:
+        with self._lock:
+            now = time.monotonic()
+            delay = 0.0
+
+            if self._requests is not None:
+                delay = max(delay, self._requests.reserve(1, now))
+
+            if self._bytes is not None:
+                delay = max(delay, self._bytes.reserve(size, now))
+
+            return delay
+
+    def acquire(self, size: int = 0) -> None:
+        """
+        Blocks until a request with a body of the given size in bytes can be sent.
+        """
+        delay = self._reserve(size)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, size: int = 0) -> None:
+        """
+        Waits until a request with a body of the given size in bytes can be sent.
+        """
+        delay = self._reserve(size)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Client-side limiter for the number of requests in flight, which adapts
+    the limit to the latencies observed, based on the additive increase
+    multiplicative decrease (AIMD) algorithm.
+
+    While the latency stays close to the lowest latency observed, the
+    limit grows by one for each `limit` many successful requests. When the
+    latency rises above `latency_tolerance` times the lowest latency,
+    or a request fails due to overload (i.e. with a network error, or a
+    retryable status code), the limit is multiplied by the `backoff_ratio`.
+    The requests that do not complete, like the cancelled ones, leave the
+    limit as it is.
+
+    It applies to all requests of the clients it is given to, so the
+    concurrent requests of the `upsert_many`, `fetch`, `query_many`, and
+    similar methods are limited as well. In that case, their `max_workers`
+    parameter acts as an upper bound for the number of requests in flight.
+
+    The same limiter can be shared by many `Index` and `AsyncIndex`
+    instances, across threads and coroutines.
+
+    Example usage:
+
+    ```python
+    from upstash_vector import Index
+    from upstash_vector.limiter import AdaptiveConcurrencyLimiter
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=64)
+    index = Index(url=<url>, token=<token>, concurrency_limiter=limiter)
+
+    index.upsert_many(vectors, max_workers=64)
+
+    print(limiter.limit, limiter.latency)
+    ```
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        latency_tolerance: float = 2.0,
+        backoff_ratio: float = 0.5,
+        smoothing: float = 0.2,
+    ):
+        """
+        :param initial_limit: Number of requests allowed in flight initially.
+        :param min_limit: Lower bound for the limit.
+        :param max_limit: Upper bound for the limit.
+        :param latency_tolerance: How many times the lowest latency observed the latency can grow to, before the limit is decreased.
+        :param backoff_ratio: Ratio to multiply the limit with, when it is decreased.
+        :param smoothing: Weight of the latest latency in the exponential moving average of the latencies.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ClientError(
+                "The limits must satisfy 1 <= min_limit <= initial_limit <= max_limit."
+            )
+
+        if latency_tolerance <= 1:
+            raise ClientError("latency_tolerance must be greater than 1")
+
+        if not 0 < backoff_ratio < 1:
+            raise ClientError("backoff_ratio must be between 0 and 1")
+
+        if not 0 < smoothing <= 1:
+            raise ClientError("smoothing must be between 0 and 1")
+
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._latency_tolerance = latency_tolerance
+        self._backoff_ratio = backoff_ratio
+        self._smoothing = smoothing
+
+        self._condition = threading.Condition()
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._latency: Optional[float] = None
+        self._min_latency: Optional[float] = None
+        # number of requests to complete, before the limit
+        # can be decreased again
+        self._cooldown = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests in flight."""
+        return self._in_flight
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Exponential moving average of the recent latencies, in seconds."""
+        return self._latency
+
+    @property
+    def min_latency(self) -> Optional[float]:
+        """Lowest latency observed, in seconds, which is used as the baseline."""
+        return self._min_latency
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request can be sent.
+        """
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+
+            self._in_flight += 1
+
+    async def acquire_async(self) -> None:
+        """
+        Waits until a request can be sent.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                if self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return
+
+                future = loop.create_future()
+                self._async_waiters.append((loop, future))
+
+            await future
+
+    def release(self, latency: Optional[float], overloaded: bool = False) -> None:
+        """
+        Releases the request acquired, and adapts the limit.
+
+        :param latency: Latency of the request, in seconds. `None` when the request did not complete, for instance when it is cancelled, in which case the limit is not adapted.
+        :param overloaded: Whether the request failed due to overload.
+        """
+        with self._condition:
+            self._in_flight -= 1
+
+            if latency is not None:
+                self._cooldown = max(0, self._cooldown - 1)
+
+                if overloaded:
+                    self._decrease()
+                else:
+                    self._observe(latency)
+
+            self._condition.notify_all()
+
+            waiters = self._async_waiters
+            self._async_waiters = []
+
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_wake, future)
+
+    def _observe(self, latency: float) -> None:
+        if self._latency is None or self._min_latency is None:
+            self._latency = latency
+            self._min_latency = latency
+            return
+
+        self._latency += self._smoothing * (latency - self._latency)
+
+        if latency < self._min_latency:
+            self._min_latency = latency
+        else:
+            # drift towards the recent latencies slowly, so that the
+            # baseline can recover from an unusually fast outlier
+            self._min_latency += 0.001 * (latency - self._min_latency)
+
+        if self._latency > self._latency_tolerance * self._min_latency:
+            self._decrease()
+        elif self._in_flight + 1 >= int(self._limit):
+            # only grow when the current limit is actually used
+            self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+
+    def _decrease(self) -> None:
+        if self._cooldown > 0:
+            return
+
+        self._limit = max(self._min_limit, self._limit * self._backoff_ratio)
+        # wait for about a window of requests to complete with the
+        # new limit, before decreasing the limit again
+        self._cooldown = int(self._limit)
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
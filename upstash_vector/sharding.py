@@ -0,0 +1,775 @@
+import asyncio
+import bisect
+import hashlib
+import heapq
+import itertools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from upstash_vector.client import AsyncIndex, Index
+from upstash_vector.core.index_operations import DEFAULT_NAMESPACE
+from upstash_vector.errors import ClientError
+from upstash_vector.types import (
+    Data,
+    DeleteResult,
+    FetchResult,
+    FusionAlgorithm,
+    InfoResult,
+    MetadataUpdateMode,
+    NamespaceInfo,
+    QueryMode,
+    QueryResult,
+    RangeResult,
+    SparseVector,
+    SupportsToList,
+    TupleAsSparseVectorT,
+    Vector,
+    WeightingStrategy,
+)
+from upstash_vector.utils import sequence_to_vectors
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_VIRTUAL_NODES = 128
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class ConsistentHashRing:
+    """
+    Maps the keys to the shards, such that adding a shard to the end
+    only moves about `1 / number of shards` of the keys to the new shard.
+
+    Each shard is placed on the ring at `virtual_nodes` many points, so
+    that the keys are spread over the shards evenly.
+    """
+
+    def __init__(self, shards: int, virtual_nodes: int = DEFAULT_VIRTUAL_NODES):
+        if shards <= 0:
+            raise ClientError("There must be at least one shard.")
+
+        if virtual_nodes <= 0:
+            raise ClientError("virtual_nodes must be greater than 0")
+
+        points = sorted(
+            (_hash(f"shard-{shard}-{node}"), shard)
+            for shard in range(shards)
+            for node in range(virtual_nodes)
+        )
+        self._hashes = [h for h, _ in points]
+        self._shards = [shard for _, shard in points]
+
+    def shard_for(self, key: str) -> int:
+        """
+        Returns the index of the shard the key belongs to.
+        """
+        i = bisect.bisect(self._hashes, _hash(key))
+        return self._shards[i % len(self._shards)]
+
+
+def _group_by_shard(
+    ring: ConsistentHashRing, items: Sequence[T], key: Callable[[T], str]
+) -> Dict[int, List[Tuple[int, T]]]:
+    groups: Dict[int, List[Tuple[int, T]]] = {}
+    for i, item in enumerate(items):
+        groups.setdefault(ring.shard_for(key(item)), []).append((i, item))
+
+    return groups
+
+
+def _merge_top_k(results: List[List[QueryResult]], top_k: int) -> List[QueryResult]:
+    # the results of each shard are already sorted by score
+    merged = heapq.merge(*results, key=lambda r: r.score, reverse=True)
+    return list(itertools.islice(merged, top_k))
+
+
+def _merge_info(infos: List[InfoResult]) -> InfoResult:
+    namespaces: Dict[str, NamespaceInfo] = {}
+    for info in infos:
+        for ns, ns_info in info.namespaces.items():
+            merged = namespaces.setdefault(ns, NamespaceInfo(0, 0))
+            merged.vector_count += ns_info.vector_count
+            merged.pending_vector_count += ns_info.pending_vector_count
+
+    first = infos[0]
+    return InfoResult(
+        vector_count=sum(info.vector_count for info in infos),
+        pending_vector_count=sum(info.pending_vector_count for info in infos),
+        index_size=sum(info.index_size for info in infos),
+        dimension=first.dimension,
+        similarity_function=first.similarity_function,
+        dense_index=first.dense_index,
+        sparse_index=first.sparse_index,
+        namespaces=namespaces,
+    )
+
+
+def _parse_cursor(cursor: str, shards: int) -> List[Optional[str]]:
+    """
+    Parses the cursor into the cursors of the shards, where `None`
+    means the shard is exhausted.
+    """
+    if cursor == "":
+        return [""] * shards
+
+    try:
+        cursors = json.loads(cursor)
+    except ValueError:
+        cursors = None
+
+    if not isinstance(cursors, list) or len(cursors) != shards:
+        raise ClientError(f"Invalid cursor for {shards} shards: {cursor}")
+
+    return cursors
+
+
+def _range_plan(cursors: List[Optional[str]], limit: int) -> List[Tuple[int, int]]:
+    # spread the limit over the shards that are not exhausted yet
+    active = [i for i, cursor in enumerate(cursors) if cursor is not None]
+    if not active:
+        return []
+
+    share, extra = divmod(limit, len(active))
+    return [
+        (shard, share + (1 if j < extra else 0))
+        for j, shard in enumerate(active)
+        if share + (1 if j < extra else 0) > 0
+    ]
+
+
+def _merge_ranges(
+    cursors: List[Optional[str]],
+    ranged: List[Tuple[int, RangeResult]],
+) -> RangeResult:
+    next_cursors = list(cursors)
+    vectors: List[FetchResult] = []
+    for shard, result in ranged:
+        vectors.extend(result.vectors)
+        next_cursors[shard] = result.next_cursor or None
+
+    if all(cursor is None for cursor in next_cursors):
+        next_cursor = ""
+    else:
+        next_cursor = json.dumps(next_cursors, separators=(",", ":"))
+
+    return RangeResult(next_cursor=next_cursor, vectors=vectors)
+
+
+def _to_ids(ids: Union[str, List[str]]) -> List[str]:
+    return ids if isinstance(ids, list) else [ids]
+
+
+class ShardedIndex:
+    """
+    Spreads the vectors over many indexes, to scale past the limits
+    of a single index.
+
+    `upsert`, `fetch`, `update`, and `delete` by ids are routed to the shards
+    by consistent hashing of the ids. `query` is sent to all the shards, and
+    their results are merged into the global `top_k`. `info` and `range`
+    are sent to all the shards, and their results are aggregated.
+
+    The requests to the shards are sent concurrently. New shards must be
+    added to the end of the list, so that only a small part of the ids
+    map to a different shard. The vectors of those ids must be moved to
+    their new shards by the application.
+
+    Example usage:
+
+    ```python
+    from upstash_vector import Index
+    from upstash_vector.sharding import ShardedIndex
+
+    index = ShardedIndex(
+        [
+            Index(url=<url1>, token=<token1>),
+            Index(url=<url2>, token=<token2>),
+        ]
+    )
+
+    index.upsert(vectors=[("id1", [0.1, 0.2]), ("id2", [0.3, 0.4])])
+    res = index.query(vector=[0.1, 0.2], top_k=5)
+    ```
+    """
+
+    def __init__(self, shards: List[Index], virtual_nodes: int = DEFAULT_VIRTUAL_NODES):
+        """
+        :param shards: The indexes to spread the vectors over.
+        :param virtual_nodes: Number of points each shard is placed at on the hash ring.
+        """
+        self._shards = list(shards)
+        self._ring = ConsistentHashRing(len(self._shards), virtual_nodes)
+        self._executor = ThreadPoolExecutor(max_workers=len(self._shards))
+
+    def __enter__(self) -> "ShardedIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def shards(self) -> List[Index]:
+        """The indexes the vectors are spread over."""
+        return self._shards
+
+    def shard_for(self, id: str) -> Index:
+        """
+        Returns the shard the vector with the given id belongs to.
+        """
+        return self._shards[self._ring.shard_for(id)]
+
+    def close(self) -> None:
+        """
+        Stops the threads used for sending the requests to the shards.
+        """
+        self._executor.shutdown(wait=True)
+
+    def _fan_out(self, fn: Callable[[T], R], items: List[T]) -> List[R]:
+        if len(items) == 1:
+            return [fn(items[0])]
+
+        futures = [self._executor.submit(fn, item) for item in items]
+        return [future.result() for future in futures]
+
+    def upsert(
+        self,
+        vectors: Sequence[Union[Dict, tuple, Vector, Data]],
+        namespace: str = DEFAULT_NAMESPACE,
+    ) -> str:
+        """
+        Upserts(update or insert) vectors into their shards.
+
+        Takes the same parameters as `Index.upsert`.
+        """
+        converted = sequence_to_vectors(vectors)
+        groups = _group_by_shard(self._ring, converted, lambda v: str(v.id))
+
+        def upsert(shard: int) -> str:
+            return self._shards[shard].upsert(
+                [v for _, v in groups[shard]], namespace=namespace
+            )
+
+        self._fan_out(upsert, list(groups))
+        return "Success"
+
+    def fetch(
+        self,
+        ids: Optional[Union[str, List[str]]] = None,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        namespace: str = DEFAULT_NAMESPACE,
+        include_data: bool = False,
+        prefix: Optional[str] = None,
+    ) -> List[Optional[FetchResult]]:
+        """
+        Fetches details of a set of vectors from their shards.
+
+        The results of the ids are returned in the order of the ids.
+        When a prefix is given, all the shards are fetched from.
+
+        Takes the same parameters as `Index.fetch`.
+        """
+        options: Dict[str, Any] = {
+            "include_vectors": include_vectors,
+            "include_metadata": include_metadata,
+            "include_data": include_data,
+            "namespace": namespace,
+        }
+
+        if prefix is not None:
+            by_shard = self._fan_out(
+                lambda shard: shard.fetch(ids=ids, prefix=prefix, **options),
+                self._shards,
+            )
+            return [r for results in by_shard for r in results]
+
+        if ids is None:
+            return []
+
+        id_list = _to_ids(ids)
+        groups = _group_by_shard(self._ring, id_list, str)
+
+        def fetch(shard: int) -> List[Optional[FetchResult]]:
+            return self._shards[shard].fetch(
+                ids=[id for _, id in groups[shard]], **options
+            )
+
+        results: List[Optional[FetchResult]] = [None] * len(id_list)
+        for shard, fetched in zip(groups, self._fan_out(fetch, list(groups))):
+            for (i, _), result in zip(groups[shard], fetched):
+                results[i] = result
+
+        return results
+
+    def update(
+        self,
+        id: str,
+        vector: Optional[Union[List[float], SupportsToList]] = None,
+        data: Optional[str] = None,
+        metadata: Optional[Dict] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+        metadata_update_mode: MetadataUpdateMode = MetadataUpdateMode.OVERWRITE,
+        sparse_vector: Optional[Union[SparseVector, TupleAsSparseVectorT]] = None,
+    ) -> bool:
+        """
+        Updates a vector value, data, or metadata for the given id, in its shard.
+
+        Takes the same parameters as `Index.update`.
+        """
+        # routed like the upserts, which use the string form of the ids
+        return self.shard_for(str(id)).update(
+            id,
+            vector=vector,
+            data=data,
+            metadata=metadata,
+            namespace=namespace,
+            metadata_update_mode=metadata_update_mode,
+            sparse_vector=sparse_vector,
+        )
+
+    def delete(
+        self,
+        ids: Optional[Union[str, List[str]]] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+        prefix: Optional[str] = None,
+        filter: Optional[str] = None,
+    ) -> DeleteResult:
+        """
+        Deletes the given vector(s) from their shards.
+
+        When a prefix or a filter is given, the vectors are deleted from
+        all the shards. The number of deleted vectors is summed up.
+
+        Takes the same parameters as `Index.delete`.
+        """
+        if prefix is not None or filter is not None:
+            deleted = self._fan_out(
+                lambda shard: shard.delete(
+                    ids=ids, namespace=namespace, prefix=prefix, filter=filter
+                ),
+                self._shards,
+            )
+            return DeleteResult(deleted=sum(r.deleted for r in deleted))
+
+        if ids is None:
+            return DeleteResult(deleted=0)
+
+        groups = _group_by_shard(self._ring, _to_ids(ids), str)
+
+        def delete(shard: int) -> DeleteResult:
+            return self._shards[shard].delete(
+                ids=[id for _, id in groups[shard]], namespace=namespace
+            )
+
+        deleted = self._fan_out(delete, list(groups))
+        return DeleteResult(deleted=sum(r.deleted for r in deleted))
+
+    def query(
+        self,
+        vector: Optional[Union[List[float], SupportsToList]] = None,
+        top_k: int = 10,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        filter: str = "",
+        data: Optional[str] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+        include_data: bool = False,
+        sparse_vector: Optional[Union[SparseVector, TupleAsSparseVectorT]] = None,
+        weighting_strategy: Optional[WeightingStrategy] = None,
+        fusion_algorithm: Optional[FusionAlgorithm] = None,
+        query_mode: Optional[QueryMode] = None,
+    ) -> List[QueryResult]:
+        """
+        Queries `top_k` many similar vectors from all the shards, and
+        merges their results into the global `top_k` by score.
+
+        Takes the same parameters as `Index.query`.
+        """
+        results = self._fan_out(
+            lambda shard: shard.query(
+                vector=vector,
+                top_k=top_k,
+                include_vectors=include_vectors,
+                include_metadata=include_metadata,
+                filter=filter,
+                data=data,
+                namespace=namespace,
+                include_data=include_data,
+                sparse_vector=sparse_vector,
+                weighting_strategy=weighting_strategy,
+                fusion_algorithm=fusion_algorithm,
+                query_mode=query_mode,
+            ),
+            self._shards,
+        )
+        return _merge_top_k(results, top_k)
+
+    def range(
+        self,
+        cursor: str = "",
+        limit: int = 1,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        namespace: str = DEFAULT_NAMESPACE,
+        include_data: bool = False,
+        prefix: Optional[str] = None,
+    ) -> RangeResult:
+        """
+        Scans the vectors of all the shards starting from `cursor`, returns
+        at most `limit` many vectors.
+
+        The limit is spread over the shards that are not scanned through
+        yet, and the returned cursor keeps track of the cursors of all the
+        shards. The scan is complete when the returned cursor is empty.
+
+        Takes the same parameters as `Index.range`.
+        """
+        if limit <= 0:
+            raise ClientError("limit must be greater than 0")
+
+        cursors = _parse_cursor(cursor, len(self._shards))
+        plan = _range_plan(cursors, limit)
+
+        def range_shard(step: Tuple[int, int]) -> Tuple[int, RangeResult]:
+            shard, shard_limit = step
+            return shard, self._shards[shard].range(
+                cursor=cursors[shard] or "",
+                limit=shard_limit,
+                include_vectors=include_vectors,
+                include_metadata=include_metadata,
+                namespace=namespace,
+                include_data=include_data,
+                prefix=prefix,
+            )
+
+        return _merge_ranges(cursors, self._fan_out(range_shard, plan))
+
+    def reset(self, namespace: str = DEFAULT_NAMESPACE, all: bool = False) -> str:
+        """
+        Resets a namespace of all the shards.
+
+        Takes the same parameters as `Index.reset`.
+        """
+        self._fan_out(
+            lambda shard: shard.reset(namespace=namespace, all=all), self._shards
+        )
+        return "Success"
+
+    def info(self) -> InfoResult:
+        """
+        Returns the index info, aggregated over all the shards.
+
+        The counts and sizes are summed up, while the dimension and the
+        similarity function are the ones of the first shard.
+        """
+        return _merge_info(self._fan_out(lambda shard: shard.info(), self._shards))
+
+
+class AsyncShardedIndex:
+    """
+    Spreads the vectors over many indexes, to scale past the limits
+    of a single index.
+
+    `upsert`, `fetch`, `update`, and `delete` by ids are routed to the shards
+    by consistent hashing of the ids. `query` is sent to all the shards, and
+    their results are merged into the global `top_k`. `info` and `range`
+    are sent to all the shards, and their results are aggregated.
+
+    The requests to the shards are sent concurrently. New shards must be
+    added to the end of the list, so that only a small part of the ids
+    map to a different shard. The vectors of those ids must be moved to
+    their new shards by the application.
+
+    Example usage:
+
+    ```python
+    from upstash_vector import AsyncIndex
+    from upstash_vector.sharding import AsyncShardedIndex
+
+    index = AsyncShardedIndex(
+        [
+            AsyncIndex(url=<url1>, token=<token1>),
+            AsyncIndex(url=<url2>, token=<token2>),
+        ]
+    )
+
+    await index.upsert(vectors=[("id1", [0.1, 0.2]), ("id2", [0.3, 0.4])])
+    res = await index.query(vector=[0.1, 0.2], top_k=5)
+    ```
+    """
+
+    def __init__(
+        self, shards: List[AsyncIndex], virtual_nodes: int = DEFAULT_VIRTUAL_NODES
+    ):
+        """
+        :param shards: The indexes to spread the vectors over.
+        :param virtual_nodes: Number of points each shard is placed at on the hash ring.
+        """
+        self._shards = list(shards)
+        self._ring = ConsistentHashRing(len(self._shards), virtual_nodes)
+
+    @property
+    def shards(self) -> List[AsyncIndex]:
+        """The indexes the vectors are spread over."""
+        return self._shards
+
+    def shard_for(self, id: str) -> AsyncIndex:
+        """
+        Returns the shard the vector with the given id belongs to.
+        """
+        return self._shards[self._ring.shard_for(id)]
+
+    async def _fan_out(
+        self, fn: Callable[[T], Awaitable[R]], items: List[T]
+    ) -> List[R]:
+        return list(await asyncio.gather(*[fn(item) for item in items]))
+
+    async def upsert(
+        self,
+        vectors: Sequence[Union[Dict, tuple, Vector, Data]],
+        namespace: str = DEFAULT_NAMESPACE,
+    ) -> str:
+        """
+        Upserts(update or insert) vectors into their shards.
+
+        Takes the same parameters as `AsyncIndex.upsert`.
+        """
+        converted = sequence_to_vectors(vectors)
+        groups = _group_by_shard(self._ring, converted, lambda v: str(v.id))
+
+        async def upsert(shard: int) -> str:
+            return await self._shards[shard].upsert(
+                [v for _, v in groups[shard]], namespace=namespace
+            )
+
+        await self._fan_out(upsert, list(groups))
+        return "Success"
+
+    async def fetch(
+        self,
+        ids: Optional[Union[str, List[str]]] = None,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        namespace: str = DEFAULT_NAMESPACE,
+        include_data: bool = False,
+        prefix: Optional[str] = None,
+    ) -> List[Optional[FetchResult]]:
+        """
+        Fetches details of a set of vectors from their shards.
+
+        The results of the ids are returned in the order of the ids.
+        When a prefix is given, all the shards are fetched from.
+
+        Takes the same parameters as `AsyncIndex.fetch`.
+        """
+        options: Dict[str, Any] = {
+            "include_vectors": include_vectors,
+            "include_metadata": include_metadata,
+            "include_data": include_data,
+            "namespace": namespace,
+        }
+
+        if prefix is not None:
+            by_shard = await self._fan_out(
+                lambda shard: shard.fetch(ids=ids, prefix=prefix, **options),
+                self._shards,
+            )
+            return [r for results in by_shard for r in results]
+
+        if ids is None:
+            return []
+
+        id_list = _to_ids(ids)
+        groups = _group_by_shard(self._ring, id_list, str)
+
+        async def fetch(shard: int) -> List[Optional[FetchResult]]:
+            return await self._shards[shard].fetch(
+                ids=[id for _, id in groups[shard]], **options
+            )
+
+        results: List[Optional[FetchResult]] = [None] * len(id_list)
+        for shard, fetched in zip(groups, await self._fan_out(fetch, list(groups))):
+            for (i, _), result in zip(groups[shard], fetched):
+                results[i] = result
+
+        return results
+
+    async def update(
+        self,
+        id: str,
+        vector: Optional[Union[List[float], SupportsToList]] = None,
+        data: Optional[str] = None,
+        metadata: Optional[Dict] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+        metadata_update_mode: MetadataUpdateMode = MetadataUpdateMode.OVERWRITE,
+        sparse_vector: Optional[Union[SparseVector, TupleAsSparseVectorT]] = None,
+    ) -> bool:
+        """
+        Updates a vector value, data, or metadata for the given id, in its shard.
+
+        Takes the same parameters as `AsyncIndex.update`.
+        """
+        # routed like the upserts, which use the string form of the ids
+        return await self.shard_for(str(id)).update(
+            id,
+            vector=vector,
+            data=data,
+            metadata=metadata,
+            namespace=namespace,
+            metadata_update_mode=metadata_update_mode,
+            sparse_vector=sparse_vector,
+        )
+
+    async def delete(
+        self,
+        ids: Optional[Union[str, List[str]]] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+        prefix: Optional[str] = None,
+        filter: Optional[str] = None,
+    ) -> DeleteResult:
+        """
+        Deletes the given vector(s) from their shards.
+
+        When a prefix or a filter is given, the vectors are deleted from
+        all the shards. The number of deleted vectors is summed up.
+
+        Takes the same parameters as `AsyncIndex.delete`.
+        """
+        if prefix is not None or filter is not None:
+            deleted = await self._fan_out(
+                lambda shard: shard.delete(
+                    ids=ids, namespace=namespace, prefix=prefix, filter=filter
+                ),
+                self._shards,
+            )
+            return DeleteResult(deleted=sum(r.deleted for r in deleted))
+
+        if ids is None:
+            return DeleteResult(deleted=0)
+
+        groups = _group_by_shard(self._ring, _to_ids(ids), str)
+
+        async def delete(shard: int) -> DeleteResult:
+            return await self._shards[shard].delete(
+                ids=[id for _, id in groups[shard]], namespace=namespace
+            )
+
+        deleted = await self._fan_out(delete, list(groups))
+        return DeleteResult(deleted=sum(r.deleted for r in deleted))
+
+    async def query(
+        self,
+        vector: Optional[Union[List[float], SupportsToList]] = None,
+        top_k: int = 10,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        filter: str = "",
+        data: Optional[str] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+        include_data: bool = False,
+        sparse_vector: Optional[Union[SparseVector, TupleAsSparseVectorT]] = None,
+        weighting_strategy: Optional[WeightingStrategy] = None,
+        fusion_algorithm: Optional[FusionAlgorithm] = None,
+        query_mode: Optional[QueryMode] = None,
+    ) -> List[QueryResult]:
+        """
+        Queries `top_k` many similar vectors from all the shards, and
+        merges their results into the global `top_k` by score.
+
+        Takes the same parameters as `AsyncIndex.query`.
+        """
+        results = await self._fan_out(
+            lambda shard: shard.query(
+                vector=vector,
+                top_k=top_k,
+                include_vectors=include_vectors,
+                include_metadata=include_metadata,
+                filter=filter,
+                data=data,
+                namespace=namespace,
+                include_data=include_data,
+                sparse_vector=sparse_vector,
+                weighting_strategy=weighting_strategy,
+                fusion_algorithm=fusion_algorithm,
+                query_mode=query_mode,
+            ),
+            self._shards,
+        )
+        return _merge_top_k(results, top_k)
+
+    async def range(
+        self,
+        cursor: str = "",
+        limit: int = 1,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        namespace: str = DEFAULT_NAMESPACE,
+        include_data: bool = False,
+        prefix: Optional[str] = None,
+    ) -> RangeResult:
+        """
+        Scans the vectors of all the shards starting from `cursor`, returns
+        at most `limit` many vectors.
+
+        The limit is spread over the shards that are not scanned through
+        yet, and the returned cursor keeps track of the cursors of all the
+        shards. The scan is complete when the returned cursor is empty.
+
+        Takes the same parameters as `AsyncIndex.range`.
+        """
+        if limit <= 0:
+            raise ClientError("limit must be greater than 0")
+
+        cursors = _parse_cursor(cursor, len(self._shards))
+        plan = _range_plan(cursors, limit)
+
+        async def range_shard(step: Tuple[int, int]) -> Tuple[int, RangeResult]:
+            shard, shard_limit = step
+            return shard, await self._shards[shard].range(
+                cursor=cursors[shard] or "",
+                limit=shard_limit,
+                include_vectors=include_vectors,
+                include_metadata=include_metadata,
+                namespace=namespace,
+                include_data=include_data,
+                prefix=prefix,
+            )
+
+        return _merge_ranges(cursors, await self._fan_out(range_shard, plan))
+
+    async def reset(self, namespace: str = DEFAULT_NAMESPACE, all: bool = False) -> str:
+        """
+        Resets a namespace of all the shards.
+
+        Takes the same parameters as `AsyncIndex.reset`.
+        """
+        await self._fan_out(
+            lambda shard: shard.reset(namespace=namespace, all=all), self._shards
+        )
+        return "Success"
+
+    async def info(self) -> InfoResult:
+        """
+        Returns the index info, aggregated over all the shards.
+
+        The counts and sizes are summed up, while the dimension and the
+        similarity function are the ones of the first shard.
+        """
+        return _merge_info(
+            await self._fan_out(lambda shard: shard.info(), self._shards)
+        )
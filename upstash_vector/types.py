@@ -1,12 +1,32 @@
 import enum
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Protocol, Tuple, TypedDict, Union
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 
 class SupportsToList(Protocol):
     def tolist(self) -> List[float]: ...
 
 
+class SupportsToMatrix(Protocol):
+    def __len__(self) -> int: ...
+
+    def __iter__(self) -> Iterator[Any]: ...
+
+    def __getitem__(self, key: slice) -> "SupportsToMatrix": ...
+
+    def tolist(self) -> List[List[float]]: ...
+
+
 @dataclass
 class SparseVector:
     indices: Union[List[int], SupportsToList]
@@ -96,6 +116,24 @@ class QueryResult:
         )
 
 
+@dataclass
+class NamespaceQueryResult(QueryResult):
+    namespace: str = ""
+    """Namespace the vector is found in."""
+
+
+@dataclass
+class QueryNamespacesResult:
+    results: List[NamespaceQueryResult]
+    """
+    Most similar vectors across the namespaces queried successfully,
+    sorted in the descending order of their scores.
+    """
+
+    errors: Dict[str, Exception]
+    """Errors of the namespaces that failed or timed out, keyed by the namespace."""
+
+
 @dataclass
 class DeleteResult:
     deleted: int
@@ -105,6 +143,96 @@ class DeleteResult:
         return cls(deleted=obj["deleted"])
 
 
+@dataclass
+class BatchError:
+    batch: int
+    """Index of the failed batch, in the order the batches are created."""
+
+    ids: List[Union[int, str]]
+    """Ids of the vectors in the failed batch."""
+
+    error: Exception
+    """The error raised while executing the batch."""
+
+
+@dataclass
+class BatchProgress:
+    completed_batches: int
+    """Number of batches completed successfully so far."""
+
+    failed_batches: int
+    """Number of batches failed so far."""
+
+    completed_items: int
+    """Number of items in the successful batches so far."""
+
+    failed_items: int
+    """Number of items in the failed batches so far."""
+
+
+@dataclass
+class UpsertManyResult:
+    upserted: int
+    """Number of vectors upserted successfully."""
+
+    results: List[str]
+    """Results of the successful batches, in the order the batches are created."""
+
+    errors: List[BatchError]
+    """Failed batches, in the order the batches are created."""
+
+
+@dataclass
+class UpdateManyResult:
+    updated: int
+    """Number of vectors updated."""
+
+    not_found: int
+    """Number of updates whose ids do not exist."""
+
+    errors: List[BatchError]
+    """Failed updates, in the order of the updates. The `batch` field is the position of the update."""
+
+
+@dataclass
+class DeleteManyResult:
+    deleted: int
+    """Number of vectors deleted."""
+
+    errors: List[BatchError]
+    """Failed batches, in the order the batches are created."""
+
+
+@dataclass
+class DeleteNamespacesResult:
+    deleted: int
+    """Number of vectors deleted across all the namespaces."""
+
+    results: Dict[str, int]
+    """Number of vectors deleted, keyed by the namespaces deleted from successfully."""
+
+    errors: Dict[str, Exception]
+    """Errors of the namespaces that failed, keyed by the namespace."""
+
+
+@dataclass
+class ExportResult:
+    directory: str
+    """Directory the files are written to."""
+
+    vector_count: int
+    """Number of vectors exported, which is the number of rows in all the files."""
+
+    dimension: int
+    """Dimension of the dense vectors, or `0` if they are not exported."""
+
+    format: str
+    """Format of the file of the ids, metadata, and data. Either `jsonl` or `parquet`."""
+
+    sparse: bool
+    """Whether the sparse vectors are exported."""
+
+
 @dataclass
 class RangeResult:
     next_cursor: str
@@ -410,3 +538,30 @@ class QueryRequest(TypedDict, total=False):
     
     When not specified, defaults to `HYBRID`.
     """
+
+
+class _UpdateRequestId(TypedDict):
+    id: str
+    """The vector id to update."""
+
+
+class UpdateRequest(_UpdateRequestId, total=False):
+    vector: Union[List[float], SupportsToList]
+    """The vector value to update to."""
+
+    sparse_vector: Union[SparseVector, TupleAsSparseVectorT]
+    """The sparse vector value to update to."""
+
+    data: str
+    """The raw text data to embed into a vector and update to."""
+
+    metadata: Dict
+    """The metadata to update to."""
+
+    metadata_update_mode: MetadataUpdateMode
+    """
+    Whether to overwrite the whole metadata, or patch it according
+    to the `RFC 7396 JSON Merge Patch` algorithm.
+    
+    When not specified, defaults to `MetadataUpdateMode.OVERWRITE`.
+    """
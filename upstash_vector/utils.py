@@ -1,15 +1,36 @@
-from typing import Any, Dict, List, Sequence, Tuple, Union
+import itertools
+import sys
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
+from upstash_vector.codec import JSONCodec, StdlibJSONCodec
 from upstash_vector.errors import ClientError
 from upstash_vector.types import (
     Data,
+    MetadataUpdateMode,
     QueryRequest,
     SparseVector,
     SupportsToList,
+    SupportsToMatrix,
     TupleAsSparseVectorT,
+    UpdateRequest,
     Vector,
 )
 
+T = TypeVar("T")
+
 
 def sequence_to_vectors(
     vectors: Sequence[Union[dict, tuple, Vector, Data]],
@@ -238,17 +259,484 @@ def vectors_to_payload(
                     " Received items from both kinds. Please send them separately."
                 )
 
-            payload.append(
-                {
-                    "id": vector.id,
-                    "data": vector.data,
-                    "metadata": vector.metadata,
-                }
-            )
+            payload.append(_data_to_payload(vector))
 
     return payload, expecting_vectors
 
 
+class PayloadBatcher:
+    """
+    Groups payload items into batches, limited by the number of items
+    and, optionally, by their serialized size in bytes.
+
+    A batch exceeds `max_batch_bytes` only when a single item is larger
+    than that by itself.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        max_batch_bytes: Optional[int] = None,
+        codec: JSONCodec = StdlibJSONCodec(),
+    ):
+        if batch_size <= 0:
+            raise ClientError("batch_size must be greater than 0")
+
+        if max_batch_bytes is not None and max_batch_bytes <= 0:
+            raise ClientError("max_batch_bytes must be greater than 0")
+
+        self._batch_size = batch_size
+        self._max_batch_bytes = max_batch_bytes
+        self._codec = codec
+        self._batch: List[Any] = []
+        self._batch_bytes = 0
+
+    def add(self, item: Any) -> Optional[List[Any]]:
+        """
+        Adds the item to the current batch.
+
+        Returns the previous batch, if it is full and the item
+        is put into a new batch.
+        """
+        item_bytes = 0
+        if self._max_batch_bytes is not None:
+            # +1 for the separator between the items of the array
+            item_bytes = len(self._codec.dumps(item)) + 1
+
+        full = None
+        if self._batch and (
+            len(self._batch) >= self._batch_size
+            or (
+                self._max_batch_bytes is not None
+                and self._batch_bytes + item_bytes > self._max_batch_bytes
+            )
+        ):
+            full = self.flush()
+
+        self._batch.append(item)
+        self._batch_bytes += item_bytes
+        return full
+
+    def flush(self) -> Optional[List[Any]]:
+        """
+        Returns the current batch, if it is not empty, and starts a new one.
+        """
+        if not self._batch:
+            return None
+
+        batch = self._batch
+        self._batch = []
+        self._batch_bytes = 0
+        return batch
+
+
+def payload_chunks(
+    payloads: List[Dict[str, Any]],
+    batch_size: int,
+    max_batch_bytes: Optional[int] = None,
+    codec: JSONCodec = StdlibJSONCodec(),
+) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+    """
+    Splits the payloads into contiguous chunks, limited by the number
+    of items and, optionally, by their serialized size in bytes.
+
+    Yields `(position of the first item, chunk)` tuples.
+    """
+    batcher = PayloadBatcher(batch_size, max_batch_bytes, codec)
+    start = 0
+
+    for payload in payloads:
+        chunk = batcher.add(payload)
+        if chunk is not None:
+            yield start, chunk
+            start += len(chunk)
+
+    chunk = batcher.flush()
+    if chunk is not None:
+        yield start, chunk
+
+
+def id_batches(ids: Iterable[str], batch_size: int) -> Iterator[List[str]]:
+    """
+    Splits the ids into lists of at most `batch_size` ids, lazily.
+    """
+    if batch_size <= 0:
+        raise ClientError("batch_size must be greater than 0")
+
+    iterator = iter(ids)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+
+        yield batch
+
+
+def prefix_partitions(
+    prefix: str,
+    prefixes: Optional[List[str]],
+    alphabet: Optional[str],
+) -> List[str]:
+    """
+    Returns the id prefixes to scan in parallel, which are either the
+    given ones, or the `prefix` extended with each character of the alphabet.
+
+    The prefixes must not overlap, so that no vector is scanned twice.
+    """
+    if (prefixes is None) == (alphabet is None):
+        # there is no alphabet that covers all the possible ids, so the
+        # partitions are not derived from a default one, which would
+        # skip the ids outside it silently
+        raise ClientError("Exactly one of `prefixes` or `alphabet` must be set.")
+
+    if prefixes is not None and prefix:
+        # the explicit prefixes are scanned as they are, so the prefix
+        # would be ignored silently
+        raise ClientError("`prefix` cannot be set together with the `prefixes`.")
+
+    if prefixes is None:
+        if not alphabet:
+            raise ClientError("alphabet must not be empty")
+
+        prefixes = [prefix + c for c in dict.fromkeys(alphabet)]
+    elif not prefixes:
+        raise ClientError("prefixes must not be empty")
+
+    # a prefix overlaps with another one iff it is a prefix of its successor
+    ordered = sorted(set(prefixes))
+    for current, successor in zip(ordered, ordered[1:]):
+        if successor.startswith(current):
+            raise ClientError(
+                f"Overlapping prefixes {current!r} and {successor!r} cannot be scanned in parallel"
+            )
+
+    return ordered
+
+
+def vectors_to_payload_batches(
+    vectors: Iterable[Union[dict, tuple, Vector, Data]],
+    batch_size: int,
+    max_batch_bytes: Optional[int] = None,
+    codec: JSONCodec = StdlibJSONCodec(),
+) -> Iterator[Tuple[List[Dict[str, Any]], bool]]:
+    """
+    Converts the given vectors to payload batches lazily.
+
+    Each batch contains at most `batch_size` many vectors, and when
+    `max_batch_bytes` is set, its serialized size does not exceed it
+    unless a single vector is larger than that by itself, as measured
+    by the given codec.
+
+    As in `vectors_to_payload`, all items should either be Vector or
+    Data. Otherwise, raises an exception.
+
+    Yields the payload and whether it is Vector or Data for each batch.
+    """
+    batcher = PayloadBatcher(batch_size, max_batch_bytes, codec)
+    expecting_vectors = None
+
+    for vector in vectors:
+        item, is_vector = _to_payload_item(vector, expecting_vectors)
+        expecting_vectors = is_vector
+
+        batch = batcher.add(item)
+        if batch is not None:
+            yield batch, is_vector
+
+    batch = batcher.flush()
+    if batch is not None:
+        assert expecting_vectors is not None
+        yield batch, expecting_vectors
+
+
+async def vectors_to_payload_batches_async(
+    vectors: Union[
+        Iterable[Union[dict, tuple, Vector, Data]],
+        AsyncIterable[Union[dict, tuple, Vector, Data]],
+    ],
+    batch_size: int,
+    max_batch_bytes: Optional[int] = None,
+    codec: JSONCodec = StdlibJSONCodec(),
+) -> AsyncIterator[Tuple[List[Dict[str, Any]], bool]]:
+    """
+    Same as the `vectors_to_payload_batches`, but accepts asynchronous
+    iterables as well.
+    """
+    batcher = PayloadBatcher(batch_size, max_batch_bytes, codec)
+    expecting_vectors = None
+
+    async for vector in to_async_iterable(vectors):
+        item, is_vector = _to_payload_item(vector, expecting_vectors)
+        expecting_vectors = is_vector
+
+        batch = batcher.add(item)
+        if batch is not None:
+            yield batch, is_vector
+
+    batch = batcher.flush()
+    if batch is not None:
+        assert expecting_vectors is not None
+        yield batch, expecting_vectors
+
+
+async def to_async_iterable(
+    iterable: Union[Iterable[T], AsyncIterable[T]],
+) -> AsyncIterator[T]:
+    if isinstance(iterable, AsyncIterable):
+        async for item in iterable:
+            yield item
+    else:
+        for item in iterable:
+            yield item
+
+
+def _to_payload_item(
+    vector: Union[dict, tuple, Vector, Data],
+    expecting_vectors: Optional[bool],
+) -> Tuple[Dict[str, Any], bool]:
+    parsed = _parse_vector(vector)
+    if isinstance(parsed, Vector):
+        item, is_vector = _vector_to_payload(parsed), True
+    else:
+        item, is_vector = _data_to_payload(parsed), False
+
+    if expecting_vectors is not None and expecting_vectors != is_vector:
+        raise ClientError(
+            "All items should either have the `data` or the `vector` and/or `sparse_vector` field."
+            " Received items from both kinds. Please send them separately."
+        )
+
+    return item, is_vector
+
+
+def matrix_to_payload_batches(
+    ids: Union[Sequence[Union[int, str]], SupportsToList],
+    vectors: Union[List[List[float]], SupportsToMatrix],
+    metadata: Optional[Sequence[Optional[Dict]]],
+    data: Optional[Sequence[Optional[str]]],
+    batch_size: int,
+    convert_rows: bool = True,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Converts the given ids and the 2-D matrix of vectors, along
+    with the optional metadata and data columns, to payload batches
+    lazily.
+
+    Rows of the matrix are converted to lists for a whole batch at
+    once, instead of one by one. When `convert_rows` is `False`, the
+    rows are left as they are, to be encoded natively by the JSON codec.
+    """
+    if batch_size <= 0:
+        raise ClientError("batch_size must be greater than 0")
+
+    if isinstance(ids, Sequence):
+        ids = list(ids)
+    else:
+        ids = to_list(ids)
+
+    count = len(ids)
+
+    shape = getattr(vectors, "shape", None)
+    if shape is not None and len(shape) != 2:
+        raise ClientError(
+            f"`vectors` must be a 2-D matrix, but it has the shape {shape}."
+        )
+
+    for name, column in (("vectors", vectors), ("metadata", metadata), ("data", data)):
+        if column is not None and len(column) != count:
+            raise ClientError(
+                f"`{name}` must have the same length with `ids`, "
+                f"expected {count} but got {len(column)}."
+            )
+
+    for start in range(0, count, batch_size):
+        end = min(start + batch_size, count)
+        chunk = vectors[start:end]
+        if isinstance(chunk, list) or not convert_rows:
+            rows: Iterable[Any] = chunk
+        else:
+            rows = chunk.tolist()
+
+        batch = [{"id": id, "vector": row} for id, row in zip(ids[start:end], rows)]
+
+        if metadata is not None:
+            for item, m in zip(batch, metadata[start:end]):
+                item["metadata"] = m
+
+        if data is not None:
+            for item, d in zip(batch, data[start:end]):
+                item["data"] = d
+
+        yield batch
+
+
+_MISSING = object()
+
+
+def _is_missing(value: Any) -> bool:
+    if value is None:
+        return True
+
+    if isinstance(value, float):
+        return value != value
+
+    # NaT and NA of pandas. Only scalars are checked, as `isna`
+    # of an array is an array.
+    pandas = sys.modules.get("pandas")
+    return (
+        pandas is not None
+        and pandas.api.types.is_scalar(value)
+        and bool(pandas.isna(value))
+    )
+
+
+def _to_json_value(column: str, value: Any) -> Any:
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise ClientError(
+                f"The objects in the metadata column `{column}` must have string keys."
+            )
+
+        return {key: _to_json_value(column, v) for key, v in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [_to_json_value(column, v) for v in value]
+
+    tolist = getattr(value, "tolist", None)
+    if tolist is not None:
+        # numpy arrays and scalars
+        return _to_json_value(column, tolist())
+
+    raise ClientError(
+        f"The metadata column `{column}` has a value of type "
+        f"{type(value).__name__}, which is not supported in metadata. "
+        "Convert the column to strings, numbers, booleans, lists, or dicts first."
+    )
+
+
+def _to_metadata_value(column: str, value: Any) -> Any:
+    """
+    Converts a cell of a metadata column to a JSON value, or returns
+    `_MISSING` for the missing values.
+    """
+    if getattr(value, "ndim", None) == 0:
+        # numpy scalars
+        value = value.item()
+
+    if _is_missing(value):
+        return _MISSING
+
+    return _to_json_value(column, value)
+
+
+def frame_to_payload_batches(
+    frame: Any,
+    id_column: str,
+    vector_column: Optional[str],
+    sparse_vector_column: Optional[str],
+    metadata_column: Optional[str],
+    metadata_columns: Optional[Sequence[str]],
+    data_column: Optional[str],
+    batch_size: int,
+) -> Iterator[Tuple[List[Dict[str, Any]], bool]]:
+    """
+    Converts the rows of a pandas DataFrame or a pyarrow Table
+    to payload batches lazily.
+
+    Each batch is read from the frame column by column, and the payload
+    is built from the columns directly, without converting the rows of
+    the frame to Python objects first.
+
+    Yields the payload and whether it is Vector or Data for each batch.
+    """
+    if batch_size <= 0:
+        raise ClientError("batch_size must be greater than 0")
+
+    if metadata_column is not None and metadata_columns is not None:
+        raise ClientError(
+            "Only one of the `metadata_column` or `metadata_columns` can be set."
+        )
+
+    is_vector = vector_column is not None or sparse_vector_column is not None
+    if not is_vector and data_column is None:
+        raise ClientError(
+            "At least one of the `vector_column`, `sparse_vector_column`, "
+            "or `data_column` must be set."
+        )
+
+    if hasattr(frame, "iloc"):
+        count = len(frame)
+
+        def read_column(name: str, start: int, end: int) -> list:
+            return frame[name].iloc[start:end].tolist()
+    elif hasattr(frame, "num_rows") and hasattr(frame, "column"):
+        count = frame.num_rows
+
+        def read_column(name: str, start: int, end: int) -> list:
+            return frame.column(name).slice(start, end - start).to_pylist()
+    else:
+        raise ClientError(
+            f"Expected a pandas DataFrame or a pyarrow Table but got {type(frame)}"
+        )
+
+    for start in range(0, count, batch_size):
+        end = min(start + batch_size, count)
+
+        batch: List[Dict[str, Any]] = [
+            {"id": id} for id in read_column(id_column, start, end)
+        ]
+
+        if vector_column is not None:
+            for item, vector in zip(batch, read_column(vector_column, start, end)):
+                item["vector"] = to_list(vector)
+
+        if sparse_vector_column is not None:
+            for item, sparse_vector in zip(
+                batch, read_column(sparse_vector_column, start, end)
+            ):
+                if isinstance(sparse_vector, dict):
+                    # struct columns of pyarrow are read as dicts
+                    sparse_vector = (sparse_vector["indices"], sparse_vector["values"])
+
+                sparse = to_sparse_vector(sparse_vector)
+                item["sparseVector"] = {
+                    "indices": sparse.indices,
+                    "values": sparse.values,
+                }
+
+        if metadata_column is not None:
+            for item, metadata in zip(batch, read_column(metadata_column, start, end)):
+                item["metadata"] = metadata
+
+        if metadata_columns is not None:
+            for item in batch:
+                item["metadata"] = {}
+
+            for name in metadata_columns:
+                for item, value in zip(batch, read_column(name, start, end)):
+                    value = _to_metadata_value(name, value)
+                    # missing values, which are None, NaN, NaT, or NA, are left out
+                    if value is not _MISSING:
+                        item["metadata"][name] = value
+
+        if data_column is not None:
+            for item, data in zip(batch, read_column(data_column, start, end)):
+                item["data"] = data
+
+        yield batch, is_vector
+
+
+def _data_to_payload(data: Data) -> Dict[str, Any]:
+    return {
+        "id": data.id,
+        "data": data.data,
+        "metadata": data.metadata,
+    }
+
+
 def _vector_to_payload(vector: Vector) -> Dict[str, Any]:
     if vector.sparse_vector is not None:
         sparse = {
@@ -333,3 +821,84 @@ def query_requests_to_payload(
         payloads.append(payload)
 
     return not has_data_query, payloads
+
+
+def update_request_to_payload(update: UpdateRequest) -> Dict[str, Any]:
+    if not isinstance(update, dict) or "id" not in update:
+        raise ClientError("Each update must be a dict with an `id`.")
+
+    return update_to_payload(**update)
+
+
+def update_request_ids(update: UpdateRequest) -> List[Union[int, str]]:
+    """
+    Returns the id of the update, to report its failure with, or no ids
+    when it does not have one.
+    """
+    if isinstance(update, dict) and "id" in update:
+        return [update["id"]]
+
+    return []
+
+
+def update_to_payload(
+    id: str,
+    vector: Optional[Union[List[float], SupportsToList]] = None,
+    data: Optional[str] = None,
+    metadata: Optional[Dict] = None,
+    metadata_update_mode: MetadataUpdateMode = MetadataUpdateMode.OVERWRITE,
+    sparse_vector: Optional[Union[SparseVector, TupleAsSparseVectorT]] = None,
+) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {
+        "id": id,
+        "metadataUpdateMode": metadata_update_mode.value,
+    }
+
+    if vector is not None:
+        payload["vector"] = to_list(vector)
+
+    if sparse_vector is not None:
+        sparse = to_sparse_vector(sparse_vector)
+        payload["sparseVector"] = {
+            "indices": sparse.indices,
+            "values": sparse.values,
+        }
+
+    if data is not None:
+        payload["data"] = data
+
+    if metadata is not None:
+        payload["metadata"] = metadata
+
+    return payload
+
+
+def compose_merge_patches(
+    first: Dict[str, Any], second: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Composes two `RFC 7396 JSON Merge Patch` documents into one, such that
+    applying it is the same as applying `first` and then `second`.
+
+    Returns `None` when they cannot be composed, which is the case when
+    `first` sets a field to a non-object value, or removes it, and `second`
+    patches the same field with an object. Applied one after the other, the
+    object replaces the field, while a single patch would merge the object
+    into the field.
+    """
+    composed = dict(first)
+    for key, value in second.items():
+        if isinstance(value, dict) and key in composed:
+            previous = composed[key]
+            if not isinstance(previous, dict):
+                return None
+
+            merged = compose_merge_patches(previous, value)
+            if merged is None:
+                return None
+
+            composed[key] = merged
+        else:
+            composed[key] = value
+
+    return composed